@@ -3,34 +3,109 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "fastmcp>=2.12.4",
+#     "orjson>=3.9.0",
 # ]
 # ///
 """Full-featured HTTP MCP test server WITH proper FastMCP bearer auth.
 
-Uses FastMCP's StaticTokenVerifier for simple bearer token testing.
+Uses FastMCP's StaticTokenVerifier (with a per-token result cache) for
+simple bearer token testing.
 Required token: test-token-12345
 """
 
+import asyncio
+import hashlib
+import os
+import sys
+import time
+
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server import Context
 from fastmcp.server.auth import StaticTokenVerifier, AccessToken
-from pydantic import BaseModel
+from mcp.types import SamplingMessage, TextContent
+from pydantic import BaseModel, ConfigDict
+from starlette.middleware import Middleware
 
 
-# Create a static token verifier for testing
-# In production, use JWTVerifier or IntrospectionTokenVerifier
-verifier = StaticTokenVerifier(
-    valid_tokens={
-        "test-token-12345": AccessToken(
-            sub="test-user",
-            iss="test-server",
-            aud="mcp-client",
-            exp=None,  # Never expires for testing
-            scope="read write"
+class CachedStaticTokenVerifier(StaticTokenVerifier):
+    """StaticTokenVerifier that memoizes verification results.
+
+    FastMCP calls verify_token() on every request, so results are cached
+    keyed by the SHA-256 digest of the token (raw tokens are never stored
+    as cache keys). A ttl of None means cached entries only expire with the
+    token itself (its ``expires_at``).
+    """
+
+    def __init__(self, *args, ttl: float | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ttl = ttl
+        self._cache: dict[bytes, tuple[AccessToken, float]] = {}
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        """Verify token, serving repeat lookups from the cache."""
+        key = hashlib.sha256(token.encode()).digest()
+        # Wall-clock time, so entries can be compared with expires_at
+        now = time.time()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            access_token, expires = cached
+            if expires > now:
+                return access_token
+            del self._cache[key]
+
+        access_token = await super().verify_token(token)
+        if access_token is not None:
+            expires = float("inf") if self._ttl is None else now + self._ttl
+            # Never serve a token from the cache past its own expiry
+            if access_token.expires_at is not None:
+                expires = min(expires, access_token.expires_at)
+            self._cache[key] = (access_token, expires)
+        return access_token
+
+
+class FrozenAccessToken(AccessToken):
+    """Immutable AccessToken, safe to hand out by reference on every call."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class SharedStaticTokenVerifier(CachedStaticTokenVerifier):
+    """CachedStaticTokenVerifier that returns one prebuilt AccessToken per token.
+
+    StaticTokenVerifier builds a new AccessToken on every verify_token() call.
+    This verifier keeps its expiry and scope checks, but returns the frozen
+    instance from ``access_tokens`` instead.
+    """
+
+    def __init__(self, access_tokens: dict[str, AccessToken], **kwargs):
+        super().__init__(
+            tokens={token: at.model_dump() for token, at in access_tokens.items()},
+            **kwargs,
         )
-    }
+        self._access_tokens = access_tokens
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        """Verify token and return its shared AccessToken."""
+        if await super().verify_token(token) is None:
+            return None
+        return self._access_tokens[token]
+
+
+# The one valid token's claims, validated once at import and shared by
+# reference with every verified request
+_ACCESS_TOKEN = FrozenAccessToken(
+    token="test-token-12345",
+    client_id="test-user",
+    scopes=["read", "write"],
+    expires_at=None,  # Never expires for testing
 )
 
+# Create a static token verifier for testing
+# In production, use JWTVerifier or IntrospectionTokenVerifier
+verifier = SharedStaticTokenVerifier({_ACCESS_TOKEN.token: _ACCESS_TOKEN})
+
 # Create FastMCP server with proper auth
 mcp = FastMCP(
     "test-server-http-bearer",
@@ -43,6 +118,8 @@ mcp = FastMCP(
 # ============================================================================
 
 class ConfirmResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     confirm: bool
 
 
@@ -50,6 +127,12 @@ class ConfirmResponse(BaseModel):
 # TOOLS
 # ============================================================================
 
+_SENTIMENT_PREFIX = (
+    "Analyze the sentiment of this text and respond with just one word "
+    "(positive, negative, or neutral): "
+)
+
+
 @mcp.tool()
 def echo(message: str) -> str:
     """Echo back the input message.
@@ -86,25 +169,18 @@ async def analyze_sentiment(text: str, ctx: Context) -> str:
     Args:
         text: Text to analyze for sentiment
     """
-    from mcp.types import SamplingMessage, TextContent
-
-    result = await ctx.session.create_message(
-        messages=[
-            SamplingMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"Analyze the sentiment of this text and respond with just one word (positive, negative, or neutral): {text}"
-                )
-            )
-        ],
-        max_tokens=10
+    create_message = ctx.session.create_message
+    message = SamplingMessage(
+        role="user",
+        content=TextContent(type="text", text=_SENTIMENT_PREFIX + text)
     )
+    result = await create_message(messages=[message], max_tokens=10)
 
-    if hasattr(result.content, 'text'):
-        sentiment = result.content.text
-    else:
-        sentiment = str(result.content)
+    content = result.content
+    try:
+        sentiment = content.text
+    except AttributeError:
+        sentiment = str(content)
 
     return f"Sentiment: {sentiment.strip()}"
 
@@ -121,7 +197,8 @@ async def confirm_action(action: str, ctx: Context) -> str:
         response_type=ConfirmResponse
     )
 
-    if result and hasattr(result, 'data') and result.data and result.data.confirm:
+    data = getattr(result, 'data', None)
+    if data is not None and data.confirm:
         return f"Action '{action}' confirmed and executed!"
     else:
         return f"Action '{action}' cancelled."
@@ -131,10 +208,9 @@ async def confirm_action(action: str, ctx: Context) -> str:
 # RESOURCES
 # ============================================================================
 
-@mcp.resource("resource://documentation")
-def get_documentation() -> str:
-    """Complete API documentation for mcp2py."""
-    return """# mcp2py API Documentation
+# Resource payloads are constant for the life of the process, so build them
+# once at import time instead of on every fetch.
+_DOCUMENTATION = """# mcp2py API Documentation
 
 ## Overview
 mcp2py turns MCP servers into Python modules with a simple, synchronous API.
@@ -159,56 +235,54 @@ result = server.echo(message="Hello!")
 ```
 """
 
+_VERSION_JSON = orjson.dumps({
+    "version": "0.5.0",
+    "build": "20251020",
+    "python_version": sys.version,
+    "protocol_version": "2024-11-05",
+    "http_support": True,
+    "auth_support": True,
+    "auth_type": "bearer-static"
+}, option=orjson.OPT_INDENT_2).decode()
+
+# Only the timestamp changes between reads; it is spliced into the placeholder.
+_STATS_TEMPLATE = orjson.dumps({
+    "uptime_seconds": 0,
+    "tools_called": 0,
+    "last_call": None,
+    "timestamp": "__TIMESTAMP__",
+    "transport": "http-sse",
+    "auth_enabled": True
+}, option=orjson.OPT_INDENT_2).decode()
+
+
+@mcp.resource("resource://documentation")
+def get_documentation() -> str:
+    """Complete API documentation for mcp2py."""
+    return _DOCUMENTATION
+
 
 @mcp.resource("resource://version")
 def get_version() -> str:
     """Current version and build information."""
-    import json
-    import sys
-
-    return json.dumps({
-        "version": "0.5.0",
-        "build": "20251020",
-        "python_version": sys.version,
-        "protocol_version": "2024-11-05",
-        "http_support": True,
-        "auth_support": True,
-        "auth_type": "bearer-static"
-    }, indent=2)
+    return _VERSION_JSON
 
 
 @mcp.resource("resource://stats")
 def get_stats() -> str:
     """Real-time server statistics."""
-    import json
-    import time
-
-    return json.dumps({
-        "uptime_seconds": 0,
-        "tools_called": 0,
-        "last_call": None,
-        "timestamp": time.time(),
-        "transport": "http-sse",
-        "auth_enabled": True
-    }, indent=2)
+    return _STATS_TEMPLATE.replace('"__TIMESTAMP__"', repr(time.time()))
 
 
 # ============================================================================
 # PROMPTS
 # ============================================================================
 
-@mcp.prompt()
-def review_code(code: str, focus: str = "general quality") -> str:
-    """Generate a code review prompt for Python code.
-
-    Args:
-        code: Python code to review
-        focus: Specific aspect to focus on
-    """
-    return f"""Please review the following Python code with a focus on {focus}:
-
-```python
-{code}
+# Constant scaffolding for the prompt templates; only the arguments are
+# spliced in per call.
+_REVIEW_PRE = "Please review the following Python code with a focus on "
+_REVIEW_MID = ":\n\n```python\n"
+_REVIEW_POST = """
 ```
 
 Provide feedback on:
@@ -220,26 +294,12 @@ Provide feedback on:
 
 Be specific and constructive in your feedback."""
 
+_README_PRE = """Generate a comprehensive README.md file for a project with these details:
 
-@mcp.prompt()
-def generate_readme(project_name: str, description: str, features: str = "") -> str:
-    """Generate a README.md template for a project.
-
-    Args:
-        project_name: Name of the project
-        description: Short description of the project
-        features: Comma-separated list of key features
-    """
-    features_list = ""
-    if features:
-        features_list = "\n".join(f"- {f.strip()}" for f in features.split(","))
-
-    return f"""Generate a comprehensive README.md file for a project with these details:
-
-**Project Name:** {project_name}
-**Description:** {description}
-**Key Features:**
-{features_list}
+**Project Name:** """
+_README_MID = "\n**Description:** "
+_README_FEATURES = "\n**Key Features:**\n"
+_README_POST = """
 
 The README should include:
 1. Project title and description
@@ -252,11 +312,7 @@ The README should include:
 
 Make it professional, clear, and engaging."""
 
-
-@mcp.prompt()
-def explain_mcp() -> str:
-    """Explain what MCP (Model Context Protocol) is."""
-    return """Explain what the Model Context Protocol (MCP) is and why it's useful.
+_EXPLAIN_MCP = """Explain what the Model Context Protocol (MCP) is and why it's useful.
 
 Cover:
 1. What problem does MCP solve?
@@ -268,29 +324,184 @@ Cover:
 Provide a clear, concise explanation suitable for a developer new to MCP."""
 
 
+@mcp.prompt()
+def review_code(code: str, focus: str = "general quality") -> str:
+    """Generate a code review prompt for Python code.
+
+    Args:
+        code: Python code to review
+        focus: Specific aspect to focus on
+    """
+    return "".join((_REVIEW_PRE, focus, _REVIEW_MID, code, _REVIEW_POST))
+
+
+@mcp.prompt()
+def generate_readme(project_name: str, description: str, features: str = "") -> str:
+    """Generate a README.md template for a project.
+
+    Args:
+        project_name: Name of the project
+        description: Short description of the project
+        features: Comma-separated list of key features
+    """
+    features_list = ""
+    if features:
+        features_list = "\n".join(["- " + f.strip() for f in features.split(",")])
+
+    return "".join((
+        _README_PRE, project_name,
+        _README_MID, description,
+        _README_FEATURES, features_list,
+        _README_POST,
+    ))
+
+
+@mcp.prompt()
+def explain_mcp() -> str:
+    """Explain what MCP (Model Context Protocol) is."""
+    return _EXPLAIN_MCP
+
+
+# ============================================================================
+# SSE FRAME BATCHING
+# ============================================================================
+
+# Opt-in: set either variable to coalesce small SSE frames before flushing.
+_SSE_FLUSH_BYTES = os.getenv("MCP2PY_SSE_FLUSH_BYTES")
+_SSE_FLUSH_MS = os.getenv("MCP2PY_SSE_FLUSH_MS")
+
+
+class SSEBatchingMiddleware:
+    """ASGI middleware that coalesces small SSE frames into fewer writes.
+
+    Body chunks of ``text/event-stream`` responses are buffered until
+    ``flush_bytes`` have accumulated or ``flush_ms`` have elapsed since the
+    first buffered chunk, then sent as a single chunk. Other responses pass
+    through untouched.
+    """
+
+    def __init__(self, app, flush_bytes: int = 4096, flush_ms: float = 10.0):
+        self.app = app
+        self.flush_bytes = flush_bytes
+        self.flush_delay = flush_ms / 1000
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        buffer: list[bytes] = []
+        buffered = 0
+        is_sse = False
+        lock = asyncio.Lock()
+        timer: asyncio.Task | None = None
+
+        async def flush() -> None:
+            nonlocal buffered, timer
+            if timer is not None:
+                timer.cancel()
+                timer = None
+            if buffer:
+                body = b"".join(buffer)
+                buffer.clear()
+                buffered = 0
+                await send({"type": "http.response.body", "body": body, "more_body": True})
+
+        async def flush_later() -> None:
+            nonlocal timer
+            await asyncio.sleep(self.flush_delay)
+            async with lock:
+                timer = None
+                await flush()
+
+        async def batching_send(message) -> None:
+            nonlocal buffered, is_sse, timer
+            if message["type"] == "http.response.start":
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                is_sse = content_type.startswith(b"text/event-stream")
+                await send(message)
+                return
+
+            if not is_sse or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            async with lock:
+                if not message.get("more_body", False):
+                    # End of stream: drain whatever is pending, then finish
+                    await flush()
+                    await send(message)
+                    return
+
+                chunk = message.get("body", b"")
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.flush_bytes:
+                    await flush()
+                elif timer is None:
+                    timer = asyncio.create_task(flush_later())
+
+        try:
+            await self.app(scope, receive, batching_send)
+        finally:
+            # Cancel the timer so nothing is sent after the app is done (or
+            # has failed), and hand over anything still buffered now
+            async with lock:
+                await flush()
+
+
+def _sse_middleware() -> list[Middleware] | None:
+    """Build the SSE batching middleware from the environment, if enabled."""
+    if _SSE_FLUSH_BYTES is None and _SSE_FLUSH_MS is None:
+        return None
+    return [
+        Middleware(
+            SSEBatchingMiddleware,
+            flush_bytes=int(_SSE_FLUSH_BYTES or 4096),
+            flush_ms=float(_SSE_FLUSH_MS or 10.0),
+        )
+    ]
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
 
+_BANNER = "\n".join([
+    "=" * 70,
+    "Full HTTP MCP Server WITH PROPER FASTMCP BEARER AUTH",
+    "=" * 70,
+    "",
+    "Server will run on: http://localhost:8000",
+    "MCP endpoint: http://localhost:8000/sse",
+    "",
+    "Required token: test-token-12345",
+    "",
+    "Authentication: FastMCP StaticTokenVerifier",
+    "",
+    "Example usage:",
+    "  from mcp2py import load",
+    '  server = load("http://localhost:8000/sse", auth="test-token-12345")',
+    '  print(server.echo(message="Hello!"))',
+    "  print(server.get_version())  # Resource",
+    "  print(server.explain_mcp())  # Prompt",
+    "",
+    "Or with headers:",
+    '  server = load("http://localhost:8000/sse",',
+    '                headers={"Authorization": "Bearer test-token-12345"})',
+    "=" * 70,
+    "",
+]) + "\n"
+
+
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Full HTTP MCP Server WITH PROPER FASTMCP BEARER AUTH")
-    print("=" * 70)
-    print("\nServer will run on: http://localhost:8000")
-    print("MCP endpoint: http://localhost:8000/sse")
-    print("\nRequired token: test-token-12345")
-    print("\nAuthentication: FastMCP StaticTokenVerifier")
-    print("\nExample usage:")
-    print('  from mcp2py import load')
-    print('  server = load("http://localhost:8000/sse", auth="test-token-12345")')
-    print('  print(server.echo(message="Hello!"))')
-    print('  print(server.get_version())  # Resource')
-    print('  print(server.explain_mcp())  # Prompt')
-    print("\nOr with headers:")
-    print('  server = load("http://localhost:8000/sse",')
-    print('                headers={"Authorization": "Bearer test-token-12345"})')
-    print("=" * 70)
-    print()
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
 
     # Run with FastMCP's built-in method
-    mcp.run(transport="sse", host="0.0.0.0", port=8000)
+    mcp.run(
+        transport="sse",
+        host="0.0.0.0",
+        port=8000,
+        middleware=_sse_middleware(),
+    )
@@ -3,6 +3,7 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "fastmcp>=2.12.4",
+#     "orjson>=3.9.0",
 # ]
 # ///
 """OAuth authenticated MCP test server.
@@ -19,10 +20,17 @@ Then connect with:
     # Browser will open for OAuth login
 """
 
+import asyncio
+import os
+import sys
+
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server import Context
 from fastmcp.server.auth import AuthProvider
-from pydantic import BaseModel
+from mcp.types import SamplingMessage, TextContent
+from pydantic import BaseModel, ConfigDict
+from starlette.middleware import Middleware
 
 # Create FastMCP server with OAuth
 mcp = FastMCP(
@@ -36,6 +44,8 @@ mcp = FastMCP(
 # ============================================================================
 
 class ConfirmResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     confirm: bool
 
 
@@ -43,6 +53,12 @@ class ConfirmResponse(BaseModel):
 # TOOLS
 # ============================================================================
 
+_SENTIMENT_PREFIX = (
+    "Analyze the sentiment of this text and respond with just one word "
+    "(positive, negative, or neutral): "
+)
+
+
 @mcp.tool()
 def echo(message: str) -> str:
     """Echo back the input message.
@@ -81,25 +97,18 @@ async def analyze_sentiment(text: str, ctx: Context) -> str:
     Args:
         text: Text to analyze for sentiment
     """
-    from mcp.types import SamplingMessage, TextContent
-
-    result = await ctx.session.create_message(
-        messages=[
-            SamplingMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"Analyze the sentiment of this text and respond with just one word (positive, negative, or neutral): {text}"
-                )
-            )
-        ],
-        max_tokens=10
+    create_message = ctx.session.create_message
+    message = SamplingMessage(
+        role="user",
+        content=TextContent(type="text", text=_SENTIMENT_PREFIX + text)
     )
+    result = await create_message(messages=[message], max_tokens=10)
 
-    if hasattr(result.content, 'text'):
-        sentiment = result.content.text
-    else:
-        sentiment = str(result.content)
+    content = result.content
+    try:
+        sentiment = content.text
+    except AttributeError:
+        sentiment = str(content)
 
     return f"Sentiment (OAuth): {sentiment.strip()}"
 
@@ -116,7 +125,8 @@ async def confirm_action(action: str, ctx: Context) -> str:
         response_type=ConfirmResponse
     )
 
-    if result and hasattr(result, 'data') and result.data and result.data.confirm:
+    data = getattr(result, 'data', None)
+    if data is not None and data.confirm:
         return f"Action '{action}' confirmed and executed! (OAuth)"
     else:
         return f"Action '{action}' cancelled. (OAuth)"
@@ -126,10 +136,9 @@ async def confirm_action(action: str, ctx: Context) -> str:
 # RESOURCES
 # ============================================================================
 
-@mcp.resource("resource://documentation")
-def get_documentation() -> str:
-    """API documentation for OAuth server."""
-    return """# OAuth Authentication Server
+# Resource payloads are constant for the life of the process, so build them
+# once at import time instead of on every fetch.
+_DOCUMENTATION = """# OAuth Authentication Server
 
 This server requires OAuth authentication via Google.
 
@@ -169,35 +178,35 @@ print(user)
 Tokens are cached in: ~/.fastmcp/oauth-mcp-client-cache/
 """
 
+_AUTH_INFO_JSON = orjson.dumps({
+    "type": "oauth",
+    "provider": "google",
+    "scopes": ["openid", "email", "profile"],
+    "token_storage": "~/.fastmcp/oauth-mcp-client-cache/"
+}, option=orjson.OPT_INDENT_2).decode()
+
+
+@mcp.resource("resource://documentation")
+def get_documentation() -> str:
+    """API documentation for OAuth server."""
+    return _DOCUMENTATION
+
 
 @mcp.resource("resource://auth-info")
 def get_auth_info() -> str:
     """Authentication information."""
-    import json
-    return json.dumps({
-        "type": "oauth",
-        "provider": "google",
-        "scopes": ["openid", "email", "profile"],
-        "token_storage": "~/.fastmcp/oauth-mcp-client-cache/"
-    }, indent=2)
+    return _AUTH_INFO_JSON
 
 
 # ============================================================================
 # PROMPTS
 # ============================================================================
 
-@mcp.prompt()
-def review_code(code: str, focus: str = "general quality") -> str:
-    """Generate a code review prompt for Python code.
-
-    Args:
-        code: Python code to review
-        focus: Specific aspect to focus on
-    """
-    return f"""Please review the following Python code with a focus on {focus}:
-
-```python
-{code}
+# Constant scaffolding for the prompt templates; only the arguments are
+# spliced in per call.
+_REVIEW_PRE = "Please review the following Python code with a focus on "
+_REVIEW_MID = ":\n\n```python\n"
+_REVIEW_POST = """
 ```
 
 Provide feedback on:
@@ -208,6 +217,32 @@ Provide feedback on:
 
 Be specific and constructive in your feedback."""
 
+_README_PRE = """Generate a comprehensive README.md for:
+
+**Project:** """
+_README_MID = "\n**Description:** "
+_README_POST = """
+
+Include:
+1. Project title and description
+2. Installation instructions
+3. Quick start guide
+4. Usage examples
+5. Contributing guidelines
+6. License information
+"""
+
+
+@mcp.prompt()
+def review_code(code: str, focus: str = "general quality") -> str:
+    """Generate a code review prompt for Python code.
+
+    Args:
+        code: Python code to review
+        focus: Specific aspect to focus on
+    """
+    return "".join((_REVIEW_PRE, focus, _REVIEW_MID, code, _REVIEW_POST))
+
 
 @mcp.prompt()
 def generate_readme(project_name: str, description: str) -> str:
@@ -217,43 +252,138 @@ def generate_readme(project_name: str, description: str) -> str:
         project_name: Name of the project
         description: Short description
     """
-    return f"""Generate a comprehensive README.md for:
+    return "".join((_README_PRE, project_name, _README_MID, description, _README_POST))
 
-**Project:** {project_name}
-**Description:** {description}
 
-Include:
-1. Project title and description
-2. Installation instructions
-3. Quick start guide
-4. Usage examples
-5. Contributing guidelines
-6. License information
-"""
+# ============================================================================
+# SSE FRAME BATCHING
+# ============================================================================
+
+# Opt-in: set either variable to coalesce small SSE frames before flushing.
+_SSE_FLUSH_BYTES = os.getenv("MCP2PY_SSE_FLUSH_BYTES")
+_SSE_FLUSH_MS = os.getenv("MCP2PY_SSE_FLUSH_MS")
+
+
+class SSEBatchingMiddleware:
+    """ASGI middleware that coalesces small SSE frames into fewer writes.
+
+    Body chunks of ``text/event-stream`` responses are buffered until
+    ``flush_bytes`` have accumulated or ``flush_ms`` have elapsed since the
+    first buffered chunk, then sent as a single chunk. Other responses pass
+    through untouched.
+    """
+
+    def __init__(self, app, flush_bytes: int = 4096, flush_ms: float = 10.0):
+        self.app = app
+        self.flush_bytes = flush_bytes
+        self.flush_delay = flush_ms / 1000
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        buffer: list[bytes] = []
+        buffered = 0
+        is_sse = False
+        lock = asyncio.Lock()
+        timer: asyncio.Task | None = None
+
+        async def flush() -> None:
+            nonlocal buffered, timer
+            if timer is not None:
+                timer.cancel()
+                timer = None
+            if buffer:
+                body = b"".join(buffer)
+                buffer.clear()
+                buffered = 0
+                await send({"type": "http.response.body", "body": body, "more_body": True})
+
+        async def flush_later() -> None:
+            nonlocal timer
+            await asyncio.sleep(self.flush_delay)
+            async with lock:
+                timer = None
+                await flush()
+
+        async def batching_send(message) -> None:
+            nonlocal buffered, is_sse, timer
+            if message["type"] == "http.response.start":
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                is_sse = content_type.startswith(b"text/event-stream")
+                await send(message)
+                return
+
+            if not is_sse or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            async with lock:
+                if not message.get("more_body", False):
+                    # End of stream: drain whatever is pending, then finish
+                    await flush()
+                    await send(message)
+                    return
+
+                chunk = message.get("body", b"")
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.flush_bytes:
+                    await flush()
+                elif timer is None:
+                    timer = asyncio.create_task(flush_later())
+
+        await self.app(scope, receive, batching_send)
+
+
+def _sse_middleware() -> list[Middleware] | None:
+    """Build the SSE batching middleware from the environment, if enabled."""
+    if _SSE_FLUSH_BYTES is None and _SSE_FLUSH_MS is None:
+        return None
+    return [
+        Middleware(
+            SSEBatchingMiddleware,
+            flush_bytes=int(_SSE_FLUSH_BYTES or 4096),
+            flush_ms=float(_SSE_FLUSH_MS or 10.0),
+        )
+    ]
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+_BANNER = "\n".join([
+    "=" * 70,
+    "OAuth Authentication Server (Google)",
+    "=" * 70,
+    "",
+    "Server will run on: http://localhost:8001",
+    "MCP endpoint: http://localhost:8001/mcp/sse",
+    "",
+    "Authentication: Google OAuth",
+    "Browser will open for login on first connection",
+    "",
+    "Example usage:",
+    '  server = load("http://localhost:8001/mcp/sse", auth="oauth")',
+    "  # Browser opens for Google login",
+    "=" * 70,
+    "",
+    "NOTE: This requires Google OAuth credentials.",
+    "Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET environment variables.",
+    "",
+]) + "\n"
+
+
 if __name__ == "__main__":
-    print("=" * 70)
-    print("OAuth Authentication Server (Google)")
-    print("=" * 70)
-    print("\nServer will run on: http://localhost:8001")
-    print("MCP endpoint: http://localhost:8001/mcp/sse")
-    print("\nAuthentication: Google OAuth")
-    print("Browser will open for login on first connection")
-    print("\nExample usage:")
-    print('  server = load("http://localhost:8001/mcp/sse", auth="oauth")')
-    print('  # Browser opens for Google login')
-    print("=" * 70)
-    print()
-
-    # Note: OAuth configuration may need environment variables
-    print("NOTE: This requires Google OAuth credentials.")
-    print("Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET environment variables.")
-    print()
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
 
     # Run with FastMCP's built-in method
-    mcp.run(transport="sse", host="0.0.0.0", port=8001)
+    mcp.run(
+        transport="sse",
+        host="0.0.0.0",
+        port=8001,
+        middleware=_sse_middleware(),
+    )
@@ -1,4 +1,9 @@
 # notion_research_server.py
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+
 from fastmcp import FastMCP
 from mcp2py import load
 import dspy
@@ -30,23 +35,51 @@ def research_notion(query: str) -> str:
     result = researcher(query=query)
     return result.summary
 
+# Recent search results, keyed by (search_term, limit), so repeated queries
+# within the TTL window don't round-trip to Notion again (least recently used
+# entries evicted past the size limit)
+_MAX_LIMIT = 50
+_SEARCH_TTL = 60.0
+_SEARCH_CACHE_MAXSIZE = 128
+_search_cache: OrderedDict[tuple[str, int], tuple[float, dict]] = OrderedDict()
+
 @mcp.tool()
-def get_notion_pages(search_term: str, limit: int = 5) -> dict:
+async def get_notion_pages(search_term: str, limit: int = 5) -> dict:
     """Get a list of Notion pages matching a search term.
 
     Args:
         search_term: Term to search for
-        limit: Maximum number of results (default: 5)
+        limit: Maximum number of results (default: 5, capped at 50)
 
     Returns:
         Dictionary with search results
     """
-    results = notion.notion_search(
+    limit = min(limit, _MAX_LIMIT)
+    key = (search_term, limit)
+    now = time.monotonic()
+
+    cached = _search_cache.get(key)
+    if cached is not None and now - cached[0] < _SEARCH_TTL:
+        _search_cache.move_to_end(key)
+        # Callers get their own copy, so editing it can't change the cache
+        return copy.deepcopy(cached[1])
+
+    # notion_search blocks on the Notion round-trip; run it off the event loop
+    results = await asyncio.to_thread(
+        notion.notion_search,
         query=search_term,
         search_type="internal",
         limit=limit
     )
-    return {"results": results, "count": limit}
+    response = {"results": results, "count": len(results)}
+
+    # Drop expired entries, then the oldest ones past the size limit
+    for stale in [k for k, (stamp, _) in _search_cache.items() if now - stamp >= _SEARCH_TTL]:
+        del _search_cache[stale]
+    _search_cache[key] = (now, response)
+    while len(_search_cache) > _SEARCH_CACHE_MAXSIZE:
+        _search_cache.popitem(last=False)
+    return copy.deepcopy(response)
 
 # Run the server
 if __name__ == "__main__":
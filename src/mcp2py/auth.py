@@ -6,13 +6,19 @@ including bearer tokens, OAuth 2.1, and custom authentication handlers.
 This wraps FastMCP's authentication to provide a simpler API.
 """
 
+import hashlib
 import os
-from typing import Any, Callable, Literal
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Literal, TypeVar
 
 import httpx
 from fastmcp.client.auth.bearer import BearerAuth as FastMCPBearerAuth
 from fastmcp.client.auth.oauth import OAuth as FastMCPOAuth
 
+from mcp2py.event_loop import AsyncRunner
+
 
 # Re-export FastMCP's BearerAuth
 BearerAuth = FastMCPBearerAuth
@@ -22,6 +28,108 @@ BearerAuth = FastMCPBearerAuth
 # in ~/.fastmcp/oauth-mcp-client-cache/
 
 
+_T = TypeVar("_T")
+
+# Handlers created by create_auth_handler(), reused across load() calls in the
+# same process. Keys are (url, sha256(token) or None, kind) so raw tokens are
+# never kept as cache keys. Entries expire after _AUTH_CACHE_TTL seconds and
+# the least recently used entry is evicted beyond _AUTH_CACHE_MAXSIZE (the
+# same rules apply to _OAUTH_PROVIDERS below).
+_AUTH_CACHE_MAXSIZE = 64
+_AUTH_CACHE_TTL = 3600.0
+_AUTH_CACHE: OrderedDict[tuple[str, str | None, str], tuple[httpx.Auth, float]] = (
+    OrderedDict()
+)
+_AUTH_CACHE_LOCK = threading.Lock()
+
+# FastMCP OAuth providers shared by every OAuth wrapper with the same
+# (url, scopes, client_name). A provider holds the discovered server metadata,
+# client registration and tokens, so sharing it avoids repeating discovery and
+# registration round trips for each new OAuth instance.
+_OAUTH_PROVIDERS: OrderedDict[
+    tuple[str, tuple[str, ...], str], tuple[FastMCPOAuth, float]
+] = OrderedDict()
+_OAUTH_PROVIDERS_LOCK = threading.Lock()
+
+# Background event loop shared by every sync OAuth.auth_flow() call, created
+# on first use so async-only users never start the thread.
+_sync_runner: AsyncRunner | None = None
+_sync_runner_lock = threading.Lock()
+
+
+def _get_sync_runner() -> AsyncRunner:
+    """Return the shared AsyncRunner used to drive async auth flows from sync code."""
+    global _sync_runner
+
+    with _sync_runner_lock:
+        if _sync_runner is None:
+            _sync_runner = AsyncRunner()
+        return _sync_runner
+
+
+def _get_or_create(
+    cache: OrderedDict[Any, tuple[_T, float]],
+    lock: threading.Lock,
+    key: Hashable,
+    factory: Callable[[], _T],
+) -> _T:
+    """Return cache[key], creating it with factory() on a miss.
+
+    Entries expire after _AUTH_CACHE_TTL seconds, and the least recently used
+    entry is evicted beyond _AUTH_CACHE_MAXSIZE.
+
+    Args:
+        cache: LRU cache of (value, expiry) pairs
+        lock: Lock guarding ``cache``
+        key: Cache key
+        factory: Zero-argument callable that builds the value
+
+    Returns:
+        Cached or newly created value
+    """
+    now = time.monotonic()
+
+    with lock:
+        entry = cache.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > now:
+                cache.move_to_end(key)
+                return value
+            del cache[key]
+
+    value = factory()
+
+    with lock:
+        cache[key] = (value, now + _AUTH_CACHE_TTL)
+        cache.move_to_end(key)
+        while len(cache) > _AUTH_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+
+    return value
+
+
+def _get_cached_auth(
+    url: str,
+    token: str | None,
+    kind: str,
+    factory: Callable[[], httpx.Auth],
+) -> httpx.Auth:
+    """Return a cached auth handler, creating it with factory() on a miss.
+
+    Args:
+        url: MCP server URL the handler is used for
+        token: Bearer token (hashed for the key), or None for OAuth
+        kind: Handler kind ("bearer" or "oauth")
+        factory: Zero-argument callable that builds the handler
+
+    Returns:
+        Cached or newly created auth handler
+    """
+    token_hash = hashlib.sha256(token.encode()).hexdigest() if token else None
+    return _get_or_create(_AUTH_CACHE, _AUTH_CACHE_LOCK, (url, token_hash, kind), factory)
+
+
 class OAuth(httpx.Auth):
     """OAuth 2.1 authentication handler with PKCE support.
 
@@ -35,6 +143,11 @@ class OAuth(httpx.Auth):
 
     Note:
         Tokens are cached in ~/.fastmcp/oauth-mcp-client-cache/
+
+        OAuth instances created with the same url, scopes and client_name
+        share one underlying FastMCP provider. Discovery, registration and
+        token requests are sent through the transport's own httpx client, so
+        they reuse its pooled connections.
     """
 
     def __init__(
@@ -50,15 +163,42 @@ class OAuth(httpx.Auth):
             scopes: OAuth scopes to request
             client_name: Name for this client during registration
         """
-        self._oauth = FastMCPOAuth(
-            mcp_url=url,
-            scopes=scopes,
-            client_name=client_name,
+        if scopes is None:
+            scope_key: tuple[str, ...] = ()
+        elif isinstance(scopes, str):
+            scope_key = tuple(scopes.split())
+        else:
+            scope_key = tuple(scopes)
+        self._oauth = _get_or_create(
+            _OAUTH_PROVIDERS,
+            _OAUTH_PROVIDERS_LOCK,
+            (url, scope_key, client_name),
+            lambda: FastMCPOAuth(mcp_url=url, scopes=scopes, client_name=client_name),
         )
 
+    # FastMCP's OAuth flow inspects token/metadata response bodies
+    requires_response_body = True
+
     def auth_flow(self, request: httpx.Request):
-        """HTTPX auth flow - delegates to FastMCP OAuth."""
-        return self._oauth.auth_flow(request)
+        """HTTPX sync auth flow - drives FastMCP's async OAuth flow.
+
+        FastMCP only implements the async flow, so each step of it is run on
+        a single shared background event loop and the requests it produces
+        are handed back to the synchronous httpx client.
+        """
+        runner = _get_sync_runner()
+        flow = self._oauth.async_auth_flow(request)
+        try:
+            next_request = runner.run(flow.__anext__())
+            while True:
+                response = yield next_request
+                next_request = runner.run(flow.asend(response))
+        except StopAsyncIteration:
+            return
+        finally:
+            # Also runs when httpx closes this generator early, so the async
+            # flow gets to clean up instead of being left suspended
+            runner.run(flow.aclose())
 
     def async_auth_flow(self, request: httpx.Request):
         """Async HTTPX auth flow - delegates to FastMCP OAuth."""
@@ -66,6 +206,30 @@ class OAuth(httpx.Auth):
         return self._oauth.async_auth_flow(request)
 
 
+# BearerAuth built from MCP_TOKEN, paired with the token it was built from so
+# it is only rebuilt when the environment variable changes.
+_env_bearer: tuple[str, httpx.Auth] | None = None
+
+
+def _get_env_bearer_auth() -> httpx.Auth | None:
+    """Return a BearerAuth for the MCP_TOKEN environment variable, if set.
+
+    Returns:
+        Shared BearerAuth for the current MCP_TOKEN value, or None if unset
+    """
+    global _env_bearer
+
+    env_token = os.environ.get("MCP_TOKEN")
+    if not env_token:
+        return None
+
+    cached = _env_bearer
+    if cached is None or cached[0] != env_token:
+        cached = (env_token, BearerAuth(env_token))
+        _env_bearer = cached
+    return cached[1]
+
+
 def create_auth_handler(
     auth: httpx.Auth | Literal["oauth"] | str | Callable[[], str] | None,
     headers: dict[str, str] | None,
@@ -83,6 +247,9 @@ def create_auth_handler(
     Returns:
         Tuple of (auth_handler, updated_headers)
 
+    Bearer and OAuth handlers are cached per (url, token) for the life of the
+    process, so repeated calls with the same inputs return the same handler.
+
     Example:
         >>> # Bearer token string
         >>> auth, headers = create_auth_handler("sk-123", None, "https://api.example.com", True)
@@ -96,37 +263,41 @@ def create_auth_handler(
         >>> # Custom headers
         >>> auth, headers = create_auth_handler(None, {"Authorization": "Bearer sk-123"}, "https://api.example.com", True)
     """
-    headers = headers or {}
+    if headers is None:
+        # A fresh dict per call: callers may add to the headers they get back
+        headers = {}
 
-    # Check environment variable first
-    env_token = os.getenv("MCP_TOKEN")
-    if env_token and not auth and "Authorization" not in headers:
-        return BearerAuth(env_token), headers
+    # Fall back to the MCP_TOKEN environment variable (only consulted when
+    # nothing else provides credentials)
+    if not auth and "Authorization" not in headers:
+        env_auth = _get_env_bearer_auth()
+        if env_auth is not None:
+            return env_auth, headers
 
     # Handle different auth types
     if auth is None:
         # No auth specified, use headers as-is
         return None, headers
 
-    elif isinstance(auth, str):
+    if isinstance(auth, str):
         if auth == "oauth":
             # OAuth flow
-            oauth_handler = OAuth(url)
-            return oauth_handler, headers
-        else:
-            # Treat as bearer token
-            return BearerAuth(auth), headers
+            return _get_cached_auth(url, None, "oauth", lambda: OAuth(url)), headers
+        # Treat as bearer token
+        token = auth
+        return _get_cached_auth(url, token, "bearer", lambda: BearerAuth(token)), headers
 
-    elif callable(auth):
+    if callable(auth):
         # Token provider function
-        token = auth()
-        if token:
-            return BearerAuth(token), headers
+        provided = auth()
+        if provided:
+            return _get_cached_auth(
+                url, provided, "bearer", lambda: BearerAuth(provided)
+            ), headers
         return None, headers
 
-    elif isinstance(auth, httpx.Auth):
+    if isinstance(auth, httpx.Auth):
         # Custom httpx Auth instance
         return auth, headers
 
-    else:
-        raise ValueError(f"Invalid auth type: {type(auth)}")
+    raise ValueError(f"Invalid auth type: {type(auth)}")
@@ -6,10 +6,63 @@ the battle-tested official SDK under the hood.
 """
 
 import asyncio
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
-from mcp import ClientSession, StdioServerParameters
+import anyio
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
+from mcp.server.lowlevel import Server
+from mcp.shared.session import RequestResponder
+from mcp.shared.memory import create_client_server_memory_streams
+
+
+class ConcurrentSamplingSession(ClientSession):
+    """ClientSession that answers sampling requests concurrently.
+
+    The SDK's receive loop awaits each server-to-client request inline, so a
+    tool that fans out N ``create_message`` calls waits for N sampling runs
+    back to back, and no other responses are read meanwhile. Sampling
+    requests are instead answered on the session's task group. Elicitation
+    stays inline, since its default handler prompts on the terminal.
+
+    This overrides private BaseSession members (_received_request,
+    _handle_incoming, _send_response and the _task_group attribute), so the
+    mcp dependency is capped below 2 and tests/test_sampling.py checks that
+    the receive loop still uses them. Without a task group, requests are
+    answered inline as in ClientSession.
+    """
+
+    async def _received_request(self, responder: Any) -> None:
+        task_group = getattr(self, "_task_group", None)
+        if task_group is not None and isinstance(
+            responder.request.root, types.CreateMessageRequest
+        ):
+            task_group.start_soon(self._answer_sampling, responder)
+        else:
+            await super()._received_request(responder)
+
+    async def _handle_incoming(self, req: Any) -> None:
+        # The receive loop passes on any request that isn't answered yet when
+        # _received_request returns, which includes every sampling request
+        # still running on the task group; the message handler must not see
+        # those as unhandled
+        if isinstance(req, RequestResponder) and isinstance(
+            req.request.root, types.CreateMessageRequest
+        ):
+            return
+        await super()._handle_incoming(req)
+
+    async def _answer_sampling(self, responder: Any) -> None:
+        try:
+            await super()._received_request(responder)
+        except Exception as e:
+            # Inline, the receive loop would have replied with an error; do
+            # the same rather than letting the task group end the session
+            await self._send_response(
+                responder.request_id,
+                types.ErrorData(code=types.INTERNAL_ERROR, message=str(e)),
+            )
 
 
 class MCPClient:
@@ -36,6 +89,7 @@ class MCPClient:
         roots: list[dict[str, str]] | None = None,
         sampling_callback: Any | None = None,
         elicitation_callback: Any | None = None,
+        server: object | None = None,
     ) -> None:
         """Initialize MCP client wrapper.
 
@@ -44,19 +98,35 @@ class MCPClient:
             roots: Optional list of root directories to expose to server
             sampling_callback: Optional callback for sampling requests
             elicitation_callback: Optional callback for elicitation requests
+            server: Optional in-process server (FastMCP instance or low-level
+                ``mcp.server.Server``) to talk to over memory streams instead
+                of spawning ``command``
+
+        Raises:
+            ValueError: If command is empty and no server is given
+            TypeError: If server is neither a FastMCP nor a low-level server
 
         Example:
             >>> client = MCPClient(["npx", "weather-server"])
+            >>> client = MCPClient([], server=FastMCP("demo"))
         """
-        # Parse command into server parameters
-        if not command:
-            raise ValueError("Command cannot be empty")
-
-        self.server_params = StdioServerParameters(
-            command=command[0],
-            args=command[1:] if len(command) > 1 else [],
-            env=None
-        )
+        # In-process servers need no command; FastMCP wraps its low-level server
+        low_level = getattr(server, "_mcp_server", server)
+        if low_level is not None and not isinstance(low_level, Server):
+            raise TypeError(f"Unsupported in-process server: {server!r}")
+        self._server: Server[Any, Any] | None = low_level
+        self.server_params: StdioServerParameters | None = None
+
+        if self._server is None:
+            # Parse command into server parameters
+            if not command:
+                raise ValueError("Command cannot be empty")
+
+            self.server_params = StdioServerParameters(
+                command=command[0],
+                args=command[1:] if len(command) > 1 else [],
+                env=None
+            )
         self._roots = roots or []
         self._sampling_callback = sampling_callback
         self._elicitation_callback = elicitation_callback
@@ -98,6 +168,12 @@ class MCPClient:
 
         # Check if connection failed
         if self._connection_error:
+            if self.server_params is None:
+                raise RuntimeError(
+                    f"Failed to connect to in-process MCP server "
+                    f"'{self._server.name}': {self._connection_error}"
+                ) from self._connection_error
+
             cmd = f"{self.server_params.command} {' '.join(self.server_params.args)}"
             raise RuntimeError(
                 f"Failed to connect to MCP server '{cmd}': {self._connection_error}\n\n"
@@ -113,13 +189,43 @@ class MCPClient:
         if self._session is None:
             raise RuntimeError("Failed to establish session - unknown error")
 
+    @asynccontextmanager
+    async def _transport(self) -> AsyncIterator[tuple[Any, Any]]:
+        """Open the read/write streams to the server.
+
+        Spawns the server over stdio, or for an in-process server runs it as
+        a task on this loop, connected through memory streams.
+
+        Yields:
+            (read_stream, write_stream) for the client session
+        """
+        if self.server_params is not None:
+            async with stdio_client(self.server_params) as streams:
+                yield streams
+            return
+
+        server = self._server
+        if server is None:
+            raise RuntimeError("Client has neither a command nor a server")
+        async with create_client_server_memory_streams() as (client, server_streams):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(
+                    lambda: server.run(
+                        *server_streams, server.create_initialization_options()
+                    )
+                )
+                try:
+                    yield client
+                finally:
+                    tg.cancel_scope.cancel()
+
     async def _run_contexts(self) -> None:
-        """Run the stdio and session contexts as a long-lived task.
+        """Run the transport and session contexts as a long-lived task.
 
         This keeps the subprocess and connections alive throughout the session.
         """
         try:
-            async with stdio_client(self.server_params) as (read, write):
+            async with self._transport() as (read, write):
                 # Create roots callback if roots are provided
                 list_roots_callback = None
                 if self._roots:
@@ -136,7 +242,7 @@ class MCPClient:
 
                     list_roots_callback = roots_callback
 
-                async with ClientSession(
+                async with ConcurrentSamplingSession(
                     read,
                     write,
                     list_roots_callback=list_roots_callback,
@@ -203,9 +309,13 @@ class MCPClient:
             else {},
         }
 
-    async def list_tools(self) -> list[dict[str, Any]]:
+    async def list_tools(self, force: bool = False) -> list[dict[str, Any]]:
         """List available tools from the server.
 
+        Args:
+            force: Accepted for parity with HTTPMCPClient.list_tools; this
+                client doesn't cache listings, so every call re-fetches
+
         Returns:
             List of tool schemas with name, description, and inputSchema
 
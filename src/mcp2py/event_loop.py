@@ -6,8 +6,9 @@ Jupyter environments.
 """
 
 import asyncio
+import atexit
 import threading
-from typing import Any, Coroutine, TypeVar
+from typing import Any, Coroutine, TypeVar, cast
 
 T = TypeVar("T")
 
@@ -33,6 +34,37 @@ def _apply_nest_asyncio_if_needed() -> None:
         pass
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the background thread's event loop, preferring uvloop.
+
+    uvloop (``pip install mcp2py[uvloop]``) speeds up the socket and
+    subprocess I/O every server connection runs on. The loop is created
+    directly rather than through a global policy, so the caller's own
+    event loops are unaffected.
+
+    Returns:
+        New event loop (uvloop's when installed, asyncio's otherwise)
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return cast(asyncio.AbstractEventLoop, uvloop.new_event_loop())
+
+
+async def _shutdown_loop() -> None:
+    """Cancel the running loop's other tasks and finalize its async generators.
+
+    The same cleanup asyncio.run() performs before closing its loop.
+    """
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
+
 class AsyncRunner:
     """Async runner with background event loop thread.
 
@@ -69,7 +101,7 @@ class AsyncRunner:
 
         def run_loop() -> None:
             # Create new event loop for this thread
-            self._loop = asyncio.new_event_loop()
+            self._loop = _new_event_loop()
             asyncio.set_event_loop(self._loop)
             started.set()
             self._loop.run_forever()
@@ -119,6 +151,15 @@ class AsyncRunner:
         self._closed = True
 
         if self._loop:
+            # Let tasks still pending on the loop (such as the HTTP client's
+            # pool closers) clean up before it stops, as asyncio.run() does
+            if threading.current_thread() is not self._thread:
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        _shutdown_loop(), self._loop
+                    ).result(timeout=5.0)
+                except Exception:
+                    pass
             self._loop.call_soon_threadsafe(self._loop.stop)
 
         if self._thread:
@@ -138,3 +179,38 @@ class AsyncRunner:
             self.close()
         except Exception:
             pass
+
+
+_shared_runner: AsyncRunner | None = None
+_shared_runner_lock = threading.Lock()
+
+
+def get_shared_runner() -> AsyncRunner:
+    """Return the process-wide AsyncRunner shared by loaded servers.
+
+    One background loop multiplexes every server's connection, instead of one
+    thread per server. The runner is started on first use (and restarted if it
+    was closed) and stopped at interpreter exit.
+
+    Returns:
+        Shared AsyncRunner
+
+    Example:
+        >>> runner = get_shared_runner()
+        >>> runner is get_shared_runner()
+        True
+    """
+    global _shared_runner
+
+    with _shared_runner_lock:
+        if _shared_runner is None or _shared_runner._closed:
+            _shared_runner = AsyncRunner()
+        return _shared_runner
+
+
+@atexit.register
+def _close_shared_runner() -> None:
+    """Stop the shared runner on interpreter exit."""
+    with _shared_runner_lock:
+        if _shared_runner is not None:
+            _shared_runner.close()
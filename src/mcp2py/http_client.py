@@ -5,12 +5,254 @@ StreamableHTTP is the modern MCP transport (as of 2025-03-26) that replaced HTTP
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import importlib.util
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
-from mcp import ClientSession
+from mcp import ClientSession, types
+from pydantic import BaseModel
 from mcp.client.streamable_http import streamablehttp_client
 
+from mcp2py.client import ConcurrentSamplingSession
+
+# Default connection pool limits for HTTPMCPClient
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# HTTP/2 needs the optional h2 package (``pip install httpx[http2]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Accept values for the StreamableHTTP handshake
+_SSE_ACCEPT = "text/event-stream"
+_DEFAULT_ACCEPT = "text/event-stream, application/json"
+_DEFAULT_HEADERS = {"Accept": _DEFAULT_ACCEPT}
+
+# Server notifications that invalidate a cached list_* result
+_LIST_CHANGED: dict[type, str] = {
+    types.ToolListChangedNotification: "tools",
+    types.ResourceListChangedNotification: "resources",
+    types.PromptListChangedNotification: "prompts",
+}
+
+# Message for connection failures, formatted with the server url and the error
+_CONNECT_ERROR = (
+    "Failed to connect to MCP server at '{url}': {error}\n\n"
+    "This could be caused by:\n"
+    "  - Invalid URL or server not running\n"
+    "  - Authentication failure (check headers/token)\n"
+    "  - Network connectivity issues\n"
+    "  - CORS or firewall restrictions\n\n"
+    "Try testing the URL manually:\n"
+    "  $ curl -v {url}"
+)
+
+# Connection pools per event loop (pooled connections can't cross loops), keyed
+# by HTTP/2 support and pool limits. Each loop's pools are paired with the
+# task that closes them, and drops the entry, when the loop shuts down.
+_PoolKey = tuple[bool, int | None, int | None, float | None]
+_Pools = dict[_PoolKey, httpx.AsyncHTTPTransport]
+_LOOP_POOLS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[_Pools, "asyncio.Task[None]"]
+] = weakref.WeakKeyDictionary()
+_LOOP_POOLS_LOCK = threading.Lock()
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Per-client view of the shared connection pool.
+
+    The SDK closes its httpx client when a session ends; closing this view
+    leaves the underlying pool (and its warm connections) open for other clients.
+    """
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def _close_pools_at_shutdown(pools: _Pools) -> None:
+    """Task body that closes ``pools`` once its event loop shuts down.
+
+    Waits until cancelled: asyncio.run(), asyncio.Runner and AsyncRunner.close()
+    cancel the tasks still pending on a loop before closing it. The loop's
+    registry entry is dropped then, so the loop isn't kept alive past that.
+    A loop closed without that shutdown keeps its entry until interpreter exit.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.create_future()
+    finally:
+        # Forget the loop first, so nothing hands out these pools while
+        # they close
+        with _LOOP_POOLS_LOCK:
+            _LOOP_POOLS.pop(loop, None)
+        closing = list(pools.values())
+        pools.clear()
+        if not loop.is_closed():
+            for pool in closing:
+                await pool.aclose()
+
+
+def _get_shared_pool(
+    http2: bool = False, limits: httpx.Limits = _POOL_LIMITS
+) -> httpx.AsyncHTTPTransport:
+    """Return the connection pool for the running event loop.
+
+    Pools are keyed weakly by loop, so clients on the same loop share warm
+    connections while short-lived loops (e.g. per-test loops) get their own
+    pool, which is closed when the loop shuts down.
+
+    Args:
+        http2: Whether the pool should negotiate HTTP/2 (multiplexing concurrent
+            requests over one connection)
+        limits: Connection limits; clients with equal limits share a pool
+    """
+    loop = asyncio.get_running_loop()
+    key = (
+        http2,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+    )
+    with _LOOP_POOLS_LOCK:
+        entry = _LOOP_POOLS.get(loop)
+        if entry is None:
+            pools: _Pools = {}
+            _LOOP_POOLS[loop] = (pools, loop.create_task(_close_pools_at_shutdown(pools)))
+        else:
+            pools = entry[0]
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    return pool
+
+
+def _pooled_client_factory(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+    *,
+    http2: bool = False,
+    limits: httpx.Limits = _POOL_LIMITS,
+) -> httpx.AsyncClient:
+    """Create an httpx client with MCP defaults on top of the shared pool.
+
+    Mirrors ``mcp.shared._httpx_utils.create_mcp_http_client`` so it can be
+    passed as ``httpx_client_factory`` to ``streamablehttp_client`` (bind
+    ``http2`` and ``limits`` with ``functools.partial``).
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        transport=_SharedTransport(_get_shared_pool(http2, limits)),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _merge_accept(header_items: tuple[tuple[str, str], ...]) -> dict[str, str]:
+    """Return headers whose Accept value advertises SSE support.
+
+    Ensure the StreamableHTTP handshake advertises SSE support. Next.js 16+ rejects
+    discovery requests that omit 'text/event-stream' in the Accept header, so always
+    add it when the caller hasn't specified an explicit Accept value.
+
+    Args:
+        header_items: Caller headers as a tuple of (name, value) pairs
+
+    Returns:
+        Headers with a compliant Accept value
+
+    Example:
+        >>> _merge_accept((("Accept", "application/json"),))
+        {'Accept': 'application/json, text/event-stream'}
+    """
+    merged = dict(header_items)
+    accept = merged.get("Accept")
+    if accept:
+        if _SSE_ACCEPT not in accept:
+            merged["Accept"] = f"{accept}, {_SSE_ACCEPT}"
+    else:
+        merged["Accept"] = _DEFAULT_ACCEPT
+    return merged
+
+
+def _unwrap_exception_group(error: Exception) -> Exception:
+    """Return the sole leaf of nested single-exception groups, else ``error``."""
+    while isinstance(error, ExceptionGroup) and len(error.exceptions) == 1:
+        error = error.exceptions[0]
+    return error
+
+
+@functools.lru_cache(maxsize=64)
+def _has_attr(cls: type, name: str) -> bool:
+    """Return whether instances of ``cls`` expose ``name``.
+
+    SDK response types are pydantic models with fixed schemas, so the answer only
+    depends on the class and is probed once per (class, name) pair.
+    """
+    fields = getattr(cls, "model_fields", None)
+    if fields is not None and name in fields:
+        return True
+    return hasattr(cls, name)
+
+
+@functools.lru_cache(maxsize=64)
+def _content_converter(cls: type[BaseModel]) -> Callable[[Any], Any]:
+    """Pick the dict conversion for a message content type once per type.
+
+    SDK content types are pydantic models; anything else falls back to str().
+    """
+    return cls.model_dump if _has_attr(cls, "model_dump") else str
+
+
+def _copy_listing(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy a cached list_* result so callers can't modify the cached one.
+
+    The list and each item dict are copied; nested values such as input
+    schemas are shared.
+    """
+    return [dict(item) for item in items]
+
+
+def _tool_content(item: Any) -> dict[str, Any]:
+    """Convert one tool result content item to the client's dict format."""
+    cls: type[BaseModel] = type(item)
+    return {
+        "type": item.type,
+        "text": item.text if _has_attr(cls, "text") else str(item),
+    }
+
+
+@atexit.register
+def _close_shared_pools() -> None:
+    """Close pools whose loops are still running on interpreter exit."""
+    with _LOOP_POOLS_LOCK:
+        pools = [
+            (loop, pool)
+            for loop, (by_kind, _) in _LOOP_POOLS.items()
+            for pool in by_kind.values()
+        ]
+    for loop, pool in pools:
+        if loop.is_closed() or not loop.is_running():
+            continue
+        try:
+            asyncio.run_coroutine_threadsafe(pool.aclose(), loop).result(timeout=1.0)
+        except Exception:
+            pass
+
 
 class HTTPMCPClient:
     """Wrapper around official MCP SDK's StreamableHTTP client for HTTP transport.
@@ -27,6 +269,29 @@ class HTTPMCPClient:
         >>> await client.close()
     """
 
+    __slots__ = (
+        "url",
+        "headers",
+        "auth",
+        "timeout",
+        "sse_read_timeout",
+        "http2",
+        "limits",
+        "_sampling_callback",
+        "_elicitation_callback",
+        "_session",
+        "_live_session",
+        "_context_task",
+        "_ready_future",
+        "_shutdown_event",
+        "_context_error",
+        "_list_cache",
+        "_exit_stack",
+    )
+
+    # Bound by initialize() and deleted on teardown (see _session_or_raise)
+    _live_session: ClientSession
+
     def __init__(
         self,
         url: str,
@@ -36,6 +301,8 @@ class HTTPMCPClient:
         sse_read_timeout: float = 300.0,
         sampling_callback: Any | None = None,
         elicitation_callback: Any | None = None,
+        http2: bool = True,
+        limits: httpx.Limits | None = None,
     ) -> None:
         """Initialize HTTP MCP client wrapper.
 
@@ -47,6 +314,12 @@ class HTTPMCPClient:
             sse_read_timeout: SSE read timeout in seconds
             sampling_callback: Optional callback for sampling requests
             elicitation_callback: Optional callback for elicitation requests
+            http2: Negotiate HTTP/2 with servers that support it, so concurrent
+                requests share one connection. Ignored unless the optional ``h2``
+                package is installed.
+            limits: Connection pool limits (default: 100 connections, 20 kept
+                alive for 30s). Clients on the same event loop with equal limits
+                share one pool.
 
         Example:
             >>> client = HTTPMCPClient(
@@ -55,34 +328,39 @@ class HTTPMCPClient:
             ... )
         """
         self.url = url
-        # Ensure the StreamableHTTP handshake advertises SSE support. Next.js 16+ rejects
-        # discovery requests that omit 'text/event-stream' in the Accept header, so always
-        # add it when the caller hasn't specified an explicit Accept value.
-        merged_headers = dict(headers or {})
-        accept_header = merged_headers.get("Accept")
-        required_accept = "text/event-stream"
-        if accept_header:
-            if required_accept not in accept_header:
-                merged_headers["Accept"] = f"{accept_header}, {required_accept}"
+        # Header dicts may be shared (module default, the caller's own dict, or a
+        # cached merge); neither this class nor the SDK mutates them.
+        if headers is None:
+            self.headers = _DEFAULT_HEADERS
+        elif _SSE_ACCEPT in headers.get("Accept", ""):
+            self.headers = headers
         else:
-            merged_headers["Accept"] = "text/event-stream, application/json"
-
-        self.headers = merged_headers
+            self.headers = _merge_accept(tuple(headers.items()))
         self.auth = auth
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
         self._sampling_callback = sampling_callback
         self._elicitation_callback = elicitation_callback
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.limits = limits if limits is not None else _POOL_LIMITS
 
-        # Session will be set during connect()
+        # Session will be set during connect(); ``_live_session`` is only bound
+        # once initialize() succeeds, so the request-path guard is one slot load
         self._session: ClientSession | None = None
-        self._initialized = False
 
-        # Context manager task and events
+        # Context manager task, ready future and shutdown event
         self._context_task: asyncio.Task[None] | None = None
-        self._ready_event: asyncio.Event | None = None
+        self._ready_future: asyncio.Future[ClientSession] | None = None
         self._shutdown_event: asyncio.Event | None = None
-        self._connection_error: Exception | None = None
+
+        # Error that ended the context task after connect() returned
+        self._context_error: Exception | None = None
+
+        # list_* results, invalidated by the server's list_changed notifications
+        self._list_cache: dict[str, list[dict[str, Any]]] = {}
+
+        # Exit stack for ``async with`` usage (no background task involved)
+        self._exit_stack: contextlib.AsyncExitStack | None = None
 
     async def connect(self) -> None:
         """Connect to MCP server via StreamableHTTP transport.
@@ -98,32 +376,88 @@ class HTTPMCPClient:
         # Get the current event loop (will be the AsyncRunner's background loop)
         loop = asyncio.get_running_loop()
 
-        # Create events for coordination
-        self._ready_event = asyncio.Event()
-        self._shutdown_event = asyncio.Event()
-        self._connection_error = None
-
-        # Start context manager task in the current (background) loop
+        # Start context manager task in the current (background) loop. The task
+        # resolves the future with the session, or with the connection error.
+        # The shutdown event is created lazily once there is something to shut down.
+        self._ready_future = loop.create_future()
+        self._context_error = None
         self._context_task = loop.create_task(self._run_contexts())
 
-        # Wait for connection to be ready (or error)
-        await self._ready_event.wait()
-
-        # Check if connection failed
-        if self._connection_error:
-            raise RuntimeError(
-                f"Failed to connect to MCP server at '{self.url}': {self._connection_error}\n\n"
-                f"This could be caused by:\n"
-                f"  - Invalid URL or server not running\n"
-                f"  - Authentication failure (check headers/token)\n"
-                f"  - Network connectivity issues\n"
-                f"  - CORS or firewall restrictions\n\n"
-                f"Try testing the URL manually:\n"
-                f"  $ curl -v {self.url}"
-            ) from self._connection_error
-
-        if self._session is None:
-            raise RuntimeError("Failed to establish session - unknown error")
+        try:
+            await self._ready_future
+        except Exception as e:
+            raise self._connection_failed(e) from e
+
+    async def __aenter__(self) -> "HTTPMCPClient":
+        """Connect for the duration of an ``async with`` block.
+
+        The SDK contexts are entered directly in the calling task, so no background
+        task or shutdown signalling is involved. Use connect()/close() instead when
+        the client has to outlive a single task (as ``load()`` does).
+
+        Raises:
+            RuntimeError: If connection fails
+
+        Example:
+            >>> async with HTTPMCPClient("https://api.example.com/mcp") as client:
+            ...     await client.initialize({"name": "mcp2py", "version": "0.1.0"})
+            ...     tools = await client.list_tools()
+        """
+        stack = contextlib.AsyncExitStack()
+        try:
+            read, write, _ = await stack.enter_async_context(self._open_transport())
+            self._session = await stack.enter_async_context(
+                self._open_session(read, write)
+            )
+        except Exception as e:
+            await stack.aclose()
+            error = _unwrap_exception_group(e)
+            raise self._connection_failed(error) from error
+        self._exit_stack = stack
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the session opened by ``__aenter__``."""
+        stack, self._exit_stack = self._exit_stack, None
+        try:
+            if stack is not None:
+                await stack.__aexit__(*exc_info)
+        finally:
+            self._reset_session()
+
+    def _open_transport(self) -> Any:
+        """Create the StreamableHTTP transport context for this client."""
+        return streamablehttp_client(
+            self.url,
+            headers=self.headers,
+            timeout=self.timeout,
+            sse_read_timeout=self.sse_read_timeout,
+            auth=self.auth,
+            httpx_client_factory=functools.partial(
+                _pooled_client_factory, http2=self.http2, limits=self.limits
+            ),
+        )
+
+    def _open_session(self, read: Any, write: Any) -> ClientSession:
+        """Create the ClientSession wired to this client's callbacks."""
+        return ConcurrentSamplingSession(
+            read,
+            write,
+            sampling_callback=self._sampling_callback,
+            elicitation_callback=self._elicitation_callback,
+            message_handler=self._handle_message,
+        )
+
+    async def _handle_message(self, message: Any) -> None:
+        """Drop cached listings when the server reports they changed."""
+        if isinstance(message, types.ServerNotification):
+            kind = _LIST_CHANGED.get(type(message.root))
+            if kind is not None:
+                self._list_cache.pop(kind, None)
+
+    def _connection_failed(self, error: Exception) -> RuntimeError:
+        """Build the user-facing error for a failed connection."""
+        return RuntimeError(_CONNECT_ERROR.format(url=self.url, error=error))
 
     async def _run_contexts(self) -> None:
         """Run the StreamableHTTP client context as a long-lived task.
@@ -131,37 +465,53 @@ class HTTPMCPClient:
         This keeps the HTTP connection alive throughout the session.
         """
         try:
-            async with streamablehttp_client(
-                self.url,
-                headers=self.headers,
-                timeout=self.timeout,
-                sse_read_timeout=self.sse_read_timeout,
-                auth=self.auth,
-            ) as (read, write, get_session_id):
-                async with ClientSession(
-                    read,
-                    write,
-                    sampling_callback=self._sampling_callback,
-                    elicitation_callback=self._elicitation_callback,
-                ) as session:
+            async with self._open_transport() as (read, write, get_session_id):
+                async with self._open_session(read, write) as session:
                     self._session = session
 
                     # Signal that we're ready (connection successful)
-                    if self._ready_event:
-                        self._ready_event.set()
+                    if self._ready_future and not self._ready_future.done():
+                        self._ready_future.set_result(session)
 
                     # Keep contexts alive until shutdown
-                    if self._shutdown_event:
-                        await self._shutdown_event.wait()
+                    if self._shutdown_event is None:
+                        self._shutdown_event = asyncio.Event()
+                    await self._shutdown_event.wait()
         except Exception as e:
-            # Store error for connect() to retrieve
-            self._connection_error = e
-
-            # Signal ready so connect() can proceed and raise the error
-            if self._ready_event:
-                self._ready_event.set()
+            # Hand the error to connect() so it can raise it. The SDK runs its
+            # streams in an anyio task group, so unwrap single-error groups to
+            # report the underlying failure rather than the group.
+            error = _unwrap_exception_group(e)
+            if self._ready_future and not self._ready_future.done():
+                self._ready_future.set_exception(error)
+            else:
+                self._context_error = error
         finally:
             self._session = None
+            self._drop_live_session()
+            # Don't leave connect() waiting if the task was cancelled early
+            if self._ready_future and not self._ready_future.done():
+                self._ready_future.cancel()
+
+    def _session_or_raise(self) -> ClientSession:
+        """Return the active session, or raise if it isn't initialized yet."""
+        try:
+            return self._live_session
+        except AttributeError:
+            raise RuntimeError("Not initialized - call initialize() first") from None
+
+    def _drop_live_session(self) -> None:
+        """Unbind the initialized session, if any."""
+        try:
+            del self._live_session
+        except AttributeError:
+            pass
+
+    def _reset_session(self) -> None:
+        """Forget the session and everything cached for it."""
+        self._session = None
+        self._drop_live_session()
+        self._list_cache.clear()
 
     async def initialize(self, client_info: dict[str, str]) -> dict[str, Any]:
         """Initialize MCP session with the server.
@@ -181,29 +531,43 @@ class HTTPMCPClient:
             >>> "capabilities" in response
             True
         """
-        if self._session is None:
+        session = self._session
+        if session is None:
             raise RuntimeError("Not connected - call connect() first")
 
-        # Use official SDK's initialize method
-        response = await self._session.initialize()
-
-        self._initialized = True
-
-        # Return server info in compatible format
+        # Use official SDK's initialize method. The transport reports HTTP
+        # errors (such as a 401) by ending the context task rather than by
+        # failing the request, so stop waiting if that task ends first.
+        task = self._context_task
+        if task is None:
+            response = await session.initialize()
+        else:
+            pending = asyncio.ensure_future(session.initialize())
+            await asyncio.wait((pending, task), return_when=asyncio.FIRST_COMPLETED)
+            if not pending.done():
+                pending.cancel()
+                error = self._context_error or ConnectionError("Connection closed")
+                raise self._connection_failed(error) from error
+            response = pending.result()
+
+        self._live_session = session
+
+        # Return server info in compatible format (InitializeResult always
+        # carries both models, so no probing is needed)
         return {
-            "capabilities": response.capabilities.model_dump()
-            if hasattr(response.capabilities, "model_dump")
-            else {},
-            "serverInfo": response.serverInfo.model_dump()
-            if hasattr(response, "serverInfo") and hasattr(response.serverInfo, "model_dump")
-            else {},
+            "capabilities": response.capabilities.model_dump(),
+            "serverInfo": response.serverInfo.model_dump(),
         }
 
-    async def list_tools(self) -> list[dict[str, Any]]:
+    async def list_tools(self, force: bool = False) -> list[dict[str, Any]]:
         """List available tools from the server.
 
+        Args:
+            force: Re-fetch even if a cached listing is available
+
         Returns:
             List of tool schemas with name, description, and inputSchema
+            (plain dicts, copied from the session's cached listing)
 
         Raises:
             RuntimeError: If not initialized or request fails
@@ -215,11 +579,14 @@ class HTTPMCPClient:
             >>> all("name" in tool for tool in tools)
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
+
+        # Listings are cached until the server sends a list_changed notification
+        if not force and (cached := self._list_cache.get("tools")) is not None:
+            return _copy_listing(cached)
 
         # Use official SDK's list_tools method
-        response = await self._session.list_tools()
+        response = await session.list_tools()
 
         # Convert to compatible format
         tools: list[dict[str, Any]] = [
@@ -231,13 +598,18 @@ class HTTPMCPClient:
             for tool in response.tools
         ]
 
-        return tools
+        self._list_cache["tools"] = tools
+        return _copy_listing(tools)
 
-    async def list_resources(self) -> list[dict[str, Any]]:
+    async def list_resources(self, force: bool = False) -> list[dict[str, Any]]:
         """List available resources from the server.
 
+        Args:
+            force: Re-fetch even if a cached listing is available
+
         Returns:
             List of resource schemas with uri, name, description, mimeType
+            (plain dicts, copied from the session's cached listing)
 
         Raises:
             RuntimeError: If not initialized or request fails
@@ -247,24 +619,28 @@ class HTTPMCPClient:
             >>> isinstance(resources, list)
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
+
+        # Listings are cached until the server sends a list_changed notification
+        if not force and (cached := self._list_cache.get("resources")) is not None:
+            return _copy_listing(cached)
 
         # Use official SDK's list_resources method
-        response = await self._session.list_resources()
+        response = await session.list_resources()
 
-        # Convert to compatible format
+        # Convert to compatible format (mimeType is a declared Resource field)
         resources: list[dict[str, Any]] = [
             {
                 "uri": resource.uri,
                 "name": resource.name,
                 "description": resource.description or "",
-                "mimeType": resource.mimeType if hasattr(resource, "mimeType") else None,
+                "mimeType": resource.mimeType,
             }
             for resource in response.resources
         ]
 
-        return resources
+        self._list_cache["resources"] = resources
+        return _copy_listing(resources)
 
     async def read_resource(self, uri: str) -> dict[str, Any]:
         """Read a resource by URI.
@@ -283,30 +659,34 @@ class HTTPMCPClient:
             >>> "contents" in result
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
 
         # Use official SDK's read_resource method
-        response = await self._session.read_resource(uri)
+        response = await session.read_resource(uri)
 
-        # Convert to compatible format
+        # Convert to compatible format; only text/blob differ between the
+        # two content types, which an isinstance check tells apart
         contents = [
             {
                 "uri": item.uri,
-                "mimeType": item.mimeType if hasattr(item, "mimeType") else None,
-                "text": item.text if hasattr(item, "text") else None,
-                "blob": item.blob if hasattr(item, "blob") else None,
+                "mimeType": item.mimeType,
+                "text": item.text if isinstance(item, types.TextResourceContents) else None,
+                "blob": item.blob if isinstance(item, types.BlobResourceContents) else None,
             }
             for item in response.contents
         ]
 
         return {"contents": contents}
 
-    async def list_prompts(self) -> list[dict[str, Any]]:
+    async def list_prompts(self, force: bool = False) -> list[dict[str, Any]]:
         """List available prompts from the server.
 
+        Args:
+            force: Re-fetch even if a cached listing is available
+
         Returns:
             List of prompt schemas with name, description, arguments
+            (plain dicts, copied from the session's cached listing)
 
         Raises:
             RuntimeError: If not initialized or request fails
@@ -316,11 +696,14 @@ class HTTPMCPClient:
             >>> isinstance(prompts, list)
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
+
+        # Listings are cached until the server sends a list_changed notification
+        if not force and (cached := self._list_cache.get("prompts")) is not None:
+            return _copy_listing(cached)
 
         # Use official SDK's list_prompts method
-        response = await self._session.list_prompts()
+        response = await session.list_prompts()
 
         # Convert to compatible format
         prompts: list[dict[str, Any]] = [
@@ -331,15 +714,16 @@ class HTTPMCPClient:
                     {
                         "name": arg.name,
                         "description": arg.description or "",
-                        "required": arg.required if hasattr(arg, "required") else False,
+                        "required": arg.required,
                     }
-                    for arg in (prompt.arguments or [])
+                    for arg in prompt.arguments or ()
                 ],
             }
             for prompt in response.prompts
         ]
 
-        return prompts
+        self._list_cache["prompts"] = prompts
+        return _copy_listing(prompts)
 
     async def get_prompt(
         self, name: str, arguments: dict[str, Any] | None = None
@@ -361,19 +745,16 @@ class HTTPMCPClient:
             >>> "messages" in result
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
 
         # Use official SDK's get_prompt method
-        response = await self._session.get_prompt(name, arguments or {})
+        response = await session.get_prompt(name, arguments or {})
 
         # Convert to compatible format
         messages = [
             {
                 "role": msg.role,
-                "content": msg.content.model_dump()
-                if hasattr(msg.content, "model_dump")
-                else str(msg.content),
+                "content": _content_converter(type(msg.content))(msg.content),
             }
             for msg in response.messages
         ]
@@ -400,22 +781,41 @@ class HTTPMCPClient:
             >>> "content" in result
             True
         """
-        if not self._initialized or self._session is None:
-            raise RuntimeError("Not initialized - call initialize() first")
+        session = self._session_or_raise()
 
         # Use official SDK's call_tool method
-        response = await self._session.call_tool(name, arguments)
+        response = await session.call_tool(name, arguments)
 
         # Convert to compatible format
-        content = [
-            {
-                "type": item.type,
-                "text": item.text if hasattr(item, "text") else str(item),
-            }
-            for item in response.content
-        ]
+        return {"content": [_tool_content(item) for item in response.content]}
+
+    async def call_tool_stream(
+        self, name: str, arguments: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Call a tool and yield its content items one at a time.
 
-        return {"content": content}
+        The SDK delivers a tool result as a single message, so this doesn't cut
+        time-to-first-item; it lets callers process large results item by item
+        without building the full converted ``content`` list.
+
+        Args:
+            name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+
+        Yields:
+            Content items in the same format as ``call_tool()["content"]``
+
+        Raises:
+            RuntimeError: If not initialized or tool call fails
+
+        Example:
+            >>> async for item in client.call_tool_stream("search", {"query": "test"}):
+            ...     print(item["text"])
+        """
+        session = self._session_or_raise()
+        response = await session.call_tool(name, arguments)
+        for item in response.content:
+            yield _tool_content(item)
 
     async def close(self) -> None:
         """Close the connection and cleanup resources.
@@ -423,26 +823,28 @@ class HTTPMCPClient:
         Example:
             >>> await client.close()
         """
-        # Signal shutdown to context task
-        if self._shutdown_event:
+        # Signal shutdown to context task (creating the event if the task has
+        # not reached its wait yet)
+        if self._context_task and not self._context_task.done():
+            if self._shutdown_event is None:
+                self._shutdown_event = asyncio.Event()
             self._shutdown_event.set()
 
-        # Wait for context task to complete
-        if self._context_task:
-            try:
-                await asyncio.wait_for(self._context_task, timeout=5.0)
-            except asyncio.TimeoutError:
+        # Wait for context task to complete; asyncio.wait returns as soon as it
+        # exits and, unlike wait_for, doesn't cancel it on timeout
+        task = self._context_task
+        if task:
+            await asyncio.wait((task,), timeout=5.0)
+
+            if not task.done():
                 # Force cancel if it doesn't shut down gracefully
-                self._context_task.cancel()
+                task.cancel()
                 try:
-                    await self._context_task
+                    await task
                 except asyncio.CancelledError:
                     pass
-            except Exception:
-                pass
 
-        self._session = None
-        self._initialized = False
+        self._reset_session()
         self._context_task = None
-        self._ready_event = None
+        self._ready_future = None
         self._shutdown_event = None
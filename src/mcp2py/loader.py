@@ -4,25 +4,47 @@ This module provides the main entry point for loading MCP servers and
 creating Python interfaces to them.
 """
 
+import asyncio
+import functools
+import os
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 import httpx
+from mcp import types
 
 from mcp2py.auth import BearerAuth, OAuth, create_auth_handler
 from mcp2py.client import MCPClient
 from mcp2py.elicitation import DefaultElicitationHandler, ElicitationHandler
-from mcp2py.event_loop import AsyncRunner
-from mcp2py.http_client import HTTPMCPClient
+from mcp2py.event_loop import AsyncRunner, get_shared_runner
 from mcp2py.registry import get_command
 from mcp2py.roots import normalize_roots
 from mcp2py.sampling import DefaultSamplingHandler, SamplingHandler
 from mcp2py.schema import parse_command
 from mcp2py.server import MCPServer
+from mcp2py.stubs import create_typed_server_class
+
+# HTTPMCPClient pulls in httpx's transport stack and is imported only when a
+# remote server is loaded; MCPClient stays eager since mcp2py re-exports it
+# and MCPServer imports it anyway
+if TYPE_CHECKING:
+    from mcp2py.http_client import HTTPMCPClient
+
+# Command prefixes that identify remote servers, local commands (as opposed to
+# registered server names), and arguments that can't be filesystem roots
+_URL_PREFIXES = ("http://", "https://")
+_COMMAND_PREFIXES = ("python", "npx", "node", "uv", "/")
+_NON_ROOT_PREFIXES = ("-", "npx", "node", "@", "uv")
+
+# Client info sent in the MCP initialization handshake
+_CLIENT_INFO = {"name": "mcp2py", "version": "0.1.0"}
+
+# Environment variable that turns on stub generation for every load()
+_GENERATE_STUBS_ENV = "MCP2PY_GENERATE_STUBS"
 
 
 def load(
-    command: str | list[str],
+    command: str | list[str] | Any,
     *,
     roots: str | list[str] | Path | list[Path] | None = None,
     headers: dict[str, str] | None = None,
@@ -33,15 +55,21 @@ def load(
     on_sampling: SamplingHandler | None = None,
     allow_elicitation: bool = True,
     on_elicitation: ElicitationHandler | None = None,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    http2: bool = True,
+    dedicated_loop: bool = False,
+    generate_stubs: bool | None = None,
     **kwargs: Any,
 ) -> MCPServer:
     """Load MCP server and return Python interface.
 
-    Supports both stdio (local subprocess) and HTTP/SSE (remote server) transports.
-    Automatically detects transport type based on command format.
+    Supports stdio (local subprocess), HTTP/SSE (remote server) and in-process
+    transports. Automatically detects transport type based on command format.
 
     Args:
-        command: Command to launch server, URL, or registered server name
+        command: Command to launch server, URL, registered server name, or a
+            FastMCP / low-level ``mcp.server.Server`` instance to run in-process
         roots: Optional directory roots for the server to focus on
         headers: HTTP headers for remote servers (e.g., Authorization)
         auth: Authentication handler (bearer token, "oauth", callable, or httpx.Auth)
@@ -51,6 +79,15 @@ def load(
         on_sampling: Custom sampling handler (default: auto-detect from env)
         allow_elicitation: Allow server to request user input (default: True)
         on_elicitation: Custom elicitation handler (default: terminal prompts)
+        max_connections: HTTP connection pool size for remote servers (default: 100)
+        max_keepalive_connections: Idle HTTP connections kept open for reuse
+            (default: 20)
+        http2: Use HTTP/2 for remote servers that support it, when the optional
+            h2 package is installed (default: True)
+        dedicated_loop: Run this server on its own background event loop thread
+            instead of the loop shared by all loaded servers (default: False)
+        generate_stubs: Write a .pyi stub to ~/.cache/mcp2py/stubs/ after
+            loading (default: False, or True when MCP2PY_GENERATE_STUBS=1)
         **kwargs: Reserved for future options
 
     Returns:
@@ -100,6 +137,17 @@ def load(
         ...     "test" in result
         True
 
+    Example (in-process - no subprocess, handy for tests):
+        >>> from fastmcp import FastMCP
+        >>> mcp = FastMCP("demo")
+        >>> @mcp.tool()
+        ... def ping() -> str:
+        ...     return "pong"
+        >>> server = load(mcp)
+        >>> server.ping()
+        'pong'
+        >>> server.close()
+
     Example with list command:
         >>> server = load(["python", "tests/test_server.py"])
         >>> result = server.add(a=5, b=3)
@@ -108,9 +156,7 @@ def load(
         >>> server.close()
     """
     # Detect transport type
-    is_http = isinstance(command, str) and command.startswith(("http://", "https://"))
-
-    if is_http:
+    if isinstance(command, str) and command.startswith(_URL_PREFIXES):
         # HTTP/SSE transport for remote servers
         url = command
         auth_handler, headers = create_auth_handler(auth, headers, url, auto_auth)
@@ -124,124 +170,62 @@ def load(
             on_sampling=on_sampling,
             allow_elicitation=allow_elicitation,
             on_elicitation=on_elicitation,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            dedicated_loop=dedicated_loop,
+            generate_stubs=generate_stubs,
         )
 
-    # Stdio transport for local servers
-    # Check if command is a registered server name
-    if isinstance(command, str) and not command.startswith(("python", "npx", "node", "uv", "/")):
-        registered_cmd = get_command(command)
-        if registered_cmd:
-            command = registered_cmd
-
-    # Parse command into list
-    cmd_list = parse_command(command)
-
-    if not cmd_list:
-        raise ValueError("Command cannot be empty")
-
-    # Normalize roots if provided, or auto-detect from filesystem server
-    if roots:
-        roots_list = normalize_roots(roots)
+    # In-process transport for server objects, stdio for local commands
+    in_process = None
+    roots_list: list[dict[str, str]] | None
+    if not isinstance(command, (str, list)):
+        in_process, cmd_list = command, []
+        roots_list = normalize_roots(roots) if roots else []
     else:
-        # Auto-detect roots for filesystem servers
-        # If command contains "server-filesystem" and has path arguments, use them as roots
-        if any("server-filesystem" in part for part in cmd_list):
-            # Extract directory paths from command (skip command/flags)
-            potential_roots = []
-            for arg in cmd_list:
-                # Skip commands, flags, and npm-related args
-                if not arg.startswith(("-", "npx", "node", "@", "uv")) and "/" in arg:
-                    potential_roots.append(arg)
-
-            if potential_roots:
-                roots_list = normalize_roots(potential_roots)
-            else:
-                roots_list = None
+        # Check if command is a registered server name (names are single tokens,
+        # so shell commands with arguments skip the lookup)
+        if (
+            isinstance(command, str)
+            and " " not in command
+            and not command.startswith(_COMMAND_PREFIXES)
+        ):
+            registered_cmd = get_command(command)
+            if registered_cmd:
+                command = registered_cmd
+
+        # Parse command into list
+        cmd_list = parse_command(command)
+
+        if not cmd_list:
+            raise ValueError("Command cannot be empty")
+
+        # Normalize roots if provided, or auto-detect from filesystem server
+        if roots:
+            roots_list = normalize_roots(roots)
         else:
-            roots_list = None
+            # Auto-detect roots for filesystem servers
+            roots_list = _detect_filesystem_roots(cmd_list)
 
-    # Set up sampling handler
+    # Set up sampling and elicitation callbacks; without a custom handler the
+    # default one is only built if the server actually sends a request
     sampling_callback = None
     if allow_sampling:
-        if on_sampling:
-            # Use custom handler
-            sampling_handler = on_sampling
-        else:
-            # Use default handler
-            sampling_handler = DefaultSamplingHandler()
-
-        # Create async wrapper for the sampling handler
-        async def sampling_callback(context, params):
-            from mcp import types
-
-            try:
-                # Convert params to handler format
-                messages = [
-                    {"role": msg.role, "content": msg.content.text if hasattr(msg.content, 'text') else str(msg.content)}
-                    for msg in params.messages
-                ]
-
-                # Call handler (synchronous)
-                response_text = sampling_handler(
-                    messages=messages,
-                    model_preferences=params.modelPreferences.model_dump() if hasattr(params, 'modelPreferences') and params.modelPreferences else None,
-                    system_prompt=params.systemPrompt if hasattr(params, 'systemPrompt') else None,
-                    max_tokens=params.maxTokens if hasattr(params, 'maxTokens') else 1000,
-                )
-
-                # Return MCP response
-                return types.CreateMessageResult(
-                    role="assistant",
-                    content=types.TextContent(type="text", text=response_text),
-                    model=sampling_handler.model if hasattr(sampling_handler, 'model') and sampling_handler.model else "default",
-                    stopReason="endTurn"
-                )
-            except Exception as e:
-                # Return error
-                return types.ErrorData(
-                    code="INTERNAL_ERROR",
-                    message=f"Sampling failed: {e}"
-                )
-
-    # Set up elicitation handler
+        sampling_callback = functools.partial(
+            _sampling_callback,
+            handler=on_sampling or _LazyHandler(DefaultSamplingHandler),
+        )
+
     elicitation_callback = None
     if allow_elicitation:
-        if on_elicitation:
-            elicitation_handler = on_elicitation
-        else:
-            elicitation_handler = DefaultElicitationHandler()
-
-        # Create async wrapper for the elicitation handler
-        async def elicitation_callback(context, params):
-            from mcp import types
-
-            try:
-                # Convert params to handler format
-                message = params.message if hasattr(params, 'message') else ""
-
-                # Get schema - it might be a Pydantic model or already a dict
-                if hasattr(params, 'requestedSchema') and params.requestedSchema:
-                    schema = params.requestedSchema.model_dump() if hasattr(params.requestedSchema, 'model_dump') else params.requestedSchema
-                else:
-                    schema = {}
-
-                # Call handler (synchronous)
-                response_data = elicitation_handler(message, schema)
-
-                # Return MCP response
-                return types.ElicitResult(
-                    action="accept",
-                    content=response_data
-                )
-            except Exception as e:
-                # Return cancel on error
-                return types.ElicitResult(
-                    action="cancel",
-                    content={"error": str(e)}
-                )
-
-    # Create async runner (background event loop in thread)
-    runner = AsyncRunner()
+        elicitation_callback = functools.partial(
+            _elicitation_callback,
+            handler=on_elicitation or _LazyHandler(DefaultElicitationHandler),
+        )
+
+    # Background event loop: shared by all servers unless isolation is requested
+    runner = AsyncRunner() if dedicated_loop else get_shared_runner()
 
     # Create MCP client with roots and callbacks
     client = MCPClient(
@@ -249,44 +233,21 @@ def load(
         roots=roots_list,
         sampling_callback=sampling_callback,
         elicitation_callback=elicitation_callback,
+        server=in_process,
     )
 
     # Connect and initialize synchronously via runner
     try:
-        # Connect to server subprocess
-        runner.run(client.connect())
-
-        # MCP initialization handshake
-        runner.run(
-            client.initialize(
-                client_info={
-                    "name": "mcp2py",
-                    "version": "0.1.0",
-                }
-            )
-        )
-
-        # List available tools (required)
-        tools = runner.run(client.list_tools())
-
-        # Try to list resources (optional capability)
-        try:
-            resources = runner.run(client.list_resources())
-        except Exception:
-            # Server doesn't support resources
-            resources = []
-
-        # Try to list prompts (optional capability)
-        try:
-            prompts = runner.run(client.list_prompts())
-        except Exception:
-            # Server doesn't support prompts
-            prompts = []
+        # Connect, initialize and discover in one trip to the background loop
+        tools, resources, prompts = runner.run(_bootstrap(client))
 
     except Exception as e:
         # Cleanup on failure
         try:
-            runner.close()
+            if dedicated_loop:
+                runner.close()
+            else:
+                runner.run(client.close())
         except Exception:
             pass
 
@@ -294,30 +255,290 @@ def load(
 
     # Create dynamically typed server class for IDE autocomplete
     try:
-        from mcp2py.stubs import create_typed_server_class
-
         # Create typed subclass with method stubs
         TypedServerClass = create_typed_server_class(
             MCPServer, tools, resources, prompts
         )
 
         # Instantiate the typed class instead of base MCPServer
-        server = TypedServerClass(client, runner, tools, resources, prompts, command=command)
+        server = TypedServerClass(
+            client,
+            runner,
+            tools,
+            resources,
+            prompts,
+            command=None if in_process is not None else command,
+            owns_runner=dedicated_loop,
+        )
 
     except Exception:
         # Fallback to regular MCPServer if typing fails
-        server = MCPServer(client, runner, tools, resources, prompts, command=command)
+        server = MCPServer(
+            client,
+            runner,
+            tools,
+            resources,
+            prompts,
+            command=None if in_process is not None else command,
+            owns_runner=dedicated_loop,
+        )
 
-    # Auto-generate stub file to cache (best effort, don't fail if it errors)
-    try:
-        server.generate_stubs()
-    except Exception:
-        # Silently ignore stub generation failures
-        pass
+    # Write stub file to cache if requested (best effort, don't fail if it errors)
+    if _should_generate_stubs(generate_stubs):
+        try:
+            server.generate_stubs()
+        except Exception:
+            # Silently ignore stub generation failures
+            pass
 
     return server
 
 
+class _LazyHandler:
+    """Handler proxy that constructs the real handler on its first call.
+
+    Example:
+        >>> handler = _LazyHandler(DefaultSamplingHandler)
+        >>> handler.model is None  # nothing built yet
+        True
+    """
+
+    __slots__ = ("_factory", "_handler")
+
+    def __init__(self, factory: Callable[[], Callable[..., Any]]) -> None:
+        self._factory = factory
+        self._handler: Callable[..., Any] | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._handler is None:
+            self._handler = self._factory()
+        return self._handler(*args, **kwargs)
+
+    @property
+    def model(self) -> str | None:
+        """Model of the underlying handler, if it has been built."""
+        return getattr(self._handler, "model", None)
+
+
+async def _sampling_callback(
+    context: Any,
+    params: types.CreateMessageRequestParams,
+    *,
+    handler: SamplingHandler,
+) -> types.CreateMessageResult | types.ErrorData:
+    """Answer a server's sampling request with a synchronous handler.
+
+    Bound to a handler with functools.partial in load().
+
+    Args:
+        context: Request context from the MCP session
+        params: Sampling request parameters
+        handler: Sampling handler to call
+
+    Returns:
+        CreateMessageResult with the handler's text, or ErrorData on failure
+    """
+    try:
+        # Convert params to handler format (one getattr per optional
+        # attribute instead of hasattr + attribute access)
+        messages = []
+        for msg in params.messages:
+            content = msg.content
+            text = getattr(content, "text", None)
+            messages.append(
+                {"role": msg.role, "content": text if text is not None else str(content)}
+            )
+
+        preferences = getattr(params, "modelPreferences", None)
+
+        # Call handler (synchronous) in a worker thread, so the shared
+        # loop keeps serving other servers and concurrent requests can
+        # be batched by the handler. Arguments go by keyword, as handlers
+        # have always been called
+        call: Callable[..., str] = handler
+        response_text = await asyncio.to_thread(
+            functools.partial(
+                call,
+                messages=messages,
+                model_preferences=preferences.model_dump() if preferences else None,
+                system_prompt=getattr(params, "systemPrompt", None),
+                max_tokens=getattr(params, "maxTokens", 1000),
+            )
+        )
+
+        # Return MCP response
+        return types.CreateMessageResult(
+            role="assistant",
+            content=types.TextContent(type="text", text=response_text),
+            model=getattr(handler, "model", None) or "default",
+            stopReason="endTurn"
+        )
+    except Exception as e:
+        # Return error
+        return types.ErrorData(
+            code="INTERNAL_ERROR",
+            message=f"Sampling failed: {e}"
+        )
+
+
+async def _elicitation_callback(
+    context: Any,
+    params: types.ElicitRequestParams,
+    *,
+    handler: ElicitationHandler,
+) -> types.ElicitResult:
+    """Answer a server's elicitation request with a synchronous handler.
+
+    Bound to a handler with functools.partial in load().
+
+    Args:
+        context: Request context from the MCP session
+        params: Elicitation request parameters
+        handler: Elicitation handler to call
+
+    Returns:
+        ElicitResult accepting the handler's data, or cancelling on failure
+    """
+    try:
+        # Convert params to handler format
+        message = getattr(params, "message", "")
+
+        # Get schema - it might be a Pydantic model or already a dict
+        schema = getattr(params, "requestedSchema", None)
+        if not schema:
+            schema = {}
+        elif hasattr(schema, "model_dump"):
+            schema = schema.model_dump()
+
+        # Call handler (synchronous) in a worker thread, so waiting on the
+        # user doesn't block the shared loop for every other server
+        response_data = await asyncio.to_thread(handler, message, schema)
+
+        # Return MCP response
+        return types.ElicitResult(
+            action="accept",
+            content=response_data
+        )
+    except Exception as e:
+        # Return cancel on error
+        return types.ElicitResult(
+            action="cancel",
+            content={"error": str(e)}
+        )
+
+
+def _should_generate_stubs(generate_stubs: bool | None) -> bool:
+    """Decide whether load() should write a stub file.
+
+    Args:
+        generate_stubs: Explicit choice from load(), or None to defer to the
+            MCP2PY_GENERATE_STUBS environment variable
+
+    Returns:
+        True if a stub should be generated
+
+    Example:
+        >>> _should_generate_stubs(True)
+        True
+    """
+    if generate_stubs is not None:
+        return generate_stubs
+    return os.environ.get(_GENERATE_STUBS_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _detect_filesystem_roots(cmd_list: list[str]) -> list[dict[str, str]] | None:
+    """Use path arguments of a filesystem server command as its roots.
+
+    Scans the command once: if any part mentions "server-filesystem", every
+    argument containing "/" (skipping commands, flags, and npm-related args)
+    becomes a root.
+
+    Args:
+        cmd_list: Parsed server command
+
+    Returns:
+        Normalized roots, or None if this isn't a filesystem server with paths
+
+    Example:
+        >>> _detect_filesystem_roots(
+        ...     ["npx", "-y", "@modelcontextprotocol/server-filesystem", "/tmp"]
+        ... )
+        [{'uri': 'file:///tmp', 'name': 'tmp'}]
+    """
+    is_filesystem_server = False
+    potential_roots = []
+    for arg in cmd_list:
+        if "server-filesystem" in arg:
+            is_filesystem_server = True
+        if "/" in arg and not arg.startswith(_NON_ROOT_PREFIXES):
+            potential_roots.append(arg)
+
+    if is_filesystem_server and potential_roots:
+        return normalize_roots(potential_roots)
+    return None
+
+
+async def _bootstrap(
+    client: "MCPClient | HTTPMCPClient",
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Connect, run the MCP initialization handshake and discover capabilities.
+
+    Runs as a single coroutine so loading costs one ``runner.run`` hop.
+
+    Args:
+        client: Unconnected MCP client
+
+    Returns:
+        Tuple of (tools, resources, prompts)
+    """
+    await client.connect()
+    await client.initialize(client_info=_CLIENT_INFO)
+    return await _discover(client)
+
+
+async def _discover(
+    client: "MCPClient | HTTPMCPClient",
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """List tools, resources and prompts with one concurrent round of requests.
+
+    Tools are required; resources and prompts are optional capabilities, so a
+    server that rejects either listing gets an empty list instead.
+
+    Args:
+        client: Connected and initialized MCP client
+
+    Returns:
+        Tuple of (tools, resources, prompts)
+
+    Raises:
+        Exception: Whatever listing tools raised
+    """
+    results: tuple[
+        list[dict[str, Any]] | BaseException,
+        list[dict[str, Any]] | BaseException,
+        list[dict[str, Any]] | BaseException,
+    ] = await asyncio.gather(
+        client.list_tools(),
+        client.list_resources(),
+        client.list_prompts(),
+        return_exceptions=True,
+    )
+    tools, resources, prompts = results
+    if isinstance(tools, BaseException):
+        raise tools
+    for result in (resources, prompts):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+
+    # Server doesn't support resources and/or prompts
+    if isinstance(resources, BaseException):
+        resources = []
+    if isinstance(prompts, BaseException):
+        prompts = []
+
+    return tools, resources, prompts
+
+
 def _load_http_server(
     url: str,
     headers: dict[str, str] | None = None,
@@ -327,6 +548,11 @@ def _load_http_server(
     on_sampling: SamplingHandler | None = None,
     allow_elicitation: bool = True,
     on_elicitation: ElicitationHandler | None = None,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    http2: bool = True,
+    dedicated_loop: bool = False,
+    generate_stubs: bool | None = None,
 ) -> MCPServer:
     """Load HTTP/SSE MCP server (internal helper).
 
@@ -339,6 +565,11 @@ def _load_http_server(
         on_sampling: Custom sampling handler
         allow_elicitation: Allow user input
         on_elicitation: Custom elicitation handler
+        max_connections: Connection pool size
+        max_keepalive_connections: Idle connections kept open for reuse
+        http2: Negotiate HTTP/2 when available
+        dedicated_loop: Use a private event loop thread instead of the shared one
+        generate_stubs: Write a stub file after loading (None: check environment)
 
     Returns:
         MCPServer object
@@ -351,8 +582,11 @@ def _load_http_server(
     sampling_callback = None
     elicitation_callback = None
 
-    # Create async runner (background event loop in thread)
-    runner = AsyncRunner()
+    # Imported here so stdio-only users never load the HTTP transport
+    from mcp2py.http_client import HTTPMCPClient
+
+    # Background event loop: shared by all servers unless isolation is requested
+    runner = AsyncRunner() if dedicated_loop else get_shared_runner()
 
     # Create HTTP MCP client
     client = HTTPMCPClient(
@@ -363,42 +597,26 @@ def _load_http_server(
         sse_read_timeout=300.0,  # 5 minutes for SSE
         sampling_callback=sampling_callback,
         elicitation_callback=elicitation_callback,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0,
+        ),
     )
 
     # Connect and initialize synchronously via runner
     try:
-        # Connect to HTTP server
-        runner.run(client.connect())
-
-        # MCP initialization handshake
-        runner.run(
-            client.initialize(
-                client_info={
-                    "name": "mcp2py",
-                    "version": "0.1.0",
-                }
-            )
-        )
-
-        # List available tools (required)
-        tools = runner.run(client.list_tools())
-
-        # Try to list resources (optional capability)
-        try:
-            resources = runner.run(client.list_resources())
-        except Exception:
-            resources = []
-
-        # Try to list prompts (optional capability)
-        try:
-            prompts = runner.run(client.list_prompts())
-        except Exception:
-            prompts = []
+        # Connect, initialize and discover in one trip to the background loop
+        tools, resources, prompts = runner.run(_bootstrap(client))
 
     except Exception as e:
         # Cleanup on failure
         try:
-            runner.close()
+            if dedicated_loop:
+                runner.close()
+            else:
+                runner.run(client.close())
         except Exception:
             pass
 
@@ -406,24 +624,39 @@ def _load_http_server(
 
     # Create dynamically typed server class for IDE autocomplete
     try:
-        from mcp2py.stubs import create_typed_server_class
-
         # Create typed subclass with method stubs
         TypedServerClass = create_typed_server_class(
             MCPServer, tools, resources, prompts
         )
 
         # Instantiate the typed class
-        server = TypedServerClass(client, runner, tools, resources, prompts, command=url)
+        server = TypedServerClass(
+            client,
+            runner,
+            tools,
+            resources,
+            prompts,
+            command=url,
+            owns_runner=dedicated_loop,
+        )
 
     except Exception:
         # Fallback to regular MCPServer if typing fails
-        server = MCPServer(client, runner, tools, resources, prompts, command=url)
+        server = MCPServer(
+            client,
+            runner,
+            tools,
+            resources,
+            prompts,
+            command=url,
+            owns_runner=dedicated_loop,
+        )
 
-    # Auto-generate stub file to cache (best effort)
-    try:
-        server.generate_stubs()
-    except Exception:
-        pass
+    # Write stub file to cache if requested (best effort)
+    if _should_generate_stubs(generate_stubs):
+        try:
+            server.generate_stubs()
+        except Exception:
+            pass
 
     return server
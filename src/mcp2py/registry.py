@@ -10,6 +10,9 @@ from typing import Any
 
 from mcp2py.exceptions import MCPConfigError
 
+# Last registry read by get_command(), keyed by (path, mtime_ns, size)
+_registry_cache: tuple[tuple[Path, int, int], dict[str, str]] | None = None
+
 
 def get_registry_path() -> Path:
     """Get path to registry file.
@@ -62,7 +65,9 @@ def save_registry(registry: dict[str, str]) -> None:
     Example:
         >>> save_registry({"weather": "npx weather-server"})
     """
+    global _registry_cache
     registry_path = get_registry_path()
+    _registry_cache = None
 
     try:
         with open(registry_path, "w") as f:
@@ -160,5 +165,22 @@ def get_command(name: str) -> str | None:
         'npx weather-server'
         >>> get_command("nonexistent")
     """
+    return _cached_registry().get(name)
+
+
+def _cached_registry() -> dict[str, str]:
+    """Return the registry, re-reading the file only when it changed on disk."""
+    global _registry_cache
+    registry_path = get_registry_path()
+    try:
+        stat = registry_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    key = (registry_path, stat.st_mtime_ns, stat.st_size)
+    if _registry_cache is not None and _registry_cache[0] == key:
+        return _registry_cache[1]
+
     registry = load_registry()
-    return registry.get(name)
+    _registry_cache = (key, registry)
+    return registry
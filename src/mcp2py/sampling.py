@@ -4,17 +4,74 @@ When a server needs LLM help (e.g., to generate content), mcp2py can automatical
 handle these requests using LiteLLM.
 """
 
+import functools
 import os
+import threading
+import time
+from concurrent.futures import Future
 from typing import Any, Callable
 
 from mcp2py.exceptions import MCPSamplingError
 
+# Provider API keys in auto-detection priority order, with the model each selects
+_PROVIDER_MODELS = (
+    ("ANTHROPIC_API_KEY", "claude-3-5-sonnet-20241022"),
+    ("OPENAI_API_KEY", "gpt-4o-mini"),
+    ("GOOGLE_API_KEY", "gemini/gemini-pro"),
+    ("GEMINI_API_KEY", "gemini/gemini-pro"),
+)
+
+
+# Environment variable listing preferred providers first, e.g. "openai,anthropic"
+_PROVIDER_ORDER_ENV = "MCP2PY_PROVIDER_ORDER"
+
+
+@functools.lru_cache(maxsize=8)
+def _ordered_providers(order: str | None) -> tuple[tuple[str, str], ...]:
+    """Return _PROVIDER_MODELS with the providers named in order moved first.
+
+    Args:
+        order: Comma-separated provider names ("anthropic", "openai",
+            "google", "gemini"), or None for the default priority
+
+    Returns:
+        (api_key_variable, model) pairs in detection order
+
+    Example:
+        >>> _ordered_providers("openai")[0]
+        ('OPENAI_API_KEY', 'gpt-4o-mini')
+    """
+    if not order:
+        return _PROVIDER_MODELS
+
+    rank = {
+        f"{name.strip().upper()}_API_KEY": i for i, name in enumerate(order.split(","))
+    }
+    return tuple(
+        sorted(_PROVIDER_MODELS, key=lambda entry: rank.get(entry[0], len(rank)))
+    )
+
+
+def _detect_model() -> str | None:
+    """Return the default model for the first provider with an API key set."""
+    environ = os.environ
+    for key, model in _ordered_providers(environ.get(_PROVIDER_ORDER_ENV)):
+        if environ.get(key):
+            return model
+    return None
+
+
+# Queued request for a batching handler: (model, max_tokens, messages, result)
+_PendingSample = tuple[str, int, list[dict[str, Any]], "Future[str]"]
+
 
 class DefaultSamplingHandler:
     """Automatic LLM sampling using LiteLLM.
 
     Detects API keys from environment and calls appropriate LLM provider.
     Supports all providers that LiteLLM supports (OpenAI, Anthropic, Google, etc.).
+    When several keys are set, Anthropic wins, then OpenAI, then Google; set
+    MCP2PY_PROVIDER_ORDER (e.g. "openai,anthropic") to change the priority.
 
     Example:
         >>> import os
@@ -25,16 +82,48 @@ class DefaultSamplingHandler:
         >>> # Use with load()
         >>> from mcp2py import load
         >>> server = load("npx my-server", on_sampling=handler)
+
+    Example with batching (share one handler between servers):
+        >>> handler = DefaultSamplingHandler(batch_window_ms=5.0)
+        >>> a = load("npx agent-a", on_sampling=handler)
+        >>> b = load("npx agent-b", on_sampling=handler)
     """
 
-    def __init__(self, model: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        batch_window_ms: float = 0.0,
+        max_batch: int = 8,
+    ):
         """Initialize sampling handler.
 
         Args:
             model: Model to use (e.g., "claude-3-5-sonnet-20241022", "gpt-4o-mini")
                   If None, auto-detects based on available API keys
+            batch_window_ms: How long to collect concurrent requests before
+                sending them as one litellm.batch_completion() call; 0 sends
+                each request on its own (default: 0.0)
+            max_batch: Send a batch as soon as this many requests are waiting
+                (default: 8)
         """
         self.model = model
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+        self._detected_model = _detect_model()
+        self._pending: list[_PendingSample] = []
+        self._pending_lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Re-scan environment API keys (detection is cached at construction).
+
+        Example:
+            >>> handler = DefaultSamplingHandler()
+            >>> os.environ["OPENAI_API_KEY"] = "sk-test"
+            >>> handler.refresh()
+            >>> handler.can_handle()
+            True
+        """
+        self._detected_model = _detect_model()
 
     def can_handle(self) -> bool:
         """Check if handler can make LLM calls.
@@ -42,16 +131,8 @@ class DefaultSamplingHandler:
         Returns:
             True if API keys are available
         """
-        if self.model:
-            return True
-
-        # Check for common API keys
-        return bool(
-            os.getenv("ANTHROPIC_API_KEY")
-            or os.getenv("OPENAI_API_KEY")
-            or os.getenv("GOOGLE_API_KEY")
-            or os.getenv("GEMINI_API_KEY")
-        )
+        # Explicit model, or an API key detected once (see refresh())
+        return bool(self.model) or self._detected_model is not None
 
     def __call__(
         self,
@@ -99,10 +180,15 @@ class DefaultSamplingHandler:
         # Determine model to use
         model = self._select_model(model_preferences)
 
-        # Build request
-        request_messages = messages.copy()
-        if system_prompt:
-            request_messages.insert(0, {"role": "system", "content": system_prompt})
+        # Build request (system prompt first, built in one pass)
+        request_messages = (
+            [{"role": "system", "content": system_prompt}, *messages]
+            if system_prompt
+            else messages
+        )
+
+        if self.batch_window_ms > 0 and self.max_batch > 1:
+            return self._submit(litellm, model, request_messages, max_tokens)
 
         try:
             response = litellm.completion(
@@ -112,6 +198,40 @@ class DefaultSamplingHandler:
         except Exception as e:
             raise MCPSamplingError(f"LLM call failed: {e}") from e
 
+    def _submit(
+        self,
+        litellm: Any,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+    ) -> str:
+        """Queue a request and block until its batch has been sent.
+
+        The first caller to find the queue empty waits batch_window_ms and
+        then sends whatever has accumulated; a caller that fills the queue to
+        max_batch sends it immediately. Everyone else just waits for their
+        result.
+        """
+        result: Future[str] = Future()
+        with self._pending_lock:
+            self._pending.append((model, max_tokens, messages, result))
+            leader = len(self._pending) == 1
+            batch = self._take_pending() if len(self._pending) >= self.max_batch else []
+
+        if leader and not batch:
+            time.sleep(self.batch_window_ms / 1000)
+            with self._pending_lock:
+                batch = self._take_pending()
+
+        if batch:
+            _send_batch(litellm, batch)
+        return result.result()
+
+    def _take_pending(self) -> list[_PendingSample]:
+        """Remove and return queued requests (caller holds _pending_lock)."""
+        batch, self._pending = self._pending, []
+        return batch
+
     def _select_model(self, preferences: dict[str, Any] | None) -> str:
         """Select which model to use.
 
@@ -121,25 +241,58 @@ class DefaultSamplingHandler:
         Returns:
             Model identifier for LiteLLM
         """
-        # Use explicit model if set
-        if self.model:
-            return self.model
-
-        # Try to use server's preferred model
-        if preferences and "model" in preferences:
-            return preferences["model"]
-
-        # Auto-detect based on available API keys
-        if os.getenv("ANTHROPIC_API_KEY"):
-            return "claude-3-5-sonnet-20241022"
-        elif os.getenv("OPENAI_API_KEY"):
-            return "gpt-4o-mini"
-        elif os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY"):
-            return "gemini/gemini-pro"
-        else:
-            raise MCPSamplingError(
-                "No API keys found. Set ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY"
-            )
+        # Explicit model, then server's preferred model, then auto-detected one
+        model = (
+            self.model
+            or (preferences and preferences.get("model"))
+            or self._detected_model
+        )
+        if model:
+            return model
+        raise MCPSamplingError(
+            "No API keys found. Set ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY"
+        )
+
+
+def _send_batch(litellm: Any, batch: list[_PendingSample]) -> None:
+    """Send queued requests, one LLM call per (model, max_tokens) group.
+
+    Groups of one go through litellm.completion(); larger groups through
+    litellm.batch_completion(). Each request's future receives its text or
+    an MCPSamplingError.
+    """
+    groups: dict[tuple[str, int], list[_PendingSample]] = {}
+    for request in batch:
+        groups.setdefault((request[0], request[1]), []).append(request)
+
+    for (model, max_tokens), requests in groups.items():
+        try:
+            if len(requests) == 1:
+                responses = [
+                    litellm.completion(
+                        model=model, messages=requests[0][2], max_tokens=max_tokens
+                    )
+                ]
+            else:
+                responses = litellm.batch_completion(
+                    model=model,
+                    messages=[request[2] for request in requests],
+                    max_tokens=max_tokens,
+                )
+        except Exception as e:
+            responses = [e] * len(requests)
+
+        for request, response in zip(requests, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                request[3].set_result(response.choices[0].message.content)
+            except Exception as e:
+                request[3].set_exception(MCPSamplingError(f"LLM call failed: {e}"))
+
+        # Never leave a caller blocked if the provider returned too few results
+        for request in requests[len(responses):]:
+            request[3].set_exception(MCPSamplingError("LLM call failed: no response"))
 
 
 # Type for custom sampling handlers
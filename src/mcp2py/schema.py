@@ -6,8 +6,20 @@ This module provides utilities for:
 - JSON Schema to Python type mapping
 """
 
+import functools
 import re
 
+# JSON Schema "type" keywords and the Python types they map to
+_JSON_TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
 
 def parse_command(command: str | list[str]) -> list[str]:
     """Parse command string into list of arguments.
@@ -31,6 +43,7 @@ def parse_command(command: str | list[str]) -> list[str]:
     return command.split()
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_name(name: str) -> str:
     """Normalize tool/resource/prompt names to Python-friendly snake_case.
 
@@ -140,20 +153,10 @@ def json_schema_to_python_type(schema: dict[str, object]) -> type:
         >>> json_schema_to_python_type({"type": "object"})
         <class 'dict'>
     """
-    type_map: dict[str, type] = {
-        "string": str,
-        "integer": int,
-        "number": float,
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-        "null": type(None),
-    }
-
     json_type_value = schema.get("type", "object")
     # Get the type from string key
     if isinstance(json_type_value, str):
-        return type_map.get(json_type_value, object)
+        return _JSON_TYPE_MAP.get(json_type_value, object)
     return object
 
 
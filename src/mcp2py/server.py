@@ -6,6 +6,7 @@ This module provides the MCPServer class which wraps an MCPClient and exposes:
 - Prompts as Python template functions
 """
 
+import asyncio
 import atexit
 from pathlib import Path
 from typing import Any
@@ -40,6 +41,7 @@ class MCPServer:
         resources: list[dict[str, Any]],
         prompts: list[dict[str, Any]],
         command: str | list[str] | None = None,
+        owns_runner: bool = True,
     ) -> None:
         """Initialize MCP server wrapper.
 
@@ -50,6 +52,8 @@ class MCPServer:
             resources: List of resource schemas from server
             prompts: List of prompt schemas from server
             command: Command used to start server (for stub caching)
+            owns_runner: Whether close() should stop the runner (False for the
+                shared runner used by other servers)
         """
         self._client = client
         self._runner = runner
@@ -57,8 +61,12 @@ class MCPServer:
         self._resources = {res["name"]: res for res in resources}
         self._prompts = {prompt["name"]: prompt for prompt in prompts}
         self._command = command
+        self._owns_runner = owns_runner
         self._closed = False
 
+        # Tool functions for .tools, built on first access
+        self._tools_cache: tuple[Any, ...] | None = None
+
         # Create bidirectional mapping: snake_case <-> original
         self._name_map: dict[str, str] = {}
         self._resource_name_map: dict[str, str] = {}
@@ -220,6 +228,10 @@ class MCPServer:
         - Proper function signature with typed parameters
         - Callable interface
 
+        The functions are built on first access and reused; each access
+        returns a new list of them. Call refresh_tools() to pick up tools the
+        server added or changed since load().
+
         Returns:
             List of callable tool functions
 
@@ -234,8 +246,16 @@ class MCPServer:
             'echo'
             >>> server.close()
         """
-        from mcp2py.schema import create_function_with_signature
+        if self._tools_cache is None:
+            self._tools_cache = tuple(self._build_tool_functions())
+        return list(self._tools_cache)
+
+    def _build_tool_functions(self) -> list[Any]:
+        """Build one callable per tool for the .tools property.
 
+        Returns:
+            List of callable tool functions
+        """
         tool_functions = []
         for tool_name in self._tools.keys():
             # Get snake_case version if available
@@ -272,6 +292,80 @@ class MCPServer:
 
         return tool_functions
 
+    def refresh_tools(self) -> None:
+        """Re-fetch the server's tools so new ones can be called by name.
+
+        Bypasses the client's cached listing where it has one, rebuilds the
+        functions returned by .tools, and drops the implementations typed
+        method stubs have resolved, so they look tools up again. A typed
+        class keeps the signatures it was built with.
+
+        Example:
+            >>> server = load("python tests/test_server.py")
+            >>> server.refresh_tools()
+            >>> "echo" in [t.__name__ for t in server.tools]
+            True
+            >>> server.close()
+        """
+        from mcp2py.stubs import _BOUND_SLOT_PREFIX
+
+        # HTTP clients cache listings until the server reports a change
+        tools = self._runner.run(self._client.list_tools(force=True))
+
+        self._tools = {tool["name"]: tool for tool in tools}
+        self._name_map = {}
+        for original_name in self._tools.keys():
+            snake_name = normalize_name(original_name)
+            if snake_name != original_name:
+                self._name_map[snake_name] = original_name
+
+        self._tools_cache = None
+        for slot in [key for key in self.__dict__ if key.startswith(_BOUND_SLOT_PREFIX)]:
+            del self.__dict__[slot]
+
+    def call_many(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call several tools concurrently and return their results in order.
+
+        All requests are sent in one trip to the background loop and awaited
+        together, so N calls cost about one round trip instead of N.
+
+        Args:
+            calls: (tool name, arguments) pairs; names may be snake_case
+
+        Returns:
+            Unwrapped results, in the same order as ``calls``
+
+        Raises:
+            AttributeError: If a tool is not found (before anything is sent)
+            Exception: The first error raised by any of the calls
+
+        Example:
+            >>> server = load("python tests/test_server.py")
+            >>> server.call_many([("add", {"a": 1, "b": 2}), ("echo", {"message": "hi"})])
+            ['Result: 3.0', 'Echo: hi']
+            >>> server.close()
+        """
+        requests = []
+        for name, arguments in calls:
+            tool_name = self._name_map.get(name) or (name if name in self._tools else None)
+            if tool_name is None:
+                available = sorted(set(self._name_map) | set(self._tools))
+                raise AttributeError(
+                    f"Tool '{name}' not found.\n"
+                    f"Available tools: {', '.join(available) if available else 'none'}"
+                )
+            # Like tool methods, don't send None-valued optional arguments
+            requests.append(
+                (tool_name, {k: v for k, v in arguments.items() if v is not None})
+            )
+
+        async def call_all() -> list[dict[str, Any]]:
+            return await asyncio.gather(
+                *(self._client.call_tool(name, args) for name, args in requests)
+            )
+
+        return [self._unwrap_result(result) for result in self._runner.run(call_all())]
+
     def _unwrap_result(self, result: dict[str, Any]) -> Any:
         """Extract content from MCP response.
 
@@ -301,7 +395,8 @@ class MCPServer:
     def close(self) -> None:
         """Close connection and cleanup resources.
 
-        Terminates the server subprocess and stops the background event loop.
+        Terminates the server subprocess and stops the background event loop if
+        this server owns it.
 
         Example:
             >>> server = load("python tests/test_server.py")
@@ -311,6 +406,7 @@ class MCPServer:
             return
 
         self._closed = True
+        self._tools_cache = None
 
         # Unregister atexit handler (if called explicitly)
         try:
@@ -324,11 +420,12 @@ class MCPServer:
         except Exception:
             pass
 
-        # Stop event loop
-        try:
-            self._runner.close()
-        except Exception:
-            pass
+        # Stop event loop (unless other servers share it)
+        if self._owns_runner:
+            try:
+                self._runner.close()
+            except Exception:
+                pass
 
     def __enter__(self) -> "MCPServer":
         """Enter context manager.
@@ -374,24 +471,33 @@ class MCPServer:
             True
             >>> server.close()
         """
-        from mcp2py.stubs import generate_stub, get_stub_cache_path, save_stub
+        from mcp2py.stubs import (
+            generate_stub,
+            get_stub_cache_path,
+            load_stub_if_fresh,
+            save_stub,
+            stub_schema_hash,
+        )
 
-        # Generate stub content
         tools_list = list(self._tools.values())
         resources_list = list(self._resources.values())
         prompts_list = list(self._prompts.values())
 
-        stub_content = generate_stub(tools_list, resources_list, prompts_list)
-
-        # Determine save path
+        # Determine save path (cached stubs carry a schema hash manifest, so
+        # an up-to-date one from an earlier run is reused without regenerating)
+        schema_hash = None
         if path is None:
             if self._command is None:
                 raise ValueError("Cannot auto-cache stub: no command provided")
             save_path = get_stub_cache_path(self._command)
+            schema_hash = stub_schema_hash(tools_list, resources_list, prompts_list)
+            if load_stub_if_fresh(save_path, schema_hash) is not None:
+                return save_path
         else:
             save_path = Path(path)
 
-        # Save stub file
-        save_stub(stub_content, save_path)
+        # Generate and save stub file
+        stub_content = generate_stub(tools_list, resources_list, prompts_list)
+        save_stub(stub_content, save_path, schema_hash)
 
         return save_path
@@ -5,13 +5,81 @@ providing type hints and autocomplete for IDEs. It also creates
 dynamic typed classes that IDEs can understand without configuration.
 """
 
+import functools
 import hashlib
 import inspect
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Iterator, TypeVar
 
 from mcp2py.schema import normalize_name, json_schema_to_python_type
 
+# Tool parameter parsed from an input schema: (name, type, required, default)
+_ToolParam = tuple[str, type, bool, Any]
+
+# Key and value types of the typed-class and stub caches (see _cache_put)
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+# Instance __dict__ key prefix under which typed method stubs keep the callable
+# __getattr__ resolved for them (MCPServer.refresh_tools clears these)
+_BOUND_SLOT_PREFIX = "_mcp_bound_"
+
+# Leading parameter of every typed method stub (Parameters are immutable)
+_SELF_PARAMETER = inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+# Typed classes already built, keyed by base class and a fingerprint of the
+# server's tool/resource/prompt schemas (oldest entries evicted past the limit)
+_TYPED_CLASS_CACHE: dict[tuple[type, str], type] = {}
+_TYPED_CLASS_CACHE_SIZE = 64
+
+# Generated .pyi content, keyed by class name and schema fingerprint
+_STUB_CACHE: dict[tuple[str, str], str] = {}
+
+# Guards both caches (load() may run in several threads)
+_CACHE_LOCK = threading.Lock()
+
+# Spelling of JSON-schema-derived Python types in stub signatures
+_STUB_TYPE_NAMES = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    list: "list",
+    dict: "dict",
+    type(None): "None",
+}
+
+# Fixed opening and closing sections of every generated .pyi stub
+_STUB_HEADER = '''"""Auto-generated stub file for MCP server."""
+
+from typing import Any
+
+
+class {class_name}:
+    """MCP Server interface with tools, resources, and prompts."""
+'''
+_STUB_FOOTER = '''    # Properties
+    @property
+    def tools(self) -> list[Any]:
+        """Get list of callable tool functions."""
+        ...
+
+    # Lifecycle
+    def close(self) -> None:
+        """Close connection and cleanup resources."""
+        ...
+
+    def __enter__(self) -> {class_name}:
+        """Enter context manager."""
+        ...
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context manager and cleanup."""
+        ...'''
+
 
 def create_typed_server_class(
     base_class: type,
@@ -32,42 +100,79 @@ def create_typed_server_class(
         prompts: List of prompt schemas
 
     Returns:
-        A new class that extends base_class with typed methods
+        A class that extends base_class with typed methods (shared between
+        calls with identical schemas)
+    """
+    return _typed_class(
+        base_class,
+        tools,
+        resources,
+        prompts,
+        _schema_fingerprint(tools, resources, prompts),
+        functools.partial(_parse_tool_params, tools),
+    )
+
+
+def _parse_tool_params(tools: list[dict[str, Any]]) -> list[list[_ToolParam]]:
+    """Parse every tool's input schema into (name, type, required, default).
+
+    Args:
+        tools: List of tool schemas
+
+    Returns:
+        One parameter list per tool, in tool order
     """
-    from typing import get_type_hints
+    parsed = []
+    for tool in tools:
+        input_schema = tool.get("inputSchema", {})
+        required = set(input_schema.get("required", []))
+        parsed.append(
+            [
+                (
+                    param_name,
+                    json_schema_to_python_type(param_schema),
+                    param_name in required,
+                    param_schema.get("default"),
+                )
+                for param_name, param_schema in input_schema.get("properties", {}).items()
+            ]
+        )
+    return parsed
+
+
+def _typed_class(
+    base_class: type,
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+    fingerprint: str,
+    tool_params: Callable[[], list[list[_ToolParam]]],
+) -> type:
+    """Build (or fetch from cache) the typed class; see create_typed_server_class."""
+    key = (base_class, fingerprint)
+    with _CACHE_LOCK:
+        cached = _TYPED_CLASS_CACHE.get(key)
+    if cached is not None:
+        return cached
 
     # Build class dictionary with typed method stubs
     class_dict = {}
-    annotations = {}
 
     # Add tool method stubs
-    for tool in tools:
-        tool_name = tool["name"]
-        snake_name = normalize_name(tool_name)
-        input_schema = tool.get("inputSchema", {})
+    for tool, params in zip(tools, tool_params()):
+        snake_name = normalize_name(tool["name"])
         description = tool.get("description", "")
 
         # Create method stub with signature
-        method_func = _create_tool_method_stub(snake_name, description, input_schema)
+        method_func = _create_tool_method_stub(snake_name, description, params)
         class_dict[snake_name] = method_func
 
     # Add resource property stubs
     for resource in resources:
-        resource_name = resource["name"]
-        snake_name = normalize_name(resource_name)
-        description = resource.get("description", "")
-
-        # Create property that delegates to __getattr__
-        def make_resource_property(name: str, desc: str):
-            """Create a property that delegates to __getattr__."""
-            @property
-            def resource_property(self) -> Any:
-                # Delegate to __getattr__ for the actual implementation
-                return object.__getattribute__(self, '__getattr__')(name)
-            resource_property.__doc__ = desc
-            return resource_property
-
-        class_dict[snake_name] = make_resource_property(snake_name, description)
+        snake_name = normalize_name(resource["name"])
+        class_dict[snake_name] = _ResourceProperty(
+            snake_name, resource.get("description", "")
+        )
 
     # Add prompt method stubs
     for prompt in prompts:
@@ -87,29 +192,58 @@ def create_typed_server_class(
         class_dict
     )
 
-    return typed_class
+    return _cache_put(_TYPED_CLASS_CACHE, key, typed_class)
 
 
-def _create_tool_method_stub(name: str, description: str, input_schema: dict) -> Any:
-    """Create a typed method stub for a tool."""
-    # Extract parameters from schema
-    properties = input_schema.get("properties", {})
-    required = set(input_schema.get("required", []))
+def _cache_put(cache: dict[_K, _V], key: _K, value: _V) -> _V:
+    """Store value unless another thread got there first; return the winner.
 
-    # Build parameter list
-    params = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    Evicts the oldest entry once the cache holds _TYPED_CLASS_CACHE_SIZE items.
+    """
+    with _CACHE_LOCK:
+        if key in cache:
+            return cache[key]
+        if len(cache) >= _TYPED_CLASS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return value
+
+
+def _schema_fingerprint(
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+) -> str:
+    """Serialize the schemas a typed class depends on into a stable key.
 
-    for param_name, param_schema in properties.items():
-        python_type = json_schema_to_python_type(param_schema)
+    Args:
+        tools: List of tool schemas
+        resources: List of resource schemas
+        prompts: List of prompt schemas
 
-        if param_name in required:
+    Returns:
+        Canonical JSON string (key order independent)
+    """
+    return json.dumps(
+        [tools, resources, prompts], sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+def _create_tool_method_stub(
+    name: str, description: str, tool_params: list[_ToolParam]
+) -> Any:
+    """Create a typed method stub for a tool."""
+    # Build parameter list
+    params = [_SELF_PARAMETER]
+
+    for param_name, python_type, required, default in tool_params:
+        if required:
             param = inspect.Parameter(
                 param_name,
                 inspect.Parameter.POSITIONAL_OR_KEYWORD,
                 annotation=python_type
             )
         else:
-            default = param_schema.get("default", None)
             param = inspect.Parameter(
                 param_name,
                 inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -121,41 +255,34 @@ def _create_tool_method_stub(name: str, description: str, input_schema: dict) ->
     # Create signature
     sig = inspect.Signature(params, return_annotation=Any)
 
-    # Create stub function that delegates to __getattr__
-    def stub_method(self, *args, **kwargs):
-        # Bind args to signature to get proper kwargs
-        bound = sig.bind(self, *args, **kwargs)
-        bound.apply_defaults()
-        # Remove 'self' from arguments
-        call_kwargs = {k: v for k, v in bound.arguments.items() if k != 'self'}
-        # Call the real implementation via __getattr__
-        real_method = object.__getattribute__(self, '__getattr__')(name)
-        return real_method(**call_kwargs)
+    return _create_delegating_stub(name, description, sig)
 
-    stub_method.__name__ = name
-    stub_method.__doc__ = description
-    stub_method.__signature__ = sig  # type: ignore
 
-    return stub_method
+class _ResourceProperty:
+    """Read-only class attribute that fetches a resource via __getattr__.
 
+    Behaves like a property, without a closure and property object per
+    resource.
+    """
+
+    def __init__(self, name: str, description: str) -> None:
+        self._name = name
+        self.__doc__ = description
 
-def _create_resource_property_stub(description: str) -> Any:
-    """Create a typed property stub for a resource."""
-    def stub_getter(self) -> Any:
-        # Delegate to __getattr__ for the real implementation
-        # The property name will be determined by the class_dict key
-        # But we can't access it here, so this won't work as a property
-        # Resources should use the same method approach
-        raise NotImplementedError("Resources accessed as properties - use __getattr__")
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        # Delegate to __getattr__ for the actual implementation
+        return object.__getattribute__(obj, '__getattr__')(self._name)
 
-    stub_getter.__doc__ = description
-    return stub_getter
+    def __set__(self, obj: Any, value: Any) -> None:
+        raise AttributeError(f"resource '{self._name}' is read-only")
 
 
 def _create_prompt_method_stub(name: str, description: str, arguments: list) -> Any:
     """Create a typed method stub for a prompt."""
     # Build parameter list
-    params = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    params = [_SELF_PARAMETER]
 
     for arg in arguments:
         arg_name = arg["name"]
@@ -177,15 +304,47 @@ def _create_prompt_method_stub(name: str, description: str, arguments: list) ->
     # Create signature
     sig = inspect.Signature(params, return_annotation=list[Any])
 
-    # Create stub function that delegates to __getattr__
+    return _create_delegating_stub(name, description, sig)
+
+
+def _create_delegating_stub(
+    name: str, description: str, sig: inspect.Signature
+) -> Any:
+    """Create a method with signature sig that forwards kwargs via __getattr__.
+
+    Parameter names and defaults are read from sig once, so a well-formed
+    call is a couple of dict merges; sig.bind() only runs for calls that
+    don't fit the signature, to raise the usual TypeError. The callable
+    returned by __getattr__ is resolved on the first call and kept in the
+    instance __dict__; it looks up the server's client on every call, so it
+    stays valid if the connection is replaced.
+    """
+    slot = f"{_BOUND_SLOT_PREFIX}{name}"
+    parameters = list(sig.parameters.values())[1:]  # skip self
+    names = tuple(param.name for param in parameters)
+    name_set = frozenset(names)
+    defaults = {
+        param.name: param.default
+        for param in parameters
+        if param.default is not inspect.Parameter.empty
+    }
+
     def stub_method(self, *args, **kwargs):
-        # Bind args to signature to get proper kwargs
-        bound = sig.bind(self, *args, **kwargs)
-        bound.apply_defaults()
-        # Remove 'self' from arguments
-        call_kwargs = {k: v for k, v in bound.arguments.items() if k != 'self'}
-        # Call the real implementation via __getattr__
-        real_method = object.__getattribute__(self, '__getattr__')(name)
+        # Defaults, then positional args by name, then keyword args
+        call_kwargs = {**defaults, **dict(zip(names, args)), **kwargs}
+        if (
+            len(args) > len(names)
+            or call_kwargs.keys() != name_set
+            or (args and kwargs and not kwargs.keys().isdisjoint(names[: len(args)]))
+        ):
+            # Missing, unexpected or duplicate arguments: raise bind's TypeError
+            sig.bind(self, *args, **kwargs)
+        # Call the real implementation, resolved via __getattr__ once
+        instance_dict = self.__dict__
+        real_method = instance_dict.get(slot)
+        if real_method is None:
+            real_method = object.__getattribute__(self, '__getattr__')(name)
+            instance_dict[slot] = real_method
         return real_method(**call_kwargs)
 
     stub_method.__name__ = name
@@ -226,131 +385,103 @@ def generate_stub(
         >>> "def echo" in stub
         True
     """
-    lines = [
-        '"""Auto-generated stub file for MCP server."""',
-        "",
-        "from typing import Any",
-        "",
-        "",
-        f"class {class_name}:",
-        '    """MCP Server interface with tools, resources, and prompts."""',
-        "",
-    ]
+    return _stub_text(
+        tools,
+        resources,
+        prompts,
+        class_name,
+        _schema_fingerprint(tools, resources, prompts),
+        functools.partial(_parse_tool_params, tools),
+    )
+
+
+def _stub_text(
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+    class_name: str,
+    fingerprint: str,
+    tool_params: Callable[[], list[list[_ToolParam]]],
+) -> str:
+    """Generate (or fetch from cache) stub content; see generate_stub."""
+    key = (class_name, fingerprint)
+    with _CACHE_LOCK:
+        cached = _STUB_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    lines = _emit_stub(tools, tool_params(), resources, prompts, class_name)
+    return _cache_put(_STUB_CACHE, key, "\n".join(lines))
+
+
+def _emit_stub(
+    tools: list[dict[str, Any]],
+    tool_params: list[list[_ToolParam]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+    class_name: str,
+) -> Iterator[str]:
+    """Yield the lines of a .pyi stub (see generate_stub)."""
+    yield _STUB_HEADER.format(class_name=class_name)
 
     # Generate tool methods
     if tools:
-        lines.append("    # Tools")
-        for tool in tools:
-            tool_name = tool["name"]
-            snake_name = normalize_name(tool_name)
-            description = tool.get("description", "")
-            input_schema = tool.get("inputSchema", {})
-
-            # Build method signature
-            params = []
-            properties = input_schema.get("properties", {})
-            required = set(input_schema.get("required", []))
-
-            for param_name, param_schema in properties.items():
-                python_type = json_schema_to_python_type(param_schema)
-                type_name = _type_to_string(python_type)
-
-                if param_name in required:
-                    params.append(f"{param_name}: {type_name}")
-                else:
-                    default = param_schema.get("default")
-                    if default is None:
-                        params.append(f"{param_name}: {type_name} | None = None")
-                    elif isinstance(default, str):
-                        params.append(f'{param_name}: {type_name} = "{default}"')
-                    else:
-                        params.append(f"{param_name}: {type_name} = {default}")
-
-            params_str = ", ".join(params)
-
-            # Add docstring if present
-            if description:
-                lines.append(f"    def {snake_name}(self, {params_str}) -> Any:")
-                lines.append(f'        """{description}"""')
-                lines.append("        ...")
-            else:
-                lines.append(f"    def {snake_name}(self, {params_str}) -> Any: ...")
-
-            lines.append("")
+        yield "    # Tools"
+        for tool, params in zip(tools, tool_params):
+            params_str = ", ".join(_stub_param(*param) for param in params)
+            yield _stub_method(
+                f"def {normalize_name(tool['name'])}(self, {params_str}) -> Any",
+                tool.get("description", ""),
+            )
 
     # Generate resource properties
     if resources:
-        lines.append("    # Resources")
+        yield "    # Resources"
         for resource in resources:
-            resource_name = resource["name"]
-            snake_name = normalize_name(resource_name)
-            description = resource.get("description", "")
-
-            if description:
-                lines.append("    @property")
-                lines.append(f"    def {snake_name}(self) -> Any:")
-                lines.append(f'        """{description}"""')
-                lines.append("        ...")
-            else:
-                lines.append("    @property")
-                lines.append(f"    def {snake_name}(self) -> Any: ...")
-
-            lines.append("")
+            yield "    @property"
+            yield _stub_method(
+                f"def {normalize_name(resource['name'])}(self) -> Any",
+                resource.get("description", ""),
+            )
 
     # Generate prompt methods
     if prompts:
-        lines.append("    # Prompts")
+        yield "    # Prompts"
         for prompt in prompts:
-            prompt_name = prompt["name"]
-            snake_name = normalize_name(prompt_name)
-            description = prompt.get("description", "")
-            arguments = prompt.get("arguments", [])
-
             # Build method signature from prompt arguments
-            params = []
-            for arg in arguments:
-                arg_name = arg["name"]
-                if arg.get("required", False):
-                    params.append(f"{arg_name}: str")
-                else:
-                    params.append(f"{arg_name}: str | None = None")
-
-            params_str = ", ".join(params)
-
-            if description:
-                lines.append(f"    def {snake_name}(self, {params_str}) -> list[Any]:")
-                lines.append(f'        """{description}"""')
-                lines.append("        ...")
-            else:
-                lines.append(f"    def {snake_name}(self, {params_str}) -> list[Any]: ...")
-
-            lines.append("")
-
-    # Add tools property
-    lines.append("    # Properties")
-    lines.append("    @property")
-    lines.append("    def tools(self) -> list[Any]:")
-    lines.append('        """Get list of callable tool functions."""')
-    lines.append("        ...")
-    lines.append("")
-
-    # Add lifecycle methods
-    lines.append("    # Lifecycle")
-    lines.append("    def close(self) -> None:")
-    lines.append('        """Close connection and cleanup resources."""')
-    lines.append("        ...")
-    lines.append("")
-
-    lines.append(f"    def __enter__(self) -> {class_name}:")
-    lines.append('        """Enter context manager."""')
-    lines.append("        ...")
-    lines.append("")
-
-    lines.append("    def __exit__(self, *args: Any) -> None:")
-    lines.append('        """Exit context manager and cleanup."""')
-    lines.append("        ...")
-
-    return "\n".join(lines)
+            params_str = ", ".join(
+                f"{arg['name']}: str"
+                if arg.get("required", False)
+                else f"{arg['name']}: str | None = None"
+                for arg in prompt.get("arguments", [])
+            )
+            yield _stub_method(
+                f"def {normalize_name(prompt['name'])}(self, {params_str}) -> list[Any]",
+                prompt.get("description", ""),
+            )
+
+    # Tools property and lifecycle methods
+    yield _STUB_FOOTER.format(class_name=class_name)
+
+
+def _stub_param(name: str, python_type: type, required: bool, default: Any) -> str:
+    """Format one tool parameter for a stub signature."""
+    type_name = _type_to_string(python_type)
+    if required:
+        return f"{name}: {type_name}"
+
+    if default is None:
+        return f"{name}: {type_name} | None = None"
+    if isinstance(default, str):
+        return f'{name}: {type_name} = "{default}"'
+    return f"{name}: {type_name} = {default}"
+
+
+def _stub_method(signature: str, description: str) -> str:
+    """Format a stub method (with docstring if present) plus a blank line."""
+    if description:
+        return f'    {signature}:\n        """{description}"""\n        ...\n'
+    return f"    {signature}: ...\n"
 
 
 def _type_to_string(python_type: type) -> str:
@@ -370,16 +501,7 @@ def _type_to_string(python_type: type) -> str:
         >>> _type_to_string(list)
         'list'
     """
-    type_map = {
-        str: "str",
-        int: "int",
-        float: "float",
-        bool: "bool",
-        list: "list",
-        dict: "dict",
-        type(None): "None",
-    }
-    return type_map.get(python_type, "Any")
+    return _STUB_TYPE_NAMES.get(python_type, "Any")
 
 
 def get_stub_cache_path(command: str | list[str]) -> Path:
@@ -402,8 +524,9 @@ def get_stub_cache_path(command: str | list[str]) -> Path:
     else:
         command_str = command
 
-    # Create hash of command for unique filename
-    command_hash = hashlib.sha256(command_str.encode()).hexdigest()[:16]
+    # Hash command for a unique 16-hex-char filename (local cache key, so a
+    # fast non-adversarial digest sized directly is enough)
+    command_hash = hashlib.blake2b(command_str.encode(), digest_size=8).hexdigest()
 
     # Cache directory
     cache_dir = Path.home() / ".cache" / "mcp2py" / "stubs"
@@ -412,16 +535,103 @@ def get_stub_cache_path(command: str | list[str]) -> Path:
     return cache_dir / f"{command_hash}.pyi"
 
 
+def stub_schema_hash(
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+    class_name: str = "MCPServer",
+) -> str:
+    """Hash the inputs of generate_stub() for on-disk freshness checks.
+
+    Args:
+        tools: List of tool schemas
+        resources: List of resource schemas
+        prompts: List of prompt schemas
+        class_name: Class name used in the stub (default: MCPServer)
+
+    Returns:
+        32-character hex digest
+
+    Example:
+        >>> len(stub_schema_hash([], [], []))
+        32
+    """
+    fingerprint = _schema_fingerprint(tools, resources, prompts)
+    return hashlib.blake2b(
+        f"{class_name}\0{fingerprint}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def load_stub_if_fresh(path: Path | str, schema_hash: str) -> str | None:
+    """Return a cached stub's content if it was saved for schema_hash.
+
+    Freshness is recorded by save_stub() in a ``.manifest`` file next to
+    the stub, so a stale or foreign stub is never returned.
+
+    Args:
+        path: Path of the cached stub file
+        schema_hash: Hash from stub_schema_hash() for the current schemas
+
+    Returns:
+        Stub content, or None if missing or generated from other schemas
+
+    Example:
+        >>> path = get_stub_cache_path("python server.py")
+        >>> load_stub_if_fresh(path, stub_schema_hash([], [], [])) is None
+        True
+    """
+    path = Path(path)
+    try:
+        if _manifest_path(path).read_text() != schema_hash:
+            return None
+        return path.read_text()
+    except OSError:
+        return None
+
+
 def save_stub(
     stub_content: str,
     path: Path | str,
+    schema_hash: str | None = None,
 ) -> None:
     """Save stub content to file.
 
+    Leaves the file untouched if it already holds the same content, so
+    re-saving an unchanged server's stub costs one read. New content is
+    written to a temporary file and renamed into place, so concurrent
+    readers never see a partially written stub.
+
     Args:
         stub_content: Generated stub file content
         path: Path to save stub file
+        schema_hash: If given, recorded in a .manifest next to the stub so
+            load_stub_if_fresh() can skip regeneration later
     """
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(stub_content)
+    try:
+        unchanged = path.read_text() == stub_content
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, stub_content)
+
+    # Written after the stub, so a matching manifest implies a complete stub
+    if schema_hash is not None:
+        _atomic_write(_manifest_path(path), schema_hash)
+
+
+def _manifest_path(path: Path) -> Path:
+    """Return the freshness manifest path for a stub file."""
+    return path.with_suffix(".manifest")
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write text to a temp file beside path, then rename it into place."""
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+    try:
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
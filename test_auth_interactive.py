@@ -22,7 +22,7 @@ try:
     # Test with correct token
     print("Connecting with correct token...")
     server = load(
-        "http://localhost:8000/sse",
+        "http://localhost:8000/mcp",
         headers={"Authorization": "Bearer test-token-12345"}
     )
 
@@ -56,7 +56,7 @@ print("-" * 70)
 try:
     print("Connecting with invalid token...")
     server = load(
-        "http://localhost:8000/sse",
+        "http://localhost:8000/mcp",
         headers={"Authorization": "Bearer wrong-token"}
     )
     print("✗ Connection should have failed!")
@@ -74,7 +74,7 @@ print("-" * 70)
 
 try:
     print("Connecting without token...")
-    server = load("http://localhost:8000/sse")
+    server = load("http://localhost:8000/mcp")
     print("✗ Connection should have failed!")
     server.close()
 
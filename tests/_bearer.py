@@ -0,0 +1,62 @@
+"""Bearer token middleware shared by the authenticated HTTP test servers.
+
+Required token: test-token-12345
+"""
+
+import hmac
+
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+# Token the test servers accept, and the scheme prefix that precedes it
+EXPECTED_TOKEN = "test-token-12345"
+_BEARER_PREFIX = "Bearer "
+
+_CHALLENGE = {"WWW-Authenticate": 'Bearer realm="MCP Server"'}
+
+# 401 bodies, serialized once (Response objects are single-use, so only the
+# bytes are shared)
+_MISSING_BODY = b'{"error":"Missing or invalid Authorization header"}'
+_INVALID_BODY = b'{"error":"Invalid bearer token"}'
+
+
+def _unauthorized(body: bytes) -> Response:
+    """Build a 401 response with a bearer challenge from a prebuilt body."""
+    return Response(
+        content=body,
+        status_code=401,
+        headers=_CHALLENGE,
+        media_type="application/json",
+    )
+
+
+class BearerAuthMiddleware(BaseHTTPMiddleware):
+    """Middleware to check bearer token authentication."""
+
+    async def dispatch(self, request, call_next):
+        """Check for valid bearer token."""
+        # Skip auth for OPTIONS requests (CORS)
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        auth_header = request.headers.get("Authorization", "")
+
+        if not auth_header.startswith(_BEARER_PREFIX):
+            return _unauthorized(_MISSING_BODY)
+
+        # Slice off the prefix and compare in constant time
+        token = auth_header[len(_BEARER_PREFIX):]
+        if not hmac.compare_digest(token, EXPECTED_TOKEN):
+            return _unauthorized(_INVALID_BODY)
+
+        # Token is valid - add to request state for downstream use
+        request.state.authenticated = True
+        request.state.token = token
+
+        return await call_next(request)
+
+
+# HTTP middleware for FastMCP.http_app() / run(middleware=...). FastMCP's own
+# middleware= argument takes MCP-level middleware, not Starlette middleware.
+BEARER_MIDDLEWARE = [Middleware(BearerAuthMiddleware)]
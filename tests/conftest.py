@@ -0,0 +1,161 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from mcp2py import load
+from mcp2py.client import MCPClient
+from mcp2py.event_loop import get_shared_runner
+from mcp2py.server import MCPServer
+
+TEST_SERVER = Path(__file__).parent / "test_server.py"
+
+# Number of stdio test servers pre-spawned for the stdio_server fixture
+_STDIO_POOL_SIZE = 2
+
+
+def _load_stdio_server():
+    """Spawn and load test_server.py over stdio on its own loop."""
+    return load([sys.executable, str(TEST_SERVER)], dedicated_loop=True)
+
+
+def _is_healthy(server) -> bool:
+    """Check that a pooled server is open and still answering calls."""
+    if server._closed:
+        return False
+    try:
+        return "ping" in server.echo(message="ping")
+    except Exception:
+        return False
+
+
+@pytest.fixture(scope="session")
+def test_mcp():
+    """The test_server.py FastMCP instance, for in-process load() calls.
+
+    Loading it directly skips the subprocess spawn and interpreter startup
+    that dominate loader test time; stdio is covered by the command tests.
+    """
+    import test_server
+
+    return test_server.mcp
+
+
+class FakeClient:
+    """Client stand-in for tests that only exercise MCPServer's dispatch.
+
+    Tool calls answer with the tool name and arguments, without a server.
+    """
+
+    def __init__(self, tools):
+        self._tools = tools
+
+    async def list_tools(self, force=False):
+        return self._tools
+
+    async def call_tool(self, name, arguments):
+        return {"content": [{"type": "text", "text": f"{name}: {arguments}"}]}
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_server(test_mcp):
+    """MCPServer over a FakeClient, built from test_server.py's tool schemas.
+
+    For tests of attribute generation and dispatch, which need the schemas
+    but no connection.
+    """
+
+    async def list_tools():
+        tools = await test_mcp.get_tools()
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description or "",
+                "inputSchema": tool.inputSchema,
+            }
+            for tool in (t.to_mcp_tool() for t in tools.values())
+        ]
+
+    tools = asyncio.run(list_tools())
+    server = MCPServer(
+        FakeClient(tools), get_shared_runner(), tools, [], [], owns_runner=False
+    )
+    yield server
+    server.close()
+
+
+@pytest.fixture(scope="session")
+def shared_server(test_mcp):
+    """One test server connection reused by read-only loader tests.
+
+    Connecting costs far more than the tool calls these tests make, so they
+    share a single instance. Tests that close the server or depend on
+    load()'s own behaviour still load a fresh one.
+
+    The server runs on its own loop so tests that close the shared runner
+    can't pull it down mid-session.
+    """
+    server = load(test_mcp, dedicated_loop=True)
+    yield server
+    server.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def initialized_client():
+    """One connected, initialized MCPClient reused by protocol tests.
+
+    Tests using it must run on the session loop
+    (``@pytest.mark.asyncio(loop_scope="session")``), since the client's
+    stdio streams are bound to the loop that opened them.
+    """
+    client = MCPClient([sys.executable, str(TEST_SERVER)])
+    await client.connect()
+    await client.initialize(client_info={"name": "test", "version": "1.0"})
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def stdio_server_pool():
+    """Queue of pre-spawned test_server.py subprocesses.
+
+    The servers start concurrently, so the pool costs about one interpreter
+    startup instead of one per test.
+    """
+    with ThreadPoolExecutor(_STDIO_POOL_SIZE) as executor:
+        spawns = [executor.submit(_load_stdio_server) for _ in range(_STDIO_POOL_SIZE)]
+        servers = [spawn.result() for spawn in spawns]
+
+    pool: queue.Queue = queue.Queue()
+    for server in servers:
+        pool.put(server)
+
+    yield pool
+
+    while not pool.empty():
+        pool.get_nowait().close()
+
+
+@pytest.fixture
+def stdio_server(stdio_server_pool):
+    """A real stdio test server borrowed from the pool for one test.
+
+    Servers that were closed or stopped answering are replaced with a fresh
+    spawn before going back into the pool.
+    """
+    server = stdio_server_pool.get()
+    yield server
+
+    if not _is_healthy(server):
+        server.close()
+        server = _load_stdio_server()
+    stdio_server_pool.put(server)
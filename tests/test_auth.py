@@ -55,6 +55,72 @@ class TestOAuth:
         )
         assert oauth is not None
 
+    def test_oauth_shares_provider(self):
+        """Test that equivalent OAuth instances share one FastMCP provider."""
+        oauth1 = OAuth("https://shared.example.com/mcp", scopes=["read"])
+        oauth2 = OAuth("https://shared.example.com/mcp", scopes="read")
+        oauth3 = OAuth("https://shared.example.com/mcp", scopes=["write"])
+        assert oauth1._oauth is oauth2._oauth
+        assert oauth1._oauth is not oauth3._oauth
+
+    def test_oauth_providers_are_evicted(self, monkeypatch):
+        """Test that shared providers follow the auth cache's size limit."""
+        import mcp2py.auth
+
+        monkeypatch.setattr(mcp2py.auth, "_AUTH_CACHE_MAXSIZE", 2)
+        first = OAuth("https://evict-1.example.com/mcp")._oauth
+        OAuth("https://evict-2.example.com/mcp")
+        OAuth("https://evict-3.example.com/mcp")
+
+        assert len(mcp2py.auth._OAUTH_PROVIDERS) == 2
+        assert OAuth("https://evict-1.example.com/mcp")._oauth is not first
+
+    def test_oauth_sync_flow_drives_async_flow(self):
+        """Test that the sync auth flow runs FastMCP's async flow."""
+
+        class FakeProvider:
+            async def async_auth_flow(self, request):
+                request.headers["Authorization"] = "Bearer from-async-flow"
+                yield request
+
+        oauth = OAuth("https://sync.example.com/mcp")
+        oauth._oauth = FakeProvider()
+
+        flow = oauth.auth_flow(httpx.Request("GET", "https://sync.example.com/mcp"))
+        request = next(flow)
+        assert request.headers["Authorization"] == "Bearer from-async-flow"
+
+        with pytest.raises(StopIteration):
+            flow.send(httpx.Response(200))
+
+    def test_oauth_sync_flow_closes_async_flow_early(self):
+        """Test that closing the sync flow early also closes the async flow."""
+        closed = []
+
+        class FakeProvider:
+            def __init__(self):
+                # Hold the flow so garbage collection can't be what closes it
+                self.flows = []
+
+            def async_auth_flow(self, request):
+                self.flows.append(self._flow(request))
+                return self.flows[-1]
+
+            async def _flow(self, request):
+                try:
+                    yield request
+                    yield request
+                finally:
+                    closed.append(True)
+
+        oauth = OAuth("https://sync-close.example.com/mcp")
+        oauth._oauth = FakeProvider()
+
+        flow = oauth.auth_flow(httpx.Request("GET", "https://sync-close.example.com/mcp"))
+        next(flow)
+        flow.close()
+        assert closed == [True]
+
 
 class TestCreateAuthHandler:
     """Test create_auth_handler function."""
@@ -65,6 +131,14 @@ class TestCreateAuthHandler:
         assert auth is None
         assert headers == {}
 
+    def test_default_headers_are_not_shared(self):
+        """Test that editing returned headers doesn't leak into later calls."""
+        _, headers = create_auth_handler(None, None, "https://example.com", True)
+        headers["X-Edited"] = "1"
+
+        _, fresh = create_auth_handler(None, None, "https://example.com", True)
+        assert fresh == {}
+
     def test_bearer_token_string(self):
         """Test with bearer token as string."""
         auth, headers = create_auth_handler(
@@ -141,6 +215,38 @@ class TestCreateAuthHandler:
             )
             assert isinstance(auth, BearerAuth)
 
+    def test_bearer_handler_is_reused(self):
+        """Test that the same token and URL reuse one handler."""
+        auth1, _ = create_auth_handler("sk-reuse", None, "https://example.com", True)
+        auth2, _ = create_auth_handler("sk-reuse", None, "https://example.com", True)
+        assert auth1 is auth2
+
+    def test_bearer_handler_differs_per_token(self):
+        """Test that different tokens get different handlers."""
+        auth1, _ = create_auth_handler("sk-one", None, "https://example.com", True)
+        auth2, _ = create_auth_handler("sk-two", None, "https://example.com", True)
+        assert auth1 is not auth2
+
+    def test_oauth_handler_is_reused(self):
+        """Test that OAuth handlers are reused per URL."""
+        auth1, _ = create_auth_handler("oauth", None, "https://example.com/a", True)
+        auth2, _ = create_auth_handler("oauth", None, "https://example.com/a", True)
+        auth3, _ = create_auth_handler("oauth", None, "https://example.com/b", True)
+        assert auth1 is auth2
+        assert auth1 is not auth3
+
+    def test_env_token_handler_is_reused(self):
+        """Test that the MCP_TOKEN handler is reused until the token changes."""
+        with patch.dict(os.environ, {"MCP_TOKEN": "env-token-a"}):
+            auth1, _ = create_auth_handler(None, None, "https://example.com", True)
+            auth2, _ = create_auth_handler(None, None, "https://other.com", True)
+            assert auth1 is auth2
+
+        with patch.dict(os.environ, {"MCP_TOKEN": "env-token-b"}):
+            auth3, _ = create_auth_handler(None, None, "https://example.com", True)
+            assert isinstance(auth3, BearerAuth)
+            assert auth3 is not auth1
+
     def test_invalid_auth_type(self):
         """Test with invalid auth type."""
         with pytest.raises(ValueError, match="Invalid auth type"):
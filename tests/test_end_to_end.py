@@ -8,13 +8,15 @@ from pathlib import Path
 
 from mcp2py import load
 
+# Path to the stdio test server, and the command that launches it
+TEST_SERVER = Path(__file__).parent / "test_server.py"
+TEST_CMD = [sys.executable, str(TEST_SERVER)]
+
 
 def test_complete_workflow():
     """Test the complete workflow: load → call tools → cleanup."""
-    test_server = Path(__file__).parent / "test_server.py"
-
     # Load server
-    server = load([sys.executable, str(test_server)])
+    server = load(TEST_CMD)
 
     # Verify server is loaded
     assert hasattr(server, "echo")
@@ -33,9 +35,7 @@ def test_complete_workflow():
 
 def test_context_manager_workflow():
     """Test complete workflow with context manager."""
-    test_server = Path(__file__).parent / "test_server.py"
-
-    with load([sys.executable, str(test_server)]) as server:
+    with load(TEST_CMD) as server:
         # Make several calls
         results = []
         for i in range(3):
@@ -51,10 +51,8 @@ def test_context_manager_workflow():
 
 def test_realistic_usage_scenario():
     """Test a realistic usage scenario with mixed operations."""
-    test_server = Path(__file__).parent / "test_server.py"
-
     # Load server with string command
-    server = load(f"{sys.executable} {test_server}")
+    server = load(f"{sys.executable} {TEST_SERVER}")
 
     try:
         # Get tool references
@@ -89,9 +87,7 @@ def test_realistic_usage_scenario():
 
 def test_error_handling_workflow():
     """Test error handling in realistic scenarios."""
-    test_server = Path(__file__).parent / "test_server.py"
-
-    with load([sys.executable, str(test_server)]) as server:
+    with load(TEST_CMD) as server:
         # Valid call
         result = server.echo(message="test")
         assert "test" in result
@@ -107,9 +103,7 @@ def test_error_handling_workflow():
 
 def test_rapid_sequential_calls():
     """Test making many rapid calls to verify thread safety."""
-    test_server = Path(__file__).parent / "test_server.py"
-
-    with load([sys.executable, str(test_server)]) as server:
+    with load(TEST_CMD) as server:
         # Make 20 rapid calls
         results = []
         for i in range(20):
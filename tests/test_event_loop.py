@@ -166,3 +166,37 @@ def test_async_runner_returns_complex_types():
     assert result == [1, 2, 3, "four"]
 
     runner.close()
+
+
+def test_shared_runner_is_reused_and_restarted():
+    """Test that the shared runner is a singleton that restarts after close."""
+    from mcp2py.event_loop import get_shared_runner
+
+    runner = get_shared_runner()
+    assert get_shared_runner() is runner
+
+    runner.close()
+    restarted = get_shared_runner()
+    assert restarted is not runner
+
+    async def get_value():
+        return 7
+
+    assert restarted.run(get_value()) == 7
+
+
+def test_runner_falls_back_without_uvloop(monkeypatch):
+    """Test that the background loop is asyncio's when uvloop is missing."""
+    import sys
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    with AsyncRunner() as runner:
+        assert isinstance(runner._loop, asyncio.BaseEventLoop)
+
+
+def test_runner_uses_uvloop_when_installed():
+    """Test that the background loop is uvloop's when it is installed."""
+    uvloop = pytest.importorskip("uvloop")
+
+    with AsyncRunner() as runner:
+        assert isinstance(runner._loop, uvloop.Loop)
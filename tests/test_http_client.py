@@ -0,0 +1,330 @@
+"""Tests for HTTPMCPClient internals that don't need a running server."""
+
+import asyncio
+
+import pytest
+
+from mcp2py.http_client import _pooled_client_factory
+
+
+@pytest.mark.asyncio
+async def test_pooled_clients_share_connection_pool():
+    """Test that clients created on the same loop share one pool."""
+    client_a = _pooled_client_factory()
+    client_b = _pooled_client_factory(headers={"X-Test": "1"})
+
+    assert client_a._transport._pool is client_b._transport._pool
+    assert client_b.headers["X-Test"] == "1"
+    assert client_a.follow_redirects is True
+
+    await client_a.aclose()
+    await client_b.aclose()
+
+
+@pytest.mark.asyncio
+async def test_closing_pooled_client_keeps_pool_open():
+    """Test that closing one client doesn't tear down the shared pool."""
+    client = _pooled_client_factory()
+    pool = client._transport._pool
+    await client.aclose()
+
+    reused = _pooled_client_factory()
+    assert reused._transport._pool is pool
+    await reused.aclose()
+
+
+def test_each_event_loop_gets_its_own_pool():
+    """Test that pools are not reused across event loops."""
+
+    async def get_pool():
+        client = _pooled_client_factory()
+        pool = client._transport._pool
+        await client.aclose()
+        return pool
+
+    assert asyncio.run(get_pool()) is not asyncio.run(get_pool())
+
+
+def test_has_attr_probes_pydantic_fields():
+    """Test that attribute probes see pydantic fields and methods."""
+    from mcp.types import BlobResourceContents, TextResourceContents
+
+    from mcp2py.http_client import _has_attr
+
+    assert _has_attr(TextResourceContents, "text")
+    assert _has_attr(TextResourceContents, "mimeType")
+    assert _has_attr(TextResourceContents, "model_dump")
+    assert not _has_attr(BlobResourceContents, "text")
+    assert _has_attr(BlobResourceContents, "blob")
+
+
+def test_content_converter_is_picked_per_type():
+    """Test that message content converters dump models and stringify the rest."""
+    from mcp.types import TextContent
+
+    from mcp2py.http_client import _content_converter
+
+    content = TextContent(type="text", text="hi")
+    assert _content_converter(TextContent)(content)["text"] == "hi"
+    assert _content_converter(str)("plain") == "plain"
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_context_task():
+    """Test that close() signals shutdown and lets the context task finish."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    client._shutdown_event = asyncio.Event()
+    finished = []
+
+    async def run_contexts():
+        await client._shutdown_event.wait()
+        finished.append(True)
+
+    task = asyncio.get_running_loop().create_task(run_contexts())
+    client._context_task = task
+    await client.close()
+
+    assert task.done() and finished == [True]
+    assert client._context_task is None
+
+
+def test_accept_header_merging():
+    """Test that the Accept header always advertises SSE support."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    default = HTTPMCPClient("http://localhost:9/mcp")
+    assert default.headers == {"Accept": "text/event-stream, application/json"}
+
+    custom = HTTPMCPClient(
+        "http://localhost:9/mcp",
+        headers={"Accept": "application/json", "Authorization": "Bearer t"},
+    )
+    assert custom.headers["Accept"] == "application/json, text/event-stream"
+    assert custom.headers["Authorization"] == "Bearer t"
+
+    compliant = HTTPMCPClient(
+        "http://localhost:9/mcp", headers={"Accept": "text/event-stream"}
+    )
+    assert compliant.headers == {"Accept": "text/event-stream"}
+
+
+@pytest.mark.asyncio
+async def test_methods_require_initialization():
+    """Test that session methods raise before initialize() is called."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    with pytest.raises(RuntimeError, match="Not initialized"):
+        await client.list_tools()
+    with pytest.raises(RuntimeError, match="Not initialized"):
+        await client.call_tool("echo", {})
+
+
+def test_accept_header_fast_paths_skip_copies():
+    """Test that default and already-compliant headers aren't re-merged."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    first = HTTPMCPClient("http://localhost:9/mcp")
+    second = HTTPMCPClient("http://localhost:9/mcp")
+    assert first.headers is second.headers
+
+    headers = {"Accept": "text/event-stream, application/json", "X-Key": "k"}
+    assert HTTPMCPClient("http://localhost:9/mcp", headers=headers).headers is headers
+
+
+def test_unwrap_exception_group():
+    """Test that single-error task group failures surface the real error."""
+    from mcp2py.http_client import _unwrap_exception_group
+
+    cause = ConnectionError("refused")
+    nested = ExceptionGroup("outer", [ExceptionGroup("inner", [cause])])
+    assert _unwrap_exception_group(nested) is cause
+
+    multi = ExceptionGroup("many", [ValueError("a"), ValueError("b")])
+    assert _unwrap_exception_group(multi) is multi
+    assert _unwrap_exception_group(cause) is cause
+
+
+@pytest.mark.asyncio
+async def test_http2_clients_use_separate_pool():
+    """Test that HTTP/2 and HTTP/1.1 clients don't share a pool."""
+    pytest.importorskip("h2")
+
+    http1 = _pooled_client_factory()
+    http2 = _pooled_client_factory(http2=True)
+    assert http1._transport._pool is not http2._transport._pool
+    assert _pooled_client_factory(http2=True)._transport._pool is http2._transport._pool
+
+    await http1.aclose()
+    await http2.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_tools_is_cached_until_list_changed():
+    """Test that tool listings are reused until the server reports a change."""
+    from mcp import types
+
+    from mcp2py.http_client import HTTPMCPClient
+
+    calls = []
+
+    class FakeSession:
+        async def list_tools(self):
+            calls.append(1)
+            tool = types.Tool(name="echo", description="Echo", inputSchema={})
+            return types.ListToolsResult(tools=[tool])
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    client._session = client._live_session = FakeSession()
+
+    first = await client.list_tools()
+    first[0]["name"] = "mutated"
+    first.clear()
+    assert (await client.list_tools())[0]["name"] == "echo"
+    assert len(calls) == 1
+
+    await client.list_tools(force=True)
+    assert len(calls) == 2
+
+    changed = types.ToolListChangedNotification(method="notifications/tools/list_changed")
+    await client._handle_message(types.ServerNotification(changed))
+    tools = await client.list_tools()
+    assert tools[0]["name"] == "echo"
+    assert len(calls) == 3
+
+
+def test_connection_failed_message():
+    """Test that connection errors name the server and the cause."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    message = str(client._connection_failed(ConnectionError("refused")))
+
+    assert message.startswith(
+        "Failed to connect to MCP server at 'http://localhost:9/mcp': refused\n\n"
+    )
+    assert message.endswith("$ curl -v http://localhost:9/mcp")
+
+
+@pytest.mark.asyncio
+async def test_call_tool_stream_yields_content_items():
+    """Test that streamed tool content matches call_tool's content list."""
+    from mcp import types
+
+    from mcp2py.http_client import HTTPMCPClient
+
+    class FakeSession:
+        async def call_tool(self, name, arguments):
+            return types.CallToolResult(
+                content=[
+                    types.TextContent(type="text", text="one"),
+                    types.TextContent(type="text", text="two"),
+                ]
+            )
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    client._session = client._live_session = FakeSession()
+
+    streamed = [item async for item in client.call_tool_stream("echo", {})]
+    result = await client.call_tool("echo", {})
+
+    assert streamed == result["content"]
+    assert [item["text"] for item in streamed] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_pools_are_shared_per_limits():
+    """Test that clients only share a pool when their limits match."""
+    import httpx
+
+    small = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+    a = _pooled_client_factory(limits=small)
+    b = _pooled_client_factory(
+        limits=httpx.Limits(max_connections=5, max_keepalive_connections=2)
+    )
+    default = _pooled_client_factory()
+
+    assert a._transport._pool is b._transport._pool
+    assert a._transport._pool is not default._transport._pool
+
+    for client in (a, b, default):
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_initialize_fails_when_connection_drops():
+    """Test that initialize() raises instead of hanging if the transport dies."""
+    from mcp2py.http_client import HTTPMCPClient
+
+    class FakeSession:
+        async def initialize(self):
+            await asyncio.Event().wait()
+
+    async def rejected():
+        pass
+
+    client = HTTPMCPClient("http://localhost:9/mcp")
+    client._session = FakeSession()
+    client._context_task = asyncio.get_running_loop().create_task(rejected())
+    client._context_error = ConnectionError("401 Unauthorized")
+
+    with pytest.raises(RuntimeError, match="401 Unauthorized"):
+        await asyncio.wait_for(client.initialize({"name": "t", "version": "0"}), 5)
+
+
+def test_pool_is_closed_when_its_loop_shuts_down(monkeypatch):
+    """Test that a short-lived loop's pool is closed instead of leaking."""
+    import httpx
+
+    from mcp2py.event_loop import AsyncRunner
+
+    closed = []
+    original_aclose = httpx.AsyncHTTPTransport.aclose
+
+    async def recording_aclose(self):
+        closed.append(self)
+        await original_aclose(self)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", recording_aclose)
+
+    from mcp2py.http_client import _LOOP_POOLS
+
+    loops = []
+
+    async def get_pool():
+        loops.append(asyncio.get_running_loop())
+        client = _pooled_client_factory()
+        pool = client._transport._pool
+        await client.aclose()
+        return pool
+
+    pool = asyncio.run(get_pool())
+    assert closed == [pool]
+    assert loops[-1] not in _LOOP_POOLS
+
+    runner = AsyncRunner()
+    pool = runner.run(get_pool())
+    runner.close()
+    assert closed[-1] is pool
+    assert loops[-1] not in _LOOP_POOLS
+
+
+def test_finished_loops_are_dropped_from_pool_registry(monkeypatch):
+    """Test that loops run by asyncio.run() don't stay in the pool registry."""
+    import gc
+    import weakref
+
+    from mcp2py import http_client
+
+    monkeypatch.setattr(http_client, "_LOOP_POOLS", weakref.WeakKeyDictionary())
+
+    async def main():
+        http_client._get_shared_pool()
+
+    for _ in range(5):
+        asyncio.run(main())
+    gc.collect()
+
+    assert len(http_client._LOOP_POOLS) == 0
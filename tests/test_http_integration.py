@@ -1,13 +1,21 @@
-"""Integration tests for HTTP/SSE transport with authentication.
+"""Integration tests for streamable HTTP transport with authentication.
 
 These tests spin up a real HTTP server and test mcp2py's HTTP client
-with various authentication methods.
+with various authentication methods:
+
+- Simple HTTP connection (no auth), multiple calls over one connection
+- Context manager support
+- Bearer token via auth parameter, headers and environment variable
+- Invalid and missing token rejection
+- Connection refused handling
+- End-to-end workflow
 """
 
 import asyncio
 import os
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -16,6 +24,9 @@ import pytest
 from mcp2py import load
 from mcp2py.exceptions import MCPConnectionError
 
+# The simple server runs as a subprocess on a fixed port; the bearer server
+# runs in-process on an ephemeral one (see bearer_http_server)
+SIMPLE_URL = "http://localhost:8000/mcp"
 
 # Pytest fixture to skip if integration tests disabled
 @pytest.fixture(scope="module", autouse=True)
@@ -37,7 +48,7 @@ class HTTPServerFixture:
     def __enter__(self):
         """Start the server."""
         self.process = subprocess.Popen(
-            [sys.executable, str(self.server_script)],
+            [sys.executable, str(self.server_script), str(self.port)],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -66,7 +77,7 @@ class HTTPServerFixture:
                 self.process.wait()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_http_server():
     """Start simple HTTP server without auth."""
     server_path = Path(__file__).parent / "test_server_simple_http.py"
@@ -77,15 +88,45 @@ def simple_http_server():
         yield server
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bearer_http_server():
-    """Start HTTP server with bearer token auth."""
-    server_path = Path(__file__).parent / "test_server_bearer.py"
-    if not server_path.exists():
-        pytest.skip(f"Server not found: {server_path}")
+    """Serve the bearer-auth server in-process and yield its MCP URL.
 
-    with HTTPServerFixture(server_path, port=8000) as server:
-        yield server
+    Runs uvicorn on a background thread instead of spawning
+    test_server_bearer.py, skipping interpreter startup and re-imports.
+    """
+    import uvicorn
+
+    from _bearer import BEARER_MIDDLEWARE
+    from test_server_bearer import mcp
+
+    app = mcp.http_app(transport="http", middleware=BEARER_MIDDLEWARE)
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=0, log_level="warning", timeout_graceful_shutdown=1
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("In-process bearer server failed to start")
+        time.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/mcp"
+
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.fixture(scope="module")
+def simple_http_client(simple_http_server):
+    """One connection to the simple server, reused by read-only tests."""
+    server = load(SIMPLE_URL)
+    yield server
+    server.close()
 
 
 # ============================================================================
@@ -93,36 +134,28 @@ def bearer_http_server():
 # ============================================================================
 
 
-def test_http_simple_connection(simple_http_server):
+def test_http_simple_connection(simple_http_client):
     """Test basic HTTP connection without authentication."""
-    server = load("http://localhost:8000/sse")
-
     # Test basic tool call
-    result = server.echo(message="Hello HTTP!")
+    result = simple_http_client.echo(message="Hello HTTP!")
     assert "Hello HTTP!" in result
 
-    server.close()
-
 
-def test_http_simple_multiple_calls(simple_http_server):
+def test_http_simple_multiple_calls(simple_http_client):
     """Test multiple tool calls over same HTTP connection."""
-    server = load("http://localhost:8000/sse")
-
     # Multiple calls
-    result1 = server.echo(message="First")
-    result2 = server.echo(message="Second")
-    result3 = server.add(a=10, b=20)
+    result1 = simple_http_client.echo(message="First")
+    result2 = simple_http_client.echo(message="Second")
+    result3 = simple_http_client.add(a=10, b=20)
 
     assert "First" in result1
     assert "Second" in result2
     assert "30" in result3
 
-    server.close()
-
 
 def test_http_context_manager(simple_http_server):
     """Test HTTP server with context manager."""
-    with load("http://localhost:8000/sse") as server:
+    with load(SIMPLE_URL) as server:
         result = server.echo(message="Context manager works!")
         assert "Context manager works!" in result
 
@@ -134,7 +167,7 @@ def test_http_context_manager(simple_http_server):
 
 def test_bearer_auth_via_auth_parameter(bearer_http_server):
     """Test bearer authentication via auth parameter."""
-    server = load("http://localhost:8000/sse", auth="test-token-12345")
+    server = load(bearer_http_server, auth="test-token-12345")
 
     result = server.echo(message="Authenticated!")
     assert "Bearer Auth" in result or "Authenticated!" in result
@@ -145,7 +178,7 @@ def test_bearer_auth_via_auth_parameter(bearer_http_server):
 def test_bearer_auth_via_headers(bearer_http_server):
     """Test bearer authentication via headers parameter."""
     server = load(
-        "http://localhost:8000/sse",
+        bearer_http_server,
         headers={"Authorization": "Bearer test-token-12345"},
     )
 
@@ -161,7 +194,7 @@ def test_bearer_auth_via_environment(bearer_http_server):
     os.environ["MCP_TOKEN"] = "test-token-12345"
 
     try:
-        server = load("http://localhost:8000/sse")
+        server = load(bearer_http_server)
 
         result = server.echo(message="Authenticated!")
         assert "Authenticated!" in result
@@ -175,7 +208,7 @@ def test_bearer_auth_via_environment(bearer_http_server):
 def test_bearer_auth_failure(bearer_http_server):
     """Test that invalid bearer token is rejected."""
     with pytest.raises((MCPConnectionError, RuntimeError)) as exc_info:
-        server = load("http://localhost:8000/sse", auth="invalid-token")
+        server = load(bearer_http_server, auth="invalid-token")
 
     # Should fail with authentication error
     error_msg = str(exc_info.value).lower()
@@ -185,7 +218,7 @@ def test_bearer_auth_failure(bearer_http_server):
 def test_bearer_auth_missing(bearer_http_server):
     """Test that missing bearer token is rejected."""
     with pytest.raises((MCPConnectionError, RuntimeError)) as exc_info:
-        server = load("http://localhost:8000/sse")
+        server = load(bearer_http_server)
 
     # Should fail with authentication error
     error_msg = str(exc_info.value).lower()
@@ -200,7 +233,7 @@ def test_bearer_auth_missing(bearer_http_server):
 def test_http_connection_refused():
     """Test graceful handling of connection refused (server not running)."""
     with pytest.raises((MCPConnectionError, RuntimeError)) as exc_info:
-        server = load("http://localhost:9999/sse")  # Port that's not running
+        server = load("http://localhost:9999/mcp")  # Port that's not running
 
     error_msg = str(exc_info.value).lower()
     assert "failed to connect" in error_msg or "connection" in error_msg
@@ -209,7 +242,7 @@ def test_http_connection_refused():
 def test_http_invalid_url():
     """Test handling of invalid URLs."""
     with pytest.raises((MCPConnectionError, RuntimeError, ValueError)):
-        server = load("http://not-a-valid-url-at-all:8000/sse")
+        server = load("http://not-a-valid-url-at-all:8000/mcp")
 
 
 # ============================================================================
@@ -220,7 +253,7 @@ def test_http_invalid_url():
 def test_end_to_end_http_workflow(simple_http_server):
     """Complete end-to-end test of HTTP workflow."""
     # Load server
-    server = load("http://localhost:8000/sse")
+    server = load(SIMPLE_URL)
 
     try:
         # Test tools are available
@@ -252,45 +285,12 @@ def test_end_to_end_http_workflow(simple_http_server):
 
 
 @pytest.mark.slow
-def test_http_rapid_sequential_calls(simple_http_server):
+def test_http_rapid_sequential_calls(simple_http_client):
     """Test rapid sequential calls don't break the connection."""
-    server = load("http://localhost:8000/sse")
-
-    try:
-        # Make 20 rapid calls
-        for i in range(20):
-            result = server.echo(message=f"Call {i}")
-            assert f"Call {i}" in result
-
-    finally:
-        server.close()
-
-
-# ============================================================================
-# Skip Markers for CI
-# ============================================================================
-
-
-def test_auth_integration_summary(capsys):
-    """Summary of what was tested (for visibility in test output)."""
-    summary = """
-    HTTP/SSE Integration Tests Summary:
-    ===================================
-    ✓ Simple HTTP connection (no auth)
-    ✓ Multiple calls over same connection
-    ✓ Context manager support
-    ✓ Bearer token via auth parameter
-    ✓ Bearer token via headers
-    ✓ Bearer token via environment variable
-    ✓ Invalid token rejection
-    ✓ Missing token rejection
-    ✓ Connection refused handling
-    ✓ End-to-end workflow
-
-    All HTTP authentication features tested!
-    """
-    print(summary)
-    assert True
+    # Make 20 rapid calls
+    for i in range(20):
+        result = simple_http_client.echo(message=f"Call {i}")
+        assert f"Call {i}" in result
 
 
 if __name__ == "__main__":
@@ -9,24 +9,22 @@ from mcp2py import load
 from mcp2py.loader import load as load_func
 from mcp2py.server import MCPServer
 
+# Path to the stdio test server, and the command that launches it
+TEST_SERVER = Path(__file__).parent / "test_server.py"
+TEST_CMD = [sys.executable, str(TEST_SERVER)]
 
-def test_load_creates_server_object():
-    """Test that load() creates an MCPServer instance."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    assert isinstance(server, MCPServer)
-    assert hasattr(server, "_client")
-    assert hasattr(server, "_runner")
-    assert hasattr(server, "_tools")
 
-    server.close()
+def test_load_creates_server_object(shared_server):
+    """Test that load() creates an MCPServer instance."""
+    assert isinstance(shared_server, MCPServer)
+    assert hasattr(shared_server, "_client")
+    assert hasattr(shared_server, "_runner")
+    assert hasattr(shared_server, "_tools")
 
 
 def test_load_parses_string_command():
     """Test that load() parses string commands correctly."""
-    test_server = Path(__file__).parent / "test_server.py"
-    cmd = f"{sys.executable} {test_server}"
+    cmd = f"{sys.executable} {TEST_SERVER}"
 
     server = load(cmd)
     assert isinstance(server, MCPServer)
@@ -36,8 +34,7 @@ def test_load_parses_string_command():
 
 def test_load_parses_list_command():
     """Test that load() accepts pre-split command list."""
-    test_server = Path(__file__).parent / "test_server.py"
-    cmd = [sys.executable, str(test_server)]
+    cmd = TEST_CMD
 
     server = load(cmd)
     assert isinstance(server, MCPServer)
@@ -45,73 +42,52 @@ def test_load_parses_list_command():
     server.close()
 
 
-def test_server_has_callable_tools():
+def test_server_has_callable_tools(fake_server):
     """Test that server exposes tools as callable attributes."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     # Check that tools exist and are callable
-    assert hasattr(server, "echo")
-    assert callable(server.echo)
+    assert hasattr(fake_server, "echo")
+    assert callable(fake_server.echo)
 
-    assert hasattr(server, "add")
-    assert callable(server.add)
-
-    server.close()
+    assert hasattr(fake_server, "add")
+    assert callable(fake_server.add)
 
 
-def test_tool_call_returns_unwrapped_content():
+def test_tool_call_returns_unwrapped_content(shared_server):
     """Test that tool calls return unwrapped content."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     # Call echo tool
-    result = server.echo(message="Hello, World!")
+    result = shared_server.echo(message="Hello, World!")
 
     # Should return unwrapped text content
     assert isinstance(result, str)
     assert "Echo: Hello, World!" in result
 
-    server.close()
-
 
-def test_tool_call_with_different_arguments():
+def test_tool_call_with_different_arguments(shared_server):
     """Test calling tools with various argument types."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     # Call add with integers
-    result = server.add(a=5, b=3)
+    result = shared_server.add(a=5, b=3)
     assert "Result: 8" in result
 
     # Call add with floats
-    result = server.add(a=2.5, b=1.5)
+    result = shared_server.add(a=2.5, b=1.5)
     assert "Result: 4" in result
 
-    server.close()
-
 
-def test_invalid_tool_raises_attributeerror():
+def test_invalid_tool_raises_attributeerror(fake_server):
     """Test that accessing invalid tool raises AttributeError."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     with pytest.raises(AttributeError) as exc_info:
-        server.nonexistent_tool()
+        fake_server.nonexistent_tool()
 
     error_msg = str(exc_info.value)
     assert "nonexistent_tool" in error_msg
     assert "not found" in error_msg
     assert "Available tools:" in error_msg
 
-    server.close()
-
 
-def test_context_manager_cleanup():
+def test_context_manager_cleanup(test_mcp):
     """Test that context manager properly cleans up resources."""
-    test_server = Path(__file__).parent / "test_server.py"
 
-    with load([sys.executable, str(test_server)]) as server:
+    with load(test_mcp) as server:
         result = server.echo(message="test")
         assert "Echo: test" in result
 
@@ -119,50 +95,46 @@ def test_context_manager_cleanup():
     assert server._closed is True
 
 
-def test_multiple_tool_calls():
+def test_multiple_tool_calls(shared_server):
     """Test making multiple sequential tool calls."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     # Make several calls
     for i in range(5):
-        result = server.echo(message=f"Message {i}")
+        result = shared_server.echo(message=f"Message {i}")
         assert f"Echo: Message {i}" in result
 
-    server.close()
 
+def test_batched_tool_calls(shared_server):
+    """Test that call_many returns what the same sequential calls return."""
+    calls = [("echo", {"message": f"Message {i}"}) for i in range(5)]
+
+    sequential = [shared_server.echo(**arguments) for _, arguments in calls]
+    assert shared_server.call_many(calls) == sequential
 
-def test_snake_case_tool_names_work():
-    """Test that snake_case names work if tools are camelCase."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
 
+def test_snake_case_tool_names_work(shared_server):
+    """Test that snake_case names work if tools are camelCase."""
     # Our test server has "echo" and "add" (already snake_case)
     # So they should work with their original names
-    result = server.echo(message="test")
+    result = shared_server.echo(message="test")
     assert "Echo: test" in result
 
     # If we had a camelCase tool like "getWeather", we could call it as:
     # server.get_weather() or server.getWeather()
 
-    server.close()
-
 
-def test_load_from_exported_function():
+def test_load_from_exported_function(test_mcp):
     """Test that load is properly exported from main module."""
-    test_server = Path(__file__).parent / "test_server.py"
     from mcp2py import load as exported_load
 
-    server = exported_load([sys.executable, str(test_server)])
+    server = exported_load(test_mcp)
     assert isinstance(server, MCPServer)
 
     server.close()
 
 
-def test_server_close_is_idempotent():
+def test_server_close_is_idempotent(test_mcp):
     """Test that calling close() multiple times is safe."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
+    server = load(test_mcp)
 
     result = server.echo(message="test")
     assert "test" in result
@@ -184,43 +156,27 @@ def test_load_invalid_command_raises():
         load("nonexistent_command_xyz_123")
 
 
-def test_tool_method_has_docstring():
+def test_tool_method_has_docstring(fake_server):
     """Test that generated tool methods have docstrings."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    echo_func = server.echo
+    echo_func = fake_server.echo
     assert "Echo back the input" in echo_func.__doc__
 
-    add_func = server.add
+    add_func = fake_server.add
     assert "Add two numbers" in add_func.__doc__
 
-    server.close()
 
-
-def test_tool_method_has_name():
+def test_tool_method_has_name(fake_server):
     """Test that generated tool methods have correct __name__."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    echo_func = server.echo
+    echo_func = fake_server.echo
     assert echo_func.__name__ == "echo"
 
-    add_func = server.add
+    add_func = fake_server.add
     assert add_func.__name__ == "add"
 
-    server.close()
-
-
-def test_server_handles_concurrent_calls():
-    """Test that server can handle rapid sequential calls."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
 
-    results = []
-    for i in range(10):
-        result = server.add(a=i, b=i)
-        results.append(result)
+def test_server_handles_concurrent_calls(shared_server):
+    """Test that server can handle many concurrent calls."""
+    results = shared_server.call_many([("add", {"a": i, "b": i}) for i in range(10)])
 
     # Verify all calls succeeded
     assert len(results) == 10
@@ -228,4 +184,179 @@ def test_server_handles_concurrent_calls():
         expected = i + i
         assert f"Result: {expected}" in result
 
-    server.close()
+
+def test_call_many_checks_names_before_sending(shared_server):
+    """Test that call_many keeps call order and rejects unknown tools upfront."""
+    assert shared_server.call_many(
+        [("echo", {"message": "one"}), ("echo", {"message": "two"})]
+    ) == ["Echo: one", "Echo: two"]
+    assert shared_server.call_many([]) == []
+
+    with pytest.raises(AttributeError, match="'nonexistent_tool' not found"):
+        shared_server.call_many([("echo", {"message": "x"}), ("nonexistent_tool", {})])
+
+
+def test_discover_falls_back_for_optional_listings():
+    """Test that discovery tolerates missing resources/prompts but not tools."""
+    import asyncio
+
+    from mcp2py.loader import _discover
+
+    class FakeClient:
+        def __init__(self, tools_error=None):
+            self.tools_error = tools_error
+
+        async def list_tools(self):
+            if self.tools_error:
+                raise self.tools_error
+            return [{"name": "echo"}]
+
+        async def list_resources(self):
+            raise RuntimeError("Method not found")
+
+        async def list_prompts(self):
+            return [{"name": "greet"}]
+
+    tools, resources, prompts = asyncio.run(_discover(FakeClient()))
+    assert tools == [{"name": "echo"}]
+    assert resources == []
+    assert prompts == [{"name": "greet"}]
+
+    with pytest.raises(ValueError):
+        asyncio.run(_discover(FakeClient(tools_error=ValueError("boom"))))
+
+
+def test_detect_filesystem_roots():
+    """Test that only filesystem server commands get path arguments as roots."""
+    from mcp2py.loader import _detect_filesystem_roots
+
+    roots = _detect_filesystem_roots(
+        ["npx", "-y", "@modelcontextprotocol/server-filesystem", "/tmp", "--flag=/x"]
+    )
+    assert roots == [{"uri": "file:///tmp", "name": "tmp"}]
+
+    assert _detect_filesystem_roots(["python", "server.py", "/tmp"]) is None
+    assert _detect_filesystem_roots(["npx", "server-filesystem"]) is None
+
+
+def test_servers_share_background_loop(test_mcp):
+    """Test that closing one server leaves the shared loop running for others."""
+    first = load(test_mcp)
+    second = load(test_mcp)
+
+    assert first._runner is second._runner
+
+    first.close()
+    assert "Echo: still here" in second.echo(message="still here")
+    second.close()
+
+
+def test_dedicated_loop_is_closed_with_server(test_mcp):
+    """Test that dedicated_loop gives a server its own runner that close() stops."""
+    shared = load(test_mcp)
+    isolated = load(test_mcp, dedicated_loop=True)
+
+    assert isolated._runner is not shared._runner
+
+    isolated.close()
+    assert isolated._runner._closed is True
+    assert shared._runner._closed is False
+    shared.close()
+
+
+def test_stub_generation_is_opt_in(monkeypatch):
+    """Test that stubs are only written when requested or enabled by env."""
+    from mcp2py.loader import _should_generate_stubs
+
+    monkeypatch.delenv("MCP2PY_GENERATE_STUBS", raising=False)
+    assert _should_generate_stubs(None) is False
+    assert _should_generate_stubs(True) is True
+
+    monkeypatch.setenv("MCP2PY_GENERATE_STUBS", "1")
+    assert _should_generate_stubs(None) is True
+    assert _should_generate_stubs(False) is False
+
+
+def test_default_handlers_are_built_on_first_request(monkeypatch, test_mcp):
+    """Test that load() doesn't construct default handlers up front."""
+    import mcp2py.loader
+
+    built = []
+    monkeypatch.setattr(mcp2py.loader, "DefaultSamplingHandler", lambda: built.append("s"))
+    monkeypatch.setattr(
+        mcp2py.loader, "DefaultElicitationHandler", lambda: built.append("e")
+    )
+
+    with load(test_mcp) as server:
+        assert "Echo: hi" in server.echo(message="hi")
+
+    assert built == []
+
+
+def test_sampling_callback_wraps_handler_text():
+    """Test that the module-level sampling callback builds an MCP result."""
+    import asyncio
+    import functools
+
+    from mcp import types
+
+    from mcp2py.loader import _LazyHandler, _sampling_callback
+
+    def handler(messages, model_preferences, system_prompt, max_tokens):
+        return f"{system_prompt}: {messages[0]['content']} ({max_tokens})"
+
+    params = types.CreateMessageRequestParams(
+        messages=[
+            types.SamplingMessage(
+                role="user", content=types.TextContent(type="text", text="hi")
+            )
+        ],
+        systemPrompt="sys",
+        maxTokens=50,
+    )
+    callback = functools.partial(_sampling_callback, handler=_LazyHandler(lambda: handler))
+    result = asyncio.run(callback(None, params))
+
+    assert result.content.text == "sys: hi (50)"
+    assert result.model == "default"
+
+
+def test_elicitation_callback_runs_handler_off_loop():
+    """Test that the elicitation handler runs outside the event loop thread."""
+    import asyncio
+    import functools
+    import threading
+
+    from mcp import types
+
+    from mcp2py.loader import _elicitation_callback
+
+    threads = []
+
+    def handler(message, schema):
+        threads.append(threading.current_thread())
+        return {"answer": message}
+
+    params = types.ElicitRequestParams(
+        message="hi", requestedSchema={"type": "object", "properties": {}}
+    )
+    callback = functools.partial(_elicitation_callback, handler=handler)
+    result = asyncio.run(callback(None, params))
+
+    assert result.action == "accept"
+    assert result.content == {"answer": "hi"}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_http_client_is_imported_lazily():
+    """Test that importing mcp2py doesn't load the HTTP transport."""
+    import subprocess
+
+    code = "import sys, mcp2py; print('mcp2py.http_client' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -15,12 +15,15 @@ import pytest
 
 from mcp2py.client import MCPClient
 
+# Path to the stdio test server, and the command that launches it
+TEST_SERVER = Path(__file__).parent / "test_server.py"
+TEST_CMD = [sys.executable, str(TEST_SERVER)]
+
 
 @pytest.mark.asyncio
 async def test_initialize_handshake_succeeds():
     """Test that initialization handshake completes successfully."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
+    client = MCPClient(TEST_CMD)
 
     await client.connect()
     result = await client.initialize(client_info={"name": "test", "version": "1.0"})
@@ -32,16 +35,10 @@ async def test_initialize_handshake_succeeds():
     await client.close()
 
 
-@pytest.mark.asyncio
-async def test_list_tools_returns_valid_schemas():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_tools_returns_valid_schemas(initialized_client):
     """Test listing tools returns valid JSON schemas."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
-
-    await client.connect()
-    await client.initialize(client_info={"name": "test", "version": "1.0"})
-
-    tools = await client.list_tools()
+    tools = await initialized_client.list_tools()
 
     # Verify tools structure
     assert isinstance(tools, list)
@@ -60,20 +57,12 @@ async def test_list_tools_returns_valid_schemas():
     assert "echo" in tool_names
     assert "add" in tool_names
 
-    await client.close()
-
 
-@pytest.mark.asyncio
-async def test_call_tool_executes_and_returns_content():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_executes_and_returns_content(initialized_client):
     """Test calling a tool executes and returns content."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
-
-    await client.connect()
-    await client.initialize(client_info={"name": "test", "version": "1.0"})
-
     # Call echo tool
-    result = await client.call_tool("echo", {"message": "Hello, MCP!"})
+    result = await initialized_client.call_tool("echo", {"message": "Hello, MCP!"})
 
     # Verify result structure
     assert isinstance(result, dict)
@@ -86,23 +75,16 @@ async def test_call_tool_executes_and_returns_content():
     assert content["type"] == "text"
     assert "Echo: Hello, MCP!" in content["text"]
 
-    await client.close()
-
 
-@pytest.mark.asyncio
-async def test_handles_server_errors_gracefully():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_handles_server_errors_gracefully(initialized_client):
     """Test that client handles server errors without crashing."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
-
-    await client.connect()
-    await client.initialize(client_info={"name": "test", "version": "1.0"})
-
     # Try to call a tool with invalid arguments
     # The server should handle this gracefully and return an error
     # For now, we just verify the client doesn't crash
     try:
-        result = await client.call_tool("add", {})  # Missing required args
+        # Missing required args
+        result = await initialized_client.call_tool("add", {})
         # Server might handle this gracefully and return a result
         # or it might return an error - either way, we shouldn't crash
         assert isinstance(result, dict)
@@ -110,36 +92,25 @@ async def test_handles_server_errors_gracefully():
         # If server returns error, we should handle it gracefully
         pass  # Expected behavior
 
-    await client.close()
-
 
-@pytest.mark.asyncio
-async def test_request_id_correlation():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_id_correlation(initialized_client):
     """Test that multiple requests are properly handled."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
-
-    await client.connect()
-    await client.initialize(client_info={"name": "test", "version": "1.0"})
-
     # Make multiple requests - official SDK handles correlation internally
-    tools = await client.list_tools()
+    tools = await initialized_client.list_tools()
     assert len(tools) > 0
 
-    result = await client.call_tool("echo", {"message": "test"})
+    result = await initialized_client.call_tool("echo", {"message": "test"})
     assert "content" in result
 
     # Verify session is still working
-    assert client._initialized is True
-
-    await client.close()
+    assert initialized_client._initialized is True
 
 
 @pytest.mark.asyncio
 async def test_initialize_required_before_other_calls():
     """Test that initialize must be called before other methods."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
+    client = MCPClient(TEST_CMD)
 
     await client.connect()
 
@@ -154,38 +125,43 @@ async def test_initialize_required_before_other_calls():
     await client.close()
 
 
-@pytest.mark.asyncio
-async def test_call_tool_with_different_argument_types():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_with_different_argument_types(initialized_client):
     """Test calling tools with various argument types."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
-
-    await client.connect()
-    await client.initialize(client_info={"name": "test", "version": "1.0"})
-
     # Call add with numbers
-    result = await client.call_tool("add", {"a": 5, "b": 3})
+    result = await initialized_client.call_tool("add", {"a": 5, "b": 3})
     assert "Result: 8" in result["content"][0]["text"]
 
     # Call add with floats
-    result = await client.call_tool("add", {"a": 2.5, "b": 1.5})
+    result = await initialized_client.call_tool("add", {"a": 2.5, "b": 1.5})
     assert "Result: 4" in result["content"][0]["text"]
 
-    await client.close()
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_multiple_sequential_tool_calls(initialized_client):
+    """Test making multiple tool calls in sequence."""
+    # Make several calls
+    for i in range(5):
+        result = await initialized_client.call_tool(
+            "echo", {"message": f"Message {i}"}
+        )
+        assert f"Echo: Message {i}" in result["content"][0]["text"]
 
 
 @pytest.mark.asyncio
-async def test_multiple_sequential_tool_calls():
-    """Test making multiple tool calls in sequence."""
-    test_server = Path(__file__).parent / "test_server.py"
-    client = MCPClient([sys.executable, str(test_server)])
+async def test_in_process_server_needs_no_command(test_mcp):
+    """Test that a server object is reached over memory streams, no subprocess."""
+    with pytest.raises(ValueError, match="Command cannot be empty"):
+        MCPClient([])
+    with pytest.raises(TypeError, match="Unsupported in-process server"):
+        MCPClient([], server=object())
+
+    client = MCPClient([], server=test_mcp)
+    assert client.server_params is None
 
     await client.connect()
     await client.initialize(client_info={"name": "test", "version": "1.0"})
-
-    # Make several calls
-    for i in range(5):
-        result = await client.call_tool("echo", {"message": f"Message {i}"})
-        assert f"Echo: Message {i}" in result["content"][0]["text"]
+    result = await client.call_tool("echo", {"message": "in-process"})
+    assert "Echo: in-process" in result["content"][0]["text"]
 
     await client.close()
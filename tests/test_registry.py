@@ -173,3 +173,16 @@ def test_non_dict_registry_raises_error(temp_registry):
 
     with pytest.raises(MCPConfigError, match="not a dict"):
         load_registry()
+
+
+def test_get_command_rereads_changed_registry(temp_registry):
+    """Test that get_command caches the registry but sees file changes."""
+    register(weather="npx weather-server")
+    assert get_command("weather") == "npx weather-server"
+
+    with patch("mcp2py.registry.load_registry") as mock_load:
+        assert get_command("weather") == "npx weather-server"
+        mock_load.assert_not_called()
+
+    temp_registry.write_text(json.dumps({"weather": "npx other-weather-server"}))
+    assert get_command("weather") == "npx other-weather-server"
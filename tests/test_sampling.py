@@ -188,3 +188,163 @@ def test_call_uses_server_preferences(mock_litellm):
 
     call_args = mock_litellm.completion.call_args
     assert call_args[1]["model"] == "gpt-3.5-turbo"
+
+
+def test_refresh_picks_up_new_api_keys(monkeypatch):
+    """Test that key detection is cached until refresh() is called."""
+    for key in ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY"]:
+        monkeypatch.delenv(key, raising=False)
+
+    handler = DefaultSamplingHandler()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert handler.can_handle() is False
+
+    handler.refresh()
+    assert handler.can_handle() is True
+    assert handler._select_model(None) == "gpt-4o-mini"
+
+
+def test_concurrent_calls_are_batched(mock_litellm):
+    """Test that requests arriving within the window share one batch call."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def batch_completion(model, messages, max_tokens):
+        responses = []
+        for request in messages:
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = f"re: {request[-1]['content']}"
+            responses.append(response)
+        return responses
+
+    mock_litellm.batch_completion.side_effect = batch_completion
+    handler = DefaultSamplingHandler(model="gpt-4", batch_window_ms=200, max_batch=3)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(handler, messages=[{"role": "user", "content": str(i)}])
+            for i in range(3)
+        ]
+        results = [future.result() for future in futures]
+
+    assert results == ["re: 0", "re: 1", "re: 2"]
+    mock_litellm.batch_completion.assert_called_once()
+    mock_litellm.completion.assert_not_called()
+
+
+def test_batched_call_errors_reach_each_caller(mock_litellm):
+    """Test that a failed batch raises MCPSamplingError for its callers."""
+    mock_litellm.completion.side_effect = Exception("API Error")
+    handler = DefaultSamplingHandler(model="gpt-4", batch_window_ms=1)
+
+    with pytest.raises(MCPSamplingError, match="API Error"):
+        handler(messages=[{"role": "user", "content": "Hello"}])
+
+
+def test_call_does_not_mutate_messages(mock_litellm):
+    """Test that adding the system prompt leaves the caller's list alone."""
+    handler = DefaultSamplingHandler(model="gpt-4")
+    messages = [{"role": "user", "content": "Hello"}]
+
+    handler(messages=messages, system_prompt="You are helpful")
+
+    assert messages == [{"role": "user", "content": "Hello"}]
+    sent = mock_litellm.completion.call_args[1]["messages"]
+    assert [m["role"] for m in sent] == ["system", "user"]
+
+
+def test_provider_order_env_changes_priority(monkeypatch):
+    """Test that MCP2PY_PROVIDER_ORDER picks which available key wins."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-oai")
+
+    monkeypatch.delenv("MCP2PY_PROVIDER_ORDER", raising=False)
+    assert DefaultSamplingHandler()._select_model(None) == "claude-3-5-sonnet-20241022"
+
+    monkeypatch.setenv("MCP2PY_PROVIDER_ORDER", "openai, anthropic")
+    assert DefaultSamplingHandler()._select_model(None) == "gpt-4o-mini"
+
+
+def test_parallel_sampling_requests_overlap(test_mcp):
+    """Test that a server's concurrent sampling requests are answered in parallel."""
+    import time
+
+    from mcp2py import load
+
+    def slow_handler(messages, model_preferences, system_prompt, max_tokens):
+        time.sleep(0.2)
+        return "neutral"
+
+    texts = [f"text {i}" for i in range(5)]
+    with load(test_mcp, on_sampling=slow_handler) as server:
+        start = time.perf_counter()
+        result = server.analyze_sentiment_batch(texts=texts)
+        elapsed = time.perf_counter() - start
+
+    assert result.splitlines() == [f"{text}: neutral" for text in texts]
+    assert elapsed < 0.5
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sampling_skips_message_handler(test_mcp):
+    """Test that sampling requests answered on the task group skip message_handler."""
+    import anyio
+    from mcp import types
+    from mcp.shared.memory import create_client_server_memory_streams
+
+    from mcp2py.client import ConcurrentSamplingSession
+
+    seen = []
+
+    async def message_handler(message):
+        seen.append(message)
+
+    async def sampling_callback(context, params):
+        return types.CreateMessageResult(
+            role="assistant",
+            content=types.TextContent(type="text", text="neutral"),
+            model="test",
+        )
+
+    server = test_mcp._mcp_server
+    async with create_client_server_memory_streams() as (client, server_streams):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(
+                lambda: server.run(*server_streams, server.create_initialization_options())
+            )
+            async with ConcurrentSamplingSession(
+                *client,
+                sampling_callback=sampling_callback,
+                message_handler=message_handler,
+            ) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    "analyze_sentiment_batch", {"texts": ["a", "b", "c"]}
+                )
+            tg.cancel_scope.cancel()
+
+    assert result.content[0].text.splitlines() == ["a: neutral", "b: neutral", "c: neutral"]
+    assert not any(
+        isinstance(getattr(m, "request", None), types.ServerRequest) for m in seen
+    )
+
+
+def test_concurrent_sampling_session_hooks_exist():
+    """Test that the SDK internals ConcurrentSamplingSession overrides still exist.
+
+    Fails on an mcp release that renames them, instead of sampling silently
+    going back to one request at a time.
+    """
+    import inspect
+
+    from mcp import ClientSession
+    from mcp.shared.session import BaseSession
+
+    for name in ("_received_request", "_handle_incoming", "_send_response"):
+        assert callable(getattr(ClientSession, name, None)), name
+
+    receive_loop = inspect.getsource(BaseSession._receive_loop)
+    assert "await self._received_request(responder)" in receive_loop
+    assert "await self._handle_incoming(responder)" in receive_loop
+    assert "self._task_group" in inspect.getsource(BaseSession.__aenter__)
@@ -13,6 +13,8 @@ Demonstrates all MCP capabilities:
 - Prompts: Code review and README generation templates
 """
 
+import asyncio
+
 from fastmcp import FastMCP
 from fastmcp.server import Context
 from pydantic import BaseModel
@@ -87,6 +89,40 @@ async def analyze_sentiment(text: str, ctx: Context) -> str:
     return f"Sentiment: {sentiment.strip()}"
 
 
+@mcp.tool()
+async def analyze_sentiment_batch(texts: list[str], ctx: Context) -> str:
+    """Analyze sentiment of several texts with parallel sampling requests.
+
+    Args:
+        texts: Texts to analyze for sentiment
+    """
+    from mcp.types import SamplingMessage, TextContent
+
+    # Fan out one sampling request per text
+    results = await asyncio.gather(
+        *(
+            ctx.session.create_message(
+                messages=[
+                    SamplingMessage(
+                        role="user",
+                        content=TextContent(
+                            type="text",
+                            text=f"Analyze the sentiment of this text and respond with just one word (positive, negative, or neutral): {text}"
+                        )
+                    )
+                ],
+                max_tokens=10
+            )
+            for text in texts
+        )
+    )
+
+    return "\n".join(
+        f"{text}: {getattr(result.content, 'text', str(result.content)).strip()}"
+        for text, result in zip(texts, results)
+    )
+
+
 @mcp.tool()
 async def confirm_action(action: str, ctx: Context) -> str:
     """Ask user to confirm an action (triggers elicitation).
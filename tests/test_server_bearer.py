@@ -3,6 +3,7 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "fastmcp>=2.12.4",
+#     "uvloop>=0.19.0; sys_platform != 'win32'",
 # ]
 # ///
 """Bearer token authenticated MCP test server.
@@ -11,60 +12,28 @@ This server requires a bearer token for authentication.
 Use: Authorization: Bearer test-token-12345
 
 Example usage:
-    python tests/test_server_bearer.py
+    python tests/test_server_bearer.py [port]   # default port 8000
 
 Then connect with:
     from mcp2py import load
-    server = load("http://localhost:8000/sse",
+    server = load("http://localhost:8000/mcp",
                   headers={"Authorization": "Bearer test-token-12345"})
 """
 
+import asyncio
+import sys
+from functools import partial
+from importlib.util import find_spec
+
+import anyio
 from fastmcp import FastMCP
 from fastmcp.server import Context
 from pydantic import BaseModel
 
-# Create FastMCP server with custom middleware
-from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
-
-
-class BearerAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to check bearer token authentication."""
-
-    async def dispatch(self, request, call_next):
-        """Check for valid bearer token."""
-        # Skip auth for OPTIONS requests (CORS)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        auth_header = request.headers.get("Authorization", "")
-
-        if not auth_header.startswith("Bearer "):
-            return JSONResponse(
-                {"error": "Missing or invalid Authorization header"},
-                status_code=401,
-                headers={"WWW-Authenticate": 'Bearer realm="MCP Server"'}
-            )
-
-        token = auth_header.replace("Bearer ", "")
-        if token != "test-token-12345":
-            return JSONResponse(
-                {"error": "Invalid bearer token"},
-                status_code=401,
-                headers={"WWW-Authenticate": 'Bearer realm="MCP Server"'}
-            )
-
-        # Token is valid, proceed
-        response = await call_next(request)
-        return response
+from _bearer import BEARER_MIDDLEWARE
 
-
-# Create FastMCP server with middleware
-mcp = FastMCP(
-    "bearer-auth-server",
-    middleware=[Middleware(BearerAuthMiddleware)]
-)
+# Create FastMCP server (bearer auth is applied to its HTTP app when served)
+mcp = FastMCP("bearer-auth-server")
 
 
 # ============================================================================
@@ -137,6 +106,40 @@ async def analyze_sentiment(text: str, ctx: Context) -> str:
     return f"Sentiment (Bearer Auth): {sentiment.strip()}"
 
 
+@mcp.tool()
+async def analyze_sentiment_batch(texts: list[str], ctx: Context) -> str:
+    """Analyze sentiment of several texts with parallel sampling requests.
+
+    Args:
+        texts: Texts to analyze for sentiment
+    """
+    from mcp.types import SamplingMessage, TextContent
+
+    # Fan out one sampling request per text
+    results = await asyncio.gather(
+        *(
+            ctx.session.create_message(
+                messages=[
+                    SamplingMessage(
+                        role="user",
+                        content=TextContent(
+                            type="text",
+                            text=f"Analyze the sentiment of this text and respond with just one word (positive, negative, or neutral): {text}"
+                        )
+                    )
+                ],
+                max_tokens=10
+            )
+            for text in texts
+        )
+    )
+
+    return "\n".join(
+        f"{text}: {getattr(result.content, 'text', str(result.content)).strip()}"
+        for text, result in zip(texts, results)
+    )
+
+
 # ============================================================================
 # RESOURCES
 # ============================================================================
@@ -161,6 +164,7 @@ Authorization: Bearer test-token-12345
 - add(a: float, b: float) - Add two numbers
 - get_user_info() - Get authenticated user info
 - analyze_sentiment(text: str) - Analyze sentiment (requires sampling)
+- analyze_sentiment_batch(texts: list[str]) - Analyze several texts with parallel sampling
 
 ## Example
 
@@ -168,7 +172,7 @@ Authorization: Bearer test-token-12345
 from mcp2py import load
 
 server = load(
-    "http://localhost:8000/sse",
+    "http://localhost:8000/mcp",
     headers={"Authorization": "Bearer test-token-12345"}
 )
 
@@ -221,20 +225,41 @@ Be specific and constructive in your feedback."""
 # MAIN
 # ============================================================================
 
+# Startup banner ({port} is filled in at launch), written in one call
+BANNER = "\n".join([
+    "=" * 70,
+    "Bearer Token Authentication Server",
+    "=" * 70,
+    "",
+    "Server will run on: http://localhost:{port}",
+    "MCP endpoint: http://localhost:{port}/mcp",
+    "",
+    "Required token: test-token-12345",
+    "",
+    "Example usage:",
+    '  from mcp2py import load',
+    '  server = load("http://localhost:8000/mcp",',
+    '                headers={{"Authorization": "Bearer test-token-12345"}})',
+    '  print(server.echo(message="Hello!"))',
+    "=" * 70,
+    "",
+]) + "\n"
+
+
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Bearer Token Authentication Server")
-    print("=" * 70)
-    print("\nServer will run on: http://localhost:8000")
-    print("MCP endpoint: http://localhost:8000/sse")
-    print("\nRequired token: test-token-12345")
-    print("\nExample usage:")
-    print('  from mcp2py import load')
-    print('  server = load("http://localhost:8000/sse",')
-    print('                headers={"Authorization": "Bearer test-token-12345"})')
-    print('  print(server.echo(message="Hello!"))')
-    print("=" * 70)
-    print()
-
-    # Run with FastMCP's built-in method
-    mcp.run(transport="sse", host="0.0.0.0", port=8000)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+
+    sys.stdout.write(BANNER.format(port=port))
+    sys.stdout.flush()
+
+    # Same as mcp.run(), but on uvloop when it's installed
+    anyio.run(
+        partial(
+            mcp.run_async,
+            transport="http",
+            host="0.0.0.0",
+            port=port,
+            middleware=BEARER_MIDDLEWARE,
+        ),
+        backend_options={"use_uvloop": find_spec("uvloop") is not None},
+    )
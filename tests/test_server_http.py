@@ -3,64 +3,29 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "fastmcp>=2.12.4",
+#     "uvloop>=0.19.0; sys_platform != 'win32'",
 # ]
 # ///
 """Full-featured HTTP MCP test server WITH bearer token authentication.
 
-Same as test_server.py but runs on HTTP/SSE with bearer token auth.
+Same as test_server.py but runs on streamable HTTP with bearer token auth.
 Required token: test-token-12345
 """
 
+import sys
+from functools import partial
+from importlib.util import find_spec
+
+import anyio
 from fastmcp import FastMCP
 from fastmcp.server import Context
 from pydantic import BaseModel
-from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
-
-
-class BearerAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to check bearer token authentication."""
-
-    async def dispatch(self, request, call_next):
-        """Check for valid bearer token."""
-        # Skip auth for OPTIONS requests (CORS)
-        if request.method == "OPTIONS":
-            response = await call_next(request)
-            return response
-
-        # Check authentication
-        auth_header = request.headers.get("Authorization", "")
-
-        if not auth_header.startswith("Bearer "):
-            return JSONResponse(
-                {"error": "Missing or invalid Authorization header"},
-                status_code=401,
-                headers={"WWW-Authenticate": 'Bearer realm="MCP Server"'}
-            )
 
-        token = auth_header.replace("Bearer ", "")
-        if token != "test-token-12345":
-            return JSONResponse(
-                {"error": "Invalid bearer token"},
-                status_code=401,
-                headers={"WWW-Authenticate": 'Bearer realm="MCP Server"'}
-            )
-
-        # Token is valid - add to request state for downstream use
-        request.state.authenticated = True
-        request.state.token = token
+from _bearer import BEARER_MIDDLEWARE
 
-        # Proceed with request
-        response = await call_next(request)
-        return response
 
-
-# Create FastMCP server with bearer auth middleware
-mcp = FastMCP(
-    "test-server-http-auth",
-    middleware=[Middleware(BearerAuthMiddleware)]
-)
+# Create FastMCP server (bearer auth is applied to its HTTP app when served)
+mcp = FastMCP("test-server-http-auth")
 
 
 # ============================================================================
@@ -247,7 +212,7 @@ def get_stats() -> str:
         "tools_called": 0,
         "last_call": None,
         "timestamp": time.time(),
-        "transport": "http-sse"
+        "transport": "http"
     }, indent=2)
 
 
@@ -330,24 +295,44 @@ Provide a clear, concise explanation suitable for a developer new to MCP."""
 # MAIN
 # ============================================================================
 
+# Startup banner, written in one call
+BANNER = "\n".join([
+    "=" * 70,
+    "Full HTTP MCP Test Server WITH BEARER AUTH",
+    "=" * 70,
+    "",
+    "Server will run on: http://localhost:8000",
+    "MCP endpoint: http://localhost:8000/mcp",
+    "",
+    "Required token: test-token-12345",
+    "",
+    "Example usage:",
+    '  from mcp2py import load',
+    '  server = load("http://localhost:8000/mcp",',
+    '                headers={"Authorization": "Bearer test-token-12345"})',
+    '  print(server.echo(message="Hello!"))',
+    '  print(server.get_version())  # Resource',
+    '  print(server.explain_mcp())  # Prompt',
+    "",
+    "Or use the auth parameter:",
+    '  server = load("http://localhost:8000/mcp", auth="test-token-12345")',
+    "=" * 70,
+    "",
+]) + "\n"
+
+
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Full HTTP MCP Test Server WITH BEARER AUTH")
-    print("=" * 70)
-    print("\nServer will run on: http://localhost:8000")
-    print("MCP endpoint: http://localhost:8000/sse")
-    print("\nRequired token: test-token-12345")
-    print("\nExample usage:")
-    print('  from mcp2py import load')
-    print('  server = load("http://localhost:8000/sse",')
-    print('                headers={"Authorization": "Bearer test-token-12345"})')
-    print('  print(server.echo(message="Hello!"))')
-    print('  print(server.get_version())  # Resource')
-    print('  print(server.explain_mcp())  # Prompt')
-    print("\nOr use the auth parameter:")
-    print('  server = load("http://localhost:8000/sse", auth="test-token-12345")')
-    print("=" * 70)
-    print()
-
-    # Run with FastMCP's built-in method
-    mcp.run(transport="sse", host="0.0.0.0", port=8000)
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+
+    # Same as mcp.run(), but on uvloop when it's installed
+    anyio.run(
+        partial(
+            mcp.run_async,
+            transport="http",
+            host="0.0.0.0",
+            port=8000,
+            middleware=BEARER_MIDDLEWARE,
+        ),
+        backend_options={"use_uvloop": find_spec("uvloop") is not None},
+    )
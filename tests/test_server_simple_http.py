@@ -10,13 +10,15 @@
 For testing HTTP transport without auth complications.
 
 Example usage:
-    python tests/test_server_simple_http.py
+    python tests/test_server_simple_http.py [port]   # default port 8000
 
 Then connect with:
     from mcp2py import load
-    server = load("http://localhost:8000/sse")
+    server = load("http://localhost:8000/mcp")
 """
 
+import sys
+
 from fastmcp import FastMCP
 
 # Create FastMCP server WITHOUT middleware
@@ -51,18 +53,29 @@ def get_test() -> str:
     return "Test resource content"
 
 
+# Startup banner ({port} is filled in at launch), written in one call
+BANNER = "\n".join([
+    "=" * 70,
+    "Simple HTTP MCP Server (NO AUTH)",
+    "=" * 70,
+    "",
+    "Server will run on: http://localhost:{port}",
+    "MCP endpoint: http://localhost:{port}/mcp",
+    "",
+    "Example usage:",
+    '  from mcp2py import load',
+    '  server = load("http://localhost:8000/mcp")',
+    '  print(server.echo(message="Hello!"))',
+    "=" * 70,
+    "",
+]) + "\n"
+
+
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Simple HTTP MCP Server (NO AUTH)")
-    print("=" * 70)
-    print("\nServer will run on: http://localhost:8000")
-    print("MCP endpoint: http://localhost:8000/sse")
-    print("\nExample usage:")
-    print('  from mcp2py import load')
-    print('  server = load("http://localhost:8000/sse")')
-    print('  print(server.echo(message="Hello!"))')
-    print("=" * 70)
-    print()
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+
+    sys.stdout.write(BANNER.format(port=port))
+    sys.stdout.flush()
 
     # Run with FastMCP's built-in method
-    mcp.run(transport="sse", host="0.0.0.0", port=8000)
+    mcp.run(transport="http", host="0.0.0.0", port=port)
@@ -3,6 +3,8 @@
 from pathlib import Path
 import tempfile
 
+import pytest
+
 from mcp2py.stubs import generate_stub, get_stub_cache_path, save_stub
 
 
@@ -225,3 +227,155 @@ def test_create_typed_server_class():
 
     # Check annotations
     assert sig.parameters["message"].annotation == str
+
+
+def test_typed_server_class_is_cached_per_schema():
+    """Test that identical schemas reuse one typed class."""
+    from mcp2py.stubs import create_typed_server_class
+
+    class MockServer:
+        pass
+
+    tools = [{"name": "echo", "description": "Echo", "inputSchema": {"type": "object"}}]
+    reordered = [{"inputSchema": {"type": "object"}, "description": "Echo", "name": "echo"}]
+    changed = [{"name": "echo", "description": "Echo v2", "inputSchema": {"type": "object"}}]
+
+    first = create_typed_server_class(MockServer, tools, [], [])
+    assert create_typed_server_class(MockServer, reordered, [], []) is first
+    assert create_typed_server_class(MockServer, changed, [], []) is not first
+
+
+def test_generate_stub_is_cached_per_schema():
+    """Test that identical schemas reuse the generated stub text."""
+    tools = [{"name": "echo", "description": "Echo", "inputSchema": {"type": "object"}}]
+
+    first = generate_stub(tools, [], [])
+    assert generate_stub([dict(tools[0])], [], []) is first
+    assert generate_stub(tools, [], [], class_name="Other") is not first
+
+
+def test_save_stub_skips_unchanged_content():
+    """Test that saving identical content leaves the file untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stub_path = Path(tmpdir) / "nested" / "test.pyi"
+        save_stub("class A: ...\n", stub_path)
+        mtime = stub_path.stat().st_mtime_ns
+
+        save_stub("class A: ...\n", stub_path)
+        assert stub_path.stat().st_mtime_ns == mtime
+
+        save_stub("class B: ...\n", stub_path)
+        assert stub_path.read_text() == "class B: ...\n"
+
+
+def test_typed_method_stub_forwards_arguments():
+    """Test that stubs merge positional args and defaults into kwargs."""
+    from mcp2py.stubs import create_typed_server_class
+
+    calls = []
+
+    class MockServer:
+        def __getattr__(self, name):
+            return lambda **kwargs: calls.append((name, kwargs))
+
+    tools = [
+        {
+            "name": "search",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer", "default": 10},
+                },
+                "required": ["query"],
+            },
+        }
+    ]
+    server = create_typed_server_class(MockServer, tools, [], [])()
+
+    server.search("cats")
+    server.search(query="dogs", limit=3)
+    assert calls == [
+        ("search", {"query": "cats", "limit": 10}),
+        ("search", {"query": "dogs", "limit": 3}),
+    ]
+
+    with pytest.raises(TypeError, match="query"):
+        server.search(limit=1)
+    with pytest.raises(TypeError, match="unexpected"):
+        server.search("cats", bogus=1)
+    with pytest.raises(TypeError, match="multiple values"):
+        server.search("cats", query="dogs")
+    with pytest.raises(TypeError, match="too many"):
+        server.search("cats", 1, 2)
+
+
+def test_save_stub_leaves_no_temp_files():
+    """Test that stubs are written via a temp file that gets renamed away."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stub_path = Path(tmpdir) / "test.pyi"
+        save_stub("class A: ...\n", stub_path)
+        save_stub("class B: ...\n", stub_path)
+
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["test.pyi"]
+        assert stub_path.read_text() == "class B: ...\n"
+
+
+def test_typed_method_stub_resolves_implementation_once():
+    """Test that stubs reuse the callable __getattr__ returned first time."""
+    from mcp2py.stubs import create_typed_server_class
+
+    lookups = []
+
+    class MockServer:
+        def __getattr__(self, name):
+            lookups.append(name)
+            return lambda **kwargs: kwargs
+
+    tools = [{"name": "ping", "inputSchema": {"type": "object", "properties": {}}}]
+    TypedClass = create_typed_server_class(MockServer, tools, [], [])
+    first, second = TypedClass(), TypedClass()
+
+    assert first.ping() == {} and first.ping() == {}
+    second.ping()
+    assert lookups == ["ping", "ping"]
+
+
+def test_load_stub_if_fresh_checks_schema_manifest():
+    """Test that cached stubs are only reused for the schemas they came from."""
+    from mcp2py.stubs import load_stub_if_fresh, stub_schema_hash
+
+    tools = [{"name": "echo", "inputSchema": {"type": "object"}}]
+    digest = stub_schema_hash(tools, [], [])
+    assert digest != stub_schema_hash([], [], [])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stub_path = Path(tmpdir) / "server.pyi"
+        assert load_stub_if_fresh(stub_path, digest) is None
+
+        save_stub("class A: ...\n", stub_path)
+        assert load_stub_if_fresh(stub_path, digest) is None
+
+        save_stub("class A: ...\n", stub_path, digest)
+        assert load_stub_if_fresh(stub_path, digest) == "class A: ...\n"
+        assert load_stub_if_fresh(stub_path, stub_schema_hash([], [], [])) is None
+
+
+def test_typed_resource_attributes_delegate_to_getattr():
+    """Test that resource attributes fetch through __getattr__ and are read-only."""
+    import inspect
+
+    from mcp2py.stubs import create_typed_server_class
+
+    class MockServer:
+        def __getattr__(self, name):
+            return f"contents of {name}"
+
+    resources = [{"name": "app-config", "description": "App configuration"}]
+    TypedClass = create_typed_server_class(MockServer, [], resources, [])
+    server = TypedClass()
+
+    assert server.app_config == "contents of app_config"
+    assert inspect.getdoc(TypedClass.app_config) == "App configuration"
+    with pytest.raises(AttributeError):
+        server.app_config = "new"
@@ -1,60 +1,37 @@
 """Tests for .tools attribute for libraries like Claudette and DSPy."""
 
-import sys
-from pathlib import Path
 
-from mcp2py import load
-
-
-def test_tools_returns_list_of_callables():
+def test_tools_returns_list_of_callables(stdio_server):
     """Test that .tools returns a list of callable functions."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     assert isinstance(tools, list)
     assert len(tools) >= 2  # at least echo and add
     assert all(callable(t) for t in tools)
 
-    server.close()
-
 
-def test_tools_have_names():
+def test_tools_have_names(stdio_server):
     """Test that each tool function has __name__ attribute."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     names = [t.__name__ for t in tools]
     assert "echo" in names
     assert "add" in names
 
-    server.close()
-
 
-def test_tools_have_docstrings():
+def test_tools_have_docstrings(stdio_server):
     """Test that each tool function has __doc__ attribute."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     for tool in tools:
         assert hasattr(tool, "__doc__")
         assert isinstance(tool.__doc__, str)
         assert len(tool.__doc__) > 0
 
-    server.close()
-
 
-def test_tools_are_callable():
+def test_tools_are_callable(stdio_server):
     """Test that tools can actually be called."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     # Find echo tool
     echo = next(t for t in tools if t.__name__ == "echo")
@@ -66,15 +43,10 @@ def test_tools_are_callable():
     result = add(a=2, b=3)
     assert "5" in result
 
-    server.close()
-
 
-def test_tools_compatible_with_claudette():
+def test_tools_compatible_with_claudette(stdio_server):
     """Test that tools work with Claudette-style usage."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     # Claudette expects list of callables with __name__ and __doc__
     for tool in tools:
@@ -83,15 +55,10 @@ def test_tools_compatible_with_claudette():
         assert hasattr(tool, "__doc__")
         assert isinstance(tool.__name__, str)
 
-    server.close()
-
 
-def test_tools_compatible_with_dspy():
+def test_tools_compatible_with_dspy(stdio_server):
     """Test that tools work with DSPy-style usage."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     # DSPy expects callable functions
     for tool in tools:
@@ -99,28 +66,18 @@ def test_tools_compatible_with_dspy():
         # DSPy can inspect the function
         assert hasattr(tool, "__name__")
 
-    server.close()
 
-
-def test_tools_is_property_not_method():
+def test_tools_is_property_not_method(stdio_server):
     """Test that .tools is a property, not a method."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
     # Should be accessible as property (no parentheses)
-    tools = server.tools
+    tools = stdio_server.tools
     assert isinstance(tools, list)
 
-    server.close()
-
 
-def test_tools_returns_new_list_each_time():
+def test_tools_returns_new_list_each_time(stdio_server):
     """Test that .tools returns a new list each time."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools1 = server.tools
-    tools2 = server.tools
+    tools1 = stdio_server.tools
+    tools2 = stdio_server.tools
 
     # Should be different list objects
     assert tools1 is not tools2
@@ -128,15 +85,10 @@ def test_tools_returns_new_list_each_time():
     # But same number of tools
     assert len(tools1) == len(tools2)
 
-    server.close()
-
 
-def test_tools_preserve_snake_case_names():
+def test_tools_preserve_snake_case_names(stdio_server):
     """Test that tool names are in snake_case."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     names = [t.__name__ for t in tools]
 
@@ -144,19 +96,58 @@ def test_tools_preserve_snake_case_names():
     for name in names:
         assert name.islower()
 
-    server.close()
-
 
-def test_tools_with_empty_server():
+def test_tools_with_empty_server(stdio_server):
     """Test .tools with various server configurations."""
-    test_server = Path(__file__).parent / "test_server.py"
-    server = load([sys.executable, str(test_server)])
-
-    tools = server.tools
+    tools = stdio_server.tools
 
     # Should always return a list
     assert isinstance(tools, list)
     # Our test server has tools
     assert len(tools) > 0
 
+
+def test_tools_reuses_functions_until_refresh(fake_server):
+    """Test that .tools builds its functions once and refresh_tools rebuilds them."""
+    first = fake_server.tools
+    assert [a is b for a, b in zip(first, fake_server.tools)] == [True] * len(first)
+
+    fake_server.refresh_tools()
+    refreshed = fake_server.tools
+    assert [t.__name__ for t in refreshed] == [t.__name__ for t in first]
+    assert refreshed[0] is not first[0]
+
+
+def test_refresh_tools_bypasses_cached_listing(fake_server, monkeypatch):
+    """Test that refresh_tools asks clients with a listing cache to re-fetch."""
+    calls = []
+    tools = fake_server._client._tools
+
+    async def list_tools(force=False):
+        calls.append(force)
+        return tools
+
+    monkeypatch.setattr(fake_server._client, "list_tools", list_tools)
+    fake_server.refresh_tools()
+    assert calls == [True]
+
+
+def test_refresh_tools_clears_resolved_stub_methods(fake_server):
+    """Test that typed stubs look their tool up again after refresh_tools."""
+    from mcp2py.event_loop import get_shared_runner
+    from mcp2py.server import MCPServer
+    from mcp2py.stubs import create_typed_server_class
+
+    tools = list(fake_server._tools.values())
+    TypedServer = create_typed_server_class(MCPServer, tools, [], [])
+    server = TypedServer(
+        fake_server._client, get_shared_runner(), tools, [], [], owns_runner=False
+    )
+
+    assert "echo" in server.echo(message="hi")
+    assert "_mcp_bound_echo" in server.__dict__
+
+    server.refresh_tools()
+    assert "_mcp_bound_echo" not in server.__dict__
+    assert "echo" in server.echo(message="hi")
     server.close()